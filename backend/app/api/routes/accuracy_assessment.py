@@ -1,8 +1,13 @@
-from fastapi import APIRouter, HTTPException, Depends
-from typing import Dict, Any
+from fastapi import APIRouter, HTTPException, Depends, Request
+from fastapi.responses import StreamingResponse
+from typing import Dict, Any, Optional
 from pydantic import BaseModel
+import json
 
+from app.core.config import settings
 from app.services.accuracy_assessment_service import accuracy_assessment_service
+from app.services.accuracy_batch import iter_batch, parse_items, score_batch_async
+from app.utils.alignment import MIN_CHUNK_SIZE
 
 router = APIRouter()
 
@@ -10,6 +15,13 @@ class AccuracyAssessmentRequest(BaseModel):
     enhanced_transcript: str
     tested_transcript: str
     detailed_diff: bool = False
+    diff_mode: str = "character"  # character | word
+
+class WordDiffRequest(BaseModel):
+    enhanced_transcript: str
+    tested_transcript: str
+    chunk_words: int = 2000
+    collapse_context: Optional[int] = 5  # None returns equal runs in full
 
 @router.post("/assess-accuracy", response_model=Dict[str, Any])
 async def assess_accuracy(request: AccuracyAssessmentRequest):
@@ -19,7 +31,8 @@ async def assess_accuracy(request: AccuracyAssessmentRequest):
     Args:
         enhanced_transcript: The transcript from the enhanced pipeline
         tested_transcript: The verified/corrected transcript from tester
-        detailed_diff: Whether to include detailed character-level differences
+        detailed_diff: Whether to include detailed differences
+        diff_mode: "character" (semantic character diff) or "word" (chunked word diff)
         
     Returns:
         Dictionary containing accuracy metrics and optionally detailed differences
@@ -34,7 +47,14 @@ async def assess_accuracy(request: AccuracyAssessmentRequest):
         result = {"metrics": metrics}
         
         # Add detailed differences if requested
-        if request.detailed_diff:
+        if request.detailed_diff and request.diff_mode == "word":
+            result["differences"] = [
+                event for event in accuracy_assessment_service.iter_word_differences(
+                    request.enhanced_transcript, request.tested_transcript
+                )
+                if event["type"] != "summary"
+            ]
+        elif request.detailed_diff:
             differences = accuracy_assessment_service.get_detailed_differences(
                 enhanced=request.enhanced_transcript,
                 tested=request.tested_transcript
@@ -46,4 +66,65 @@ async def assess_accuracy(request: AccuracyAssessmentRequest):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error assessing accuracy: {str(e)}")
 
+@router.post("/assess-accuracy/diff")
+async def stream_word_diff(request: WordDiffRequest):
+    """
+    Stream a word-level diff of two transcripts as NDJSON, one event per line.
+    
+    The alignment is computed in chunks of chunk_words, so the first lines arrive
+    right away even for hour-long transcripts. Long equal runs are collapsed to
+    collapse_context words on each side; the last line is a "summary" event.
+    """
+    if request.chunk_words < MIN_CHUNK_SIZE:
+        raise HTTPException(status_code=400, detail=f"chunk_words must be at least {MIN_CHUNK_SIZE}")
+    
+    def lines():
+        for event in accuracy_assessment_service.iter_word_differences(
+            request.enhanced_transcript,
+            request.tested_transcript,
+            chunk_words=request.chunk_words,
+            collapse_context=request.collapse_context
+        ):
+            yield json.dumps(event, ensure_ascii=False) + "\n"
+    
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+@router.post("/assess-accuracy/batch", response_model=Dict[str, Any])
+async def assess_accuracy_batch(request: Request, stream: bool = False):
+    """
+    Assess many transcript pairs at once, scored in a process pool.
+    
+    Body: a JSON list of pairs, {"items": [...]}, or JSONL (Content-Type
+    application/x-ndjson), each pair being {id?, enhanced_transcript, tested_transcript}.
+    
+    Returns per-item metrics and corpus-level WER/CER micro and macro averages.
+    With stream=true the response is NDJSON: "item" and "progress" events as
+    chunks finish, then a final "summary" event.
+    """
+    body = await request.body()
+    content_type = request.headers.get("content-type", "")
+    try:
+        if "ndjson" in content_type or "jsonl" in content_type:
+            items = parse_items(body)
+        else:
+            items = parse_items(json.loads(body))
+    except (ValueError, UnicodeDecodeError) as e:
+        raise HTTPException(status_code=400, detail=f"Invalid batch: {str(e)}")
+    if len(items) > settings.ACCURACY_BATCH_MAX_ITEMS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Too many items ({len(items)}). Maximum is {settings.ACCURACY_BATCH_MAX_ITEMS}"
+        )
+    
+    if stream:
+        async def events():
+            async for event in iter_batch(items):
+                yield json.dumps(event, ensure_ascii=False) + "\n"
+        return StreamingResponse(events(), media_type="application/x-ndjson")
+    
+    try:
+        return await score_batch_async(items)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error assessing accuracy batch: {str(e)}")
+
 # Add this router to your main FastAPI app in app/main.py
@@ -3,8 +3,13 @@ from fastapi.responses import JSONResponse
 import os
 import tempfile
 from typing import Dict
+from app.core import telemetry
+from app.core.config import settings
 from app.services.enhanced_transcription_service import enhanced_transcription_service
 from app.schemas.dual_pipeline import EnhancedTranscriptionResponse
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
 
 router = APIRouter(prefix="/api/v1/enhanced-transcription", tags=["Enhanced Transcription"])
 
@@ -12,7 +17,9 @@ router = APIRouter(prefix="/api/v1/enhanced-transcription", tags=["Enhanced Tran
 @router.post("/process", response_model=EnhancedTranscriptionResponse)
 async def process_enhanced_transcription(
     file: UploadFile = File(...),
-    export_srt: bool = False
+    export_srt: bool = False,
+    include_transliteration: bool = True,
+    include_timings: bool = settings.INCLUDE_STAGE_TIMINGS
 ):
     """
     Process audio through enhanced transcription pipeline:
@@ -20,6 +27,7 @@ async def process_enhanced_transcription(
     - Sarvam API for Tamil accuracy (uses prepared WAV)
     - Dynamic Tamil phrase detection with improved matching
     - Whisper disabled for faster processing
+    include_timings adds the seconds spent per stage as processing_info.timings.
     """
     try:
         # Validate file
@@ -39,25 +47,30 @@ async def process_enhanced_transcription(
             temp_file.write(content)
             temp_file.close()
             
-            print(f"📁 Processing file: {file.filename} ({file_size} bytes)")
-            print(f"📁 File format: {os.path.splitext(file.filename)[1]}")
-            
-            # Process through enhanced transcription pipeline
-            result = await enhanced_transcription_service.process_enhanced_transcription(temp_file.name)
+            logger.info("📁 Processing file: %s (%s bytes)", file.filename, file_size)
+            logger.info("📁 File format: %s", os.path.splitext(file.filename)[1])
             
-            if not result["success"]:
-                raise HTTPException(status_code=500, detail=f"Processing failed: {result.get('error', 'Unknown error')}")
+            with telemetry.collect_timings() as timings:
+                # Process through enhanced transcription pipeline
+                result = await enhanced_transcription_service.process_enhanced_transcription(
+                    temp_file.name, include_transliteration=include_transliteration
+                )
+                
+                if not result["success"]:
+                    raise HTTPException(status_code=500, detail=f"Processing failed: {result.get('error', 'Unknown error')}")
 
-            # Store in Supabase DB
-            await enhanced_transcription_service.store_transcription_in_db({
-                "filename": file.filename,
-                "final_transcript": result["final_transcript"],
-                "elevenlabs_transcript": result["elevenlabs_transcript"],
-                "transliterated_elevenlabs": result["transliterated_elevenlabs"],
-                "sarvam_transcript": result["sarvam_transcript"],
-                "sarvam_diarized_transcript": result["sarvam_diarized_transcript"],
-                "processing_info": result["processing_info"]
-            })
+                # Store in Supabase DB
+                await enhanced_transcription_service.store_transcription_in_db({
+                    "filename": file.filename,
+                    "final_transcript": result["final_transcript"],
+                    "elevenlabs_transcript": result["elevenlabs_transcript"],
+                    "transliterated_elevenlabs": result["transliterated_elevenlabs"],
+                    "sarvam_transcript": result["sarvam_transcript"],
+                    "sarvam_diarized_transcript": result["sarvam_diarized_transcript"],
+                    "processing_info": result["processing_info"]
+                })
+            if include_timings:
+                result["processing_info"]["timings"] = timings
             
             # Export to SRT if requested
             if export_srt and result["final_transcript"]:
@@ -79,7 +92,7 @@ async def process_enhanced_transcription(
     except HTTPException:
         raise
     except Exception as e:
-        print(f"❌ Enhanced transcription API error: {e}")
+        logger.error("❌ Enhanced transcription API error: %s", e)
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
 
@@ -3,8 +3,10 @@ import os
 import time
 import aiofiles
 from pathlib import Path
+from typing import List, Optional
 from app.services.sarvam_batch_service import SarvamBatchService
 
+from app.core import telemetry
 from app.core.config import settings
 from app.services.sarvam_service import sarvam_service
 from app.services.audio_service import audio_service
@@ -14,6 +16,9 @@ from app.schemas.transcription import ProcessFileResponse
 from app.schemas.dual_pipeline import DualPipelineResponse
 from app.utils.audio_utils import preprocess_audio
 import soundfile as sf
+from app.core.logging import Truncated, get_logger
+
+logger = get_logger(__name__)
 
 router = APIRouter()
 
@@ -48,7 +53,8 @@ async def save_uploaded_file(file: UploadFile) -> str:
 @router.post("/transcribe", response_model=ProcessFileResponse)
 async def transcribe_and_translate_file(
     file: UploadFile = File(...),
-    diarization: bool = Query(False, description="Enable speaker diarization if supported")
+    diarization: bool = Query(False, description="Enable speaker diarization if supported"),
+    include_timings: bool = Query(settings.INCLUDE_STAGE_TIMINGS, description="Include seconds spent per stage")
 ):
     """
     Main endpoint to transcribe and translate uploaded audio/video files
@@ -61,24 +67,25 @@ async def transcribe_and_translate_file(
         file_path = await save_uploaded_file(file)
         temp_files.append(file_path)
         
-        # Validate and prepare audio
-        audio_path, file_type = await audio_service.validate_and_prepare_audio(file_path)
-        if audio_path != file_path:
-            temp_files.append(audio_path)
-        
-        # Transcribe audio using Sarvam AI
-        transcription_result = await sarvam_service.transcribe_audio(
-            audio_path, 
-            language_code="ta-IN",
-            with_diarization=diarization
-        )
-        
-        # Translate transcribed text
-        translation_result = await sarvam_service.translate_text(
-            transcription_result.transcription,
-            source_lang="ta-IN",
-            target_lang="en-IN"
-        )
+        with telemetry.collect_timings() as timings:
+            # Validate and prepare audio
+            audio_path, _, file_type = await audio_service.validate_and_prepare_audio(file_path)
+            if audio_path != file_path:
+                temp_files.append(audio_path)
+            
+            # Transcribe audio using Sarvam AI
+            transcription_result = await sarvam_service.transcribe_audio(
+                audio_path, 
+                language_code="ta-IN",
+                with_diarization=diarization
+            )
+            
+            # Translate transcribed text
+            translation_result = await sarvam_service.translate_text(
+                transcription_result.transcription,
+                source_lang="ta-IN",
+                target_lang="en-IN"
+            )
         
         processing_time = time.time() - start_time
         
@@ -88,7 +95,8 @@ async def transcribe_and_translate_file(
             translation=translation_result.translated_text,
             processing_time=processing_time,
             file_type=file_type,
-            diarized_transcript=transcription_result.diarized_transcript
+            diarized_transcript=transcription_result.diarized_transcript,
+            timings=timings if include_timings else None
         )
         
     except Exception as e:
@@ -123,14 +131,15 @@ async def batch_transcribe_file(file: UploadFile = File(...), language_code: str
     # Print duration of preprocessed audio only if it's a .wav file
     if processed_path.lower().endswith('.wav'):
         y, sr = sf.read(processed_path)
-        print(f"[batch_transcribe_file] Preprocessed audio duration: {len(y)/sr:.2f}s")
+        logger.debug("[batch_transcribe_file] Preprocessed audio duration: %.2fs", len(y) / sr)
     else:
-        print(f"[batch_transcribe_file] Skipping duration logging for non-wav file: {processed_path}")
+        logger.debug("[batch_transcribe_file] Skipping duration logging for non-wav file: %s", processed_path)
     # Start batch process
     # Log the raw response from Sarvam
-    print(f"[batch_transcribe_file] Calling Sarvam batch_transcribe with: {processed_path}, language_code={language_code}, diarization={diarization}")
+    logger.info("[batch_transcribe_file] Calling Sarvam batch_transcribe with: %s, language_code=%s, diarization=%s",
+                processed_path, language_code, diarization)
     response = await sarvam_batch.batch_transcribe(processed_path, language_code=language_code, diarization=diarization)
-    print(f"[batch_transcribe_file] Raw Sarvam response: {response}")
+    logger.debug("[batch_transcribe_file] Raw Sarvam response: %s", Truncated(response))
     # Unpack response as before
     if isinstance(response, tuple) and len(response) == 2:
         transcript, diarized_transcript = response
@@ -143,7 +152,7 @@ async def batch_transcribe_file(file: UploadFile = File(...), language_code: str
             try:
                 os.unlink(path)
             except Exception as e:
-                print(f"Failed to delete {path}: {e}")
+                logger.warning("⚠️ Failed to delete %s: %s", path, e)
     return {
         "transcript": transcript,
         "diarized_transcript": diarized_transcript
@@ -198,10 +207,28 @@ async def health_check():
     return {"status": "healthy", "service": "Tamil Transcriptor API"} 
 
 @router.get("/qc/queue")
-async def get_qc_queue():
-    """Get all pending QC cases"""
+async def get_qc_queue(
+    status: Optional[List[str]] = Query(None, description="Statuses to list (repeatable); default pending and audio_validated"),
+    since: Optional[str] = Query(None, description="Only cases queued at or after this ISO 8601 date/datetime"),
+    until: Optional[str] = Query(None, description="Only cases queued before this ISO 8601 date/datetime"),
+    min_similarity: Optional[float] = Query(None, ge=0.0, le=1.0),
+    max_similarity: Optional[float] = Query(None, ge=0.0, le=1.0),
+    limit: Optional[int] = Query(None, ge=1, description="Page size, capped at QC_QUEUE_MAX_PAGE_SIZE"),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page")
+):
+    """
+    Get a page of QC case summaries, oldest first. Summaries leave out the
+    transcripts and diarization; fetch GET /qc/case/{qc_case_id} for the full case.
+    """
+    try:
+        page = qc_service.get_qc_queue(
+            statuses=status, limit=limit, cursor=cursor, since=since, until=until,
+            min_similarity=min_similarity, max_similarity=max_similarity
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     return {
-        "qc_cases": qc_service.get_qc_queue(),
+        **page,
         "stats": qc_service.get_qc_stats()
     }
 
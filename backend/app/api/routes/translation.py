@@ -63,7 +63,7 @@ async def translate(request: TranslationRequest):
         
         logging.warning(f"SarvamAI response: {response}")
         # Improved translation using Sarvam LLM chat completion
-        improved_translation = get_more_accurate_translation(request.text, response.translated_text)
+        improved_translation = await get_more_accurate_translation(request.text, response.translated_text)
         # Paraphrase the improved translation
         improved_paraphrased_text = None
         try:
@@ -1,6 +1,15 @@
 import os
 from pydantic_settings import BaseSettings
 
+# Relative file paths in the settings are resolved against the backend directory, not the process CWD
+BACKEND_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "../.."))
+
+
+def backend_path(path: str) -> str:
+    """Absolute path for a settings path (absolute paths are returned unchanged)"""
+    return os.path.join(BACKEND_DIR, path)
+
+
 class Settings(BaseSettings):
     # Sarvam AI Configuration
     SARVAM_API_KEY: str = os.getenv("SARVAM_API_KEY", "")
@@ -8,6 +17,7 @@ class Settings(BaseSettings):
     
     # ElevenLabs Configuration
     ELEVENLABS_API_KEY: str = os.getenv("ELEVENLABS_API_KEY", "")
+    ELEVENLABS_BASE_URL: str = "https://api.elevenlabs.io/v1"
     
     # Alternative Translation APIs
     OPENAI_API_KEY: str = os.getenv("OPENAI_API_KEY", "")
@@ -24,6 +34,85 @@ class Settings(BaseSettings):
     UPLOAD_DIR: str = "uploads"
     ALLOWED_EXTENSIONS: list = [".mp3", ".wav", ".mp4", ".avi", ".mov", ".mkv"]
     
+    # Upload Encoding Settings (flac | opus | mp3 | wav)
+    UPLOAD_AUDIO_FORMAT: str = os.getenv("UPLOAD_AUDIO_FORMAT", "flac")
+    UPLOAD_AUDIO_BITRATE: str = os.getenv("UPLOAD_AUDIO_BITRATE", "32k")  # lossy formats only
+    UPLOAD_ENCODING_CACHE_SIZE: int = 32  # encoded files kept in the temp dir, least recently used deleted first
+    # Per-provider overrides, empty means UPLOAD_AUDIO_FORMAT
+    ELEVENLABS_UPLOAD_FORMAT: str = os.getenv("ELEVENLABS_UPLOAD_FORMAT", "")
+    SARVAM_UPLOAD_FORMAT: str = os.getenv("SARVAM_UPLOAD_FORMAT", "")
+    SARVAM_BATCH_UPLOAD_FORMAT: str = os.getenv("SARVAM_BATCH_UPLOAD_FORMAT", "")
+    
+    # Blob Storage Transfer Settings (Sarvam batch input/output storage)
+    BLOB_UPLOAD_BLOCK_SIZE: int = 4 * 1024 * 1024  # 4MB blocks
+    BLOB_MAX_CONCURRENCY: int = 4  # parallel block uploads per file
+    
+    # Sarvam Batch Debugging: keep raw job outputs under downloads/<job_id>/
+    SARVAM_PERSIST_RAW_OUTPUTS: bool = os.getenv("SARVAM_PERSIST_RAW_OUTPUTS", "false").lower() == "true"
+    SARVAM_RAW_OUTPUT_DIR: str = "downloads"
+    
+    # Sarvam Batch Job Settings
+    SARVAM_BATCH_SETTLE_SECONDS: float = 5.0  # wait after upload before starting the job
+    SARVAM_BATCH_POLL_SECONDS: float = 10.0  # interval between job status checks
+    
+    # whisper.cpp Server Settings (paths are relative to the backend directory)
+    WHISPER_SERVER_BINARY: str = os.getenv("WHISPER_SERVER_BINARY", "whisper.cpp/build/bin/whisper-server")
+    WHISPER_MODEL_PATH: str = os.getenv("WHISPER_MODEL_PATH", "whisper.cpp/models/ggml-base.bin")
+    WHISPER_SERVER_HOST: str = "127.0.0.1"
+    WHISPER_SERVER_PORT: int = 8178
+    WHISPER_SERVER_URL: str = os.getenv("WHISPER_SERVER_URL", "")  # use an externally managed server
+    WHISPER_SERVER_THREADS: int = 4
+    WHISPER_SERVER_STARTUP_TIMEOUT: float = 120.0  # seconds to wait for the model to load
+    WHISPER_REQUEST_TIMEOUT: float = 600.0
+    WHISPER_SERVER_MAX_CONNECTIONS: int = 4
+    WHISPER_SERVER_PRELOAD: bool = False  # start the server at app startup instead of first use
+    
+    # Sarvam Chat Gateway Settings
+    SARVAM_CHAT_MODEL: str = "sarvam-m"
+    SARVAM_CHAT_CONCURRENCY: int = 8  # chat calls in flight across the whole app
+    SARVAM_CHAT_TIMEOUT: float = 120.0  # seconds per call
+    SARVAM_CHAT_MAX_RETRIES: int = 3
+    SARVAM_CHAT_BACKOFF_SECONDS: float = 1.0  # doubled on every retry
+    
+    # LLM Response Cache Settings (on-disk, deterministic low-temperature calls only)
+    LLM_CACHE_ENABLED: bool = True
+    LLM_CACHE_PATH: str = "cache/llm_cache.sqlite3"  # relative to the backend directory
+    LLM_CACHE_TTL_SECONDS: int = 30 * 24 * 3600  # 30 days
+    LLM_CACHE_MAX_BYTES: int = 256 * 1024 * 1024  # 256MB
+    LLM_CACHE_MAX_TEMPERATURE: float = 0.3
+    
+    # QC Store Settings (SQLite, relative to the backend directory; import legacy qc_queue/*.json
+    # with `python -m app.services.qc_store migrate qc_queue`)
+    QC_DB_PATH: str = "qc_queue/qc_cases.sqlite3"
+    QC_QUEUE_PAGE_SIZE: int = 50  # cases per GET /qc/queue page unless ?limit= is given
+    QC_QUEUE_MAX_PAGE_SIZE: int = 200
+    
+    # Transliteration Settings (Thanglish -> Tamil script)
+    TRANSLITERATION_CACHE_SIZE: int = 50000  # distinct words kept in the LRU
+    
+    # LLM Merge Settings (Sarvam Chat merge of ElevenLabs + Sarvam transcripts)
+    LLM_MERGE_MODE: str = "windowed"  # windowed | single
+    LLM_MERGE_WINDOW_SECONDS: float = 90.0
+    LLM_MERGE_WINDOW_OVERLAP_SECONDS: float = 10.0  # context shared with each neighbouring window
+    LLM_MERGE_CONCURRENCY: int = 4  # chat calls in flight per merge
+    LLM_MERGE_AGREEMENT_THRESHOLD: float = 0.92  # word similarity above which Sarvam is used as-is (>1 disables)
+    
+    # Accuracy Batch Scoring Settings
+    ACCURACY_BATCH_WORKERS: int = 0  # scoring processes, 0 = one per CPU
+    ACCURACY_BATCH_CHUNK_SIZE: int = 16  # pairs per pool task (one progress event each)
+    ACCURACY_BATCH_MAX_ITEMS: int = 20000
+    
+    # Telemetry Settings
+    METRICS_ENABLED: bool = True  # Prometheus metrics at /metrics (needs prometheus_client)
+    INCLUDE_STAGE_TIMINGS: bool = False  # default for the include_timings query parameter
+    
+    # Logging Settings
+    LOG_LEVEL: str = "INFO"
+    LOG_LEVELS: str = ""  # per-module overrides, e.g. "app.services.elevenlabs_service=DEBUG,app.utils=WARNING"
+    LOG_FORMAT: str = "json"  # json | text
+    LOG_MAX_FIELD_CHARS: int = 1000  # raw responses/transcripts logged via Truncated()
+    LOG_MAX_MESSAGE_CHARS: int = 4000
+    
     # CORS Settings
     ALLOWED_ORIGINS: list = ["*"]
     
@@ -0,0 +1,122 @@
+# Logging setup: JSON or text output, per-module levels, payload truncation and sampling
+import json
+import logging
+import sys
+import threading
+import time
+from collections import defaultdict
+from typing import Any, Dict, Optional
+
+from app.core.config import settings
+
+# LogRecord attributes that are not user-supplied extra fields
+_RESERVED = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime", "sample_every"}
+
+
+def get_logger(name: str) -> logging.Logger:
+    return logging.getLogger(name)
+
+
+class Truncated:
+    """
+    Lazily formatted payload for log arguments: repr/str is only computed when
+    the record is actually emitted, and cut to max_chars (LOG_MAX_FIELD_CHARS).
+    """
+
+    __slots__ = ("value", "max_chars")
+
+    def __init__(self, value: Any, max_chars: Optional[int] = None):
+        self.value = value
+        self.max_chars = max_chars
+
+    def _cut(self, text: str) -> str:
+        limit = self.max_chars or settings.LOG_MAX_FIELD_CHARS
+        if limit and len(text) > limit:
+            return f"{text[:limit]}… [{len(text) - limit} more chars]"
+        return text
+
+    def __str__(self) -> str:
+        return self._cut(self.value if isinstance(self.value, str) else repr(self.value))
+
+    __repr__ = __str__
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Keep one in N records for high-frequency call sites logged with
+    extra={"sample_every": N}; the kept record notes how many were skipped.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._counts: Dict[tuple, int] = defaultdict(int)
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        every = getattr(record, "sample_every", 1)
+        if every <= 1:
+            return True
+        key = (record.name, record.lineno)
+        with self._lock:
+            count = self._counts[key]
+            self._counts[key] = count + 1
+        if count % every:
+            return False
+        record.sampled = f"1/{every}"
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line: ts, level, logger, msg, extra fields and exception"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(record.created)) + f".{int(record.msecs):03d}Z",
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": str(Truncated(record.getMessage(), settings.LOG_MAX_MESSAGE_CHARS)),
+        }
+        for key, value in vars(record).items():
+            if key not in _RESERVED and not key.startswith("_"):
+                entry[key] = value
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class TextFormatter(logging.Formatter):
+    def __init__(self):
+        super().__init__("%(asctime)s %(levelname)-7s %(name)s: %(message)s")
+
+    def formatMessage(self, record: logging.LogRecord) -> str:
+        record.message = str(Truncated(record.message, settings.LOG_MAX_MESSAGE_CHARS))
+        return super().formatMessage(record)
+
+
+def parse_levels(spec: str) -> Dict[str, str]:
+    """'app.services.elevenlabs_service=DEBUG,app.utils=WARNING' -> {logger: level}"""
+    levels = {}
+    for item in spec.split(","):
+        name, sep, level = item.strip().partition("=")
+        if sep and name and level:
+            levels[name.strip()] = level.strip().upper()
+    return levels
+
+
+def configure_logging(log_format: Optional[str] = None, level: Optional[str] = None) -> None:
+    """
+    Install the root handler (stderr) from settings: LOG_FORMAT json | text,
+    LOG_LEVEL for everything and LOG_LEVELS per module. Safe to call again.
+    """
+    handler = logging.StreamHandler(sys.stderr)
+    handler.setFormatter(JsonFormatter() if (log_format or settings.LOG_FORMAT) == "json" else TextFormatter())
+    handler.addFilter(SamplingFilter())
+
+    root = logging.getLogger()
+    for existing in [h for h in root.handlers if getattr(h, "_app_handler", False)]:
+        root.removeHandler(existing)
+    handler._app_handler = True
+    root.addHandler(handler)
+    root.setLevel((level or settings.LOG_LEVEL).upper())
+    for name, module_level in parse_levels(settings.LOG_LEVELS).items():
+        logging.getLogger(name).setLevel(module_level)
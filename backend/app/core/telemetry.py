@@ -0,0 +1,130 @@
+# Instrumentation: stage timing spans, per-request stage timings and Prometheus metrics
+import contextvars
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+
+from app.core.config import settings
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+try:
+    from prometheus_client import CONTENT_TYPE_LATEST, Counter, Gauge, Histogram, generate_latest
+    PROMETHEUS_AVAILABLE = True
+except ImportError:
+    PROMETHEUS_AVAILABLE = False
+
+# Seconds; stages range from sub-second text work to multi-minute batch jobs
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20, 30, 60, 120, 300, 600, 1200)
+
+if PROMETHEUS_AVAILABLE:
+    STAGE_DURATION = Histogram(
+        "transcriptor_stage_duration_seconds", "Wall time of a pipeline stage", ["stage"], buckets=LATENCY_BUCKETS
+    )
+    STAGE_IN_FLIGHT = Gauge("transcriptor_stage_in_flight", "Pipeline stages currently running", ["stage"])
+    STAGE_FAILURES = Counter("transcriptor_stage_failures_total", "Pipeline stages that raised", ["stage"])
+    PROVIDER_ERRORS = Counter(
+        "transcriptor_provider_errors_total", "Failed external provider calls", ["provider", "reason"]
+    )
+    BYTES_UPLOADED = Counter("transcriptor_uploaded_bytes_total", "Audio bytes sent to providers", ["destination"])
+    HTTP_DURATION = Histogram(
+        "transcriptor_http_request_duration_seconds", "API request latency", ["method", "route", "status"],
+        buckets=LATENCY_BUCKETS
+    )
+    HTTP_IN_FLIGHT = Gauge("transcriptor_http_requests_in_flight", "API requests being served", ["method"])
+
+# Stage timings of the request in progress (see collect_timings); shared by its tasks and worker threads
+_request_timings: contextvars.ContextVar[Optional[Dict[str, float]]] = contextvars.ContextVar(
+    "request_timings", default=None
+)
+
+
+def _metrics_enabled() -> bool:
+    return PROMETHEUS_AVAILABLE and settings.METRICS_ENABLED
+
+
+@contextmanager
+def span(stage: str, timings: Optional[Dict[str, float]] = None):
+    """
+    Time a pipeline stage: observed in the stage histogram and in-flight gauge,
+    written to timings[stage] when a dict is passed, and added to the stage
+    timings of the current request. Works around sync and async code alike.
+    """
+    metrics = _metrics_enabled()
+    if metrics:
+        STAGE_IN_FLIGHT.labels(stage).inc()
+    start = time.perf_counter()
+    try:
+        yield
+    except Exception:
+        if metrics:
+            STAGE_FAILURES.labels(stage).inc()
+        raise
+    finally:
+        elapsed = time.perf_counter() - start
+        if metrics:
+            STAGE_IN_FLIGHT.labels(stage).dec()
+            STAGE_DURATION.labels(stage).observe(elapsed)
+        if timings is not None:
+            timings[stage] = round(elapsed, 3)
+        collected = _request_timings.get()
+        if collected is not None:
+            # Repeated or concurrent runs of a stage (chat windows, both dual pipelines) add up
+            collected[stage] = round(collected.get(stage, 0.0) + elapsed, 3)
+
+
+@contextmanager
+def collect_timings() -> Iterator[Dict[str, float]]:
+    """Collect the seconds spent per stage by every span opened inside the block (stages nest)"""
+    timings: Dict[str, float] = {}
+    token = _request_timings.set(timings)
+    try:
+        yield timings
+    finally:
+        _request_timings.reset(token)
+
+
+def record_provider_error(provider: str, reason: str) -> None:
+    if _metrics_enabled():
+        PROVIDER_ERRORS.labels(provider, reason).inc()
+
+
+def record_upload(destination: str, num_bytes: int) -> None:
+    if _metrics_enabled():
+        BYTES_UPLOADED.labels(destination).inc(num_bytes)
+
+
+def instrument(app) -> None:
+    """Add request latency/in-flight metrics to the app and serve them at GET /metrics"""
+    from fastapi import Request
+    from fastapi.responses import PlainTextResponse, Response
+
+    if not PROMETHEUS_AVAILABLE:
+        logger.warning("⚠️ prometheus_client not installed, /metrics is disabled")
+
+    @app.middleware("http")
+    async def record_request(request: Request, call_next):
+        if not _metrics_enabled():
+            return await call_next(request)
+        method = request.method
+        HTTP_IN_FLIGHT.labels(method).inc()
+        start = time.perf_counter()
+        status = 500
+        try:
+            response = await call_next(request)
+            status = response.status_code
+            return response
+        finally:
+            HTTP_IN_FLIGHT.labels(method).dec()
+            # Route templates, not raw paths, keep the label set bounded
+            route = request.scope.get("route")
+            HTTP_DURATION.labels(method, getattr(route, "path", "unmatched"), str(status)).observe(
+                time.perf_counter() - start
+            )
+
+    @app.get("/metrics", include_in_schema=False)
+    async def metrics():
+        if not _metrics_enabled():
+            return PlainTextResponse("metrics are disabled", status_code=503)
+        return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
@@ -3,8 +3,17 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 import uvicorn
 
+from app.core import telemetry
 from app.core.config import settings
+from app.core.logging import configure_logging
+
+# Before the service imports below, some of which log while loading
+configure_logging()
+
 from app.api import api_router
+from app.services.whisper_server_service import whisper_server_service
+from app.services.sarvam_chat_gateway import sarvam_chat_gateway
+from app.services import accuracy_batch
 
 # Create FastAPI app
 app = FastAPI(
@@ -25,6 +34,20 @@ app.add_middleware(
 # Include main API router
 app.include_router(api_router)
 
+# Request metrics and GET /metrics
+telemetry.instrument(app)
+
+@app.on_event("startup")
+async def startup():
+    if settings.WHISPER_SERVER_PRELOAD and whisper_server_service.available:
+        await whisper_server_service.ensure_running()
+
+@app.on_event("shutdown")
+async def shutdown():
+    await whisper_server_service.shutdown()
+    await sarvam_chat_gateway.aclose()
+    accuracy_batch.shutdown_pool()
+
 @app.get("/")
 async def root():
     return {
@@ -7,6 +7,7 @@ class PipelineResult(BaseModel):
     processed_file: Optional[str] = None
     error: Optional[str] = None
     embedding_used: Optional[bool] = None
+    timings: Optional[Dict[str, float]] = None  # seconds per stage
 
 class ComparisonResult(BaseModel):
     match: bool
@@ -25,6 +26,7 @@ class DualPipelineResponse(BaseModel):
     qc_required: bool
     qc_case_id: Optional[str] = None
     error: Optional[str] = None
+    timings: Optional[Dict[str, float]] = None  # seconds per stage
 
 class TranscriptSegment(BaseModel):
     speaker: str
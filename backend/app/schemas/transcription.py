@@ -1,6 +1,6 @@
 # Pydantic schemas for transcription 
 from pydantic import BaseModel
-from typing import Optional
+from typing import Dict, Optional
 
 class TranscriptionRequest(BaseModel):
     language_code: str = "ta-IN"  # Tamil India
@@ -36,4 +36,5 @@ class ProcessFileResponse(BaseModel):
     translation: str
     processing_time: float
     file_type: str
-    diarized_transcript: Optional[dict] = None  # Add diarization support 
\ No newline at end of file
+    diarized_transcript: Optional[dict] = None  # Add diarization support 
+    timings: Optional[Dict[str, float]] = None  # seconds per stage, when requested
@@ -1,10 +1,9 @@
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, Iterator, List, Tuple, Optional
 import re
 import json
-from difflib import SequenceMatcher
 from diff_match_patch import diff_match_patch
-import numpy as np
 from rapidfuzz import fuzz
+from app.utils.alignment import MIN_CHUNK_SIZE, Alignment, align, iter_aligned_opcodes
 
 class AccuracyAssessmentService:
     def __init__(self):
@@ -29,17 +28,21 @@ class AccuracyAssessmentService:
         enhanced = self._normalize_text(enhanced_transcript)
         tested = self._normalize_text(tested_transcript)
         
+        # One optimal alignment per level; every word/character metric is derived from it
+        word_alignment = align(enhanced.split(), tested.split())
+        char_alignment = align(enhanced, tested)
+        
         # Calculate word-level metrics
-        word_metrics = self._calculate_word_level_metrics(enhanced, tested)
+        word_metrics = self._calculate_word_level_metrics(word_alignment)
         
         # Calculate character-level metrics
-        char_metrics = self._calculate_char_level_metrics(enhanced, tested)
+        char_metrics = self._calculate_char_level_metrics(char_alignment)
         
         # Calculate semantic similarity
         semantic_similarity = self._calculate_semantic_similarity(enhanced, tested)
         
         # Calculate WER (Word Error Rate)
-        wer = self._calculate_wer(enhanced, tested)
+        wer = word_alignment.error_rate
         
         # Combine all metrics
         metrics = {
@@ -54,60 +57,32 @@ class AccuracyAssessmentService:
         
         return metrics
     
-    def _calculate_word_level_metrics(
-        self, enhanced: str, tested: str
-    ) -> Dict[str, float]:
-        """Calculate word-level accuracy metrics."""
-        enhanced_words = enhanced.split()
-        tested_words = tested.split()
-        
-        # Calculate word error rate using Levenshtein distance
-        word_error_rate = fuzz.ratio(enhanced_words, tested_words) / 100.0
-        
-        # Calculate word accuracy
-        matcher = SequenceMatcher(None, enhanced_words, tested_words)
-        matching_blocks = matcher.get_matching_blocks()
-        
-        total_matching_words = sum(block.size for block in matching_blocks)
-        total_words = max(len(enhanced_words), len(tested_words))
-        
-        word_accuracy = total_matching_words / total_words if total_words > 0 else 0
-        
+    def _calculate_word_level_metrics(self, alignment: Alignment) -> Dict[str, float]:
+        """Calculate word-level accuracy metrics from the word alignment."""
         return {
-            "word_accuracy": word_accuracy,
-            "word_error_rate": 1 - word_accuracy,
-            "matching_words": total_matching_words,
-            "total_words": total_words,
-            "word_similarity_ratio": word_error_rate,
+            "word_accuracy": alignment.accuracy,
+            "word_error_rate": alignment.error_rate,
+            "matching_words": alignment.hits,
+            "total_words": max(alignment.reference_length, alignment.hypothesis_length),
+            "reference_words": alignment.reference_length,
+            "word_similarity_ratio": alignment.similarity,
+            "word_substitutions": alignment.substitutions,
+            "word_deletions": alignment.deletions,
+            "word_insertions": alignment.insertions,
         }
     
-    def _calculate_char_level_metrics(
-        self, enhanced: str, tested: str
-    ) -> Dict[str, float]:
-        """Calculate character-level accuracy metrics."""
-        # Calculate character error rate using Levenshtein distance
-        char_similarity = fuzz.ratio(enhanced, tested) / 100.0
-        
-        # Get detailed character differences
-        diffs = self.dmp.diff_main(enhanced, tested)
-        self.dmp.diff_cleanupSemantic(diffs)
-        
-        # Count differences
-        insertions = sum(len(text) for op, text in diffs if op == 1)
-        deletions = sum(len(text) for op, text in diffs if op == -1)
-        matches = sum(len(text) for op, text in diffs if op == 0)
-        
-        total_chars = max(len(enhanced), len(tested))
-        char_accuracy = matches / total_chars if total_chars > 0 else 0
-        
+    def _calculate_char_level_metrics(self, alignment: Alignment) -> Dict[str, float]:
+        """Calculate character-level accuracy metrics from the character alignment."""
         return {
-            "character_accuracy": char_accuracy,
-            "character_error_rate": 1 - char_accuracy,
-            "character_similarity_ratio": char_similarity,
-            "insertions": insertions,
-            "deletions": deletions,
-            "matches": matches,
-            "total_characters": total_chars
+            "character_accuracy": alignment.accuracy,
+            "character_error_rate": alignment.error_rate,
+            "character_similarity_ratio": alignment.similarity,
+            "substitutions": alignment.substitutions,
+            "insertions": alignment.insertions,
+            "deletions": alignment.deletions,
+            "matches": alignment.hits,
+            "total_characters": max(alignment.reference_length, alignment.hypothesis_length),
+            "reference_characters": alignment.reference_length
         }
     
     def _calculate_semantic_similarity(self, text1: str, text2: str) -> float:
@@ -117,27 +92,9 @@ class AccuracyAssessmentService:
     
     def _calculate_wer(self, reference: str, hypothesis: str) -> float:
         """Calculate Word Error Rate (WER)."""
-        ref_words = reference.split()
-        hyp_words = hypothesis.split()
-        
-        # Build the cost matrix
-        d = np.zeros((len(ref_words) + 1, len(hyp_words) + 1))
-        d[:, 0] = np.arange(len(ref_words) + 1)
-        d[0, :] = np.arange(len(hyp_words) + 1)
-        
-        for i in range(1, len(ref_words) + 1):
-            for j in range(1, len(hyp_words) + 1):
-                if ref_words[i-1] == hyp_words[j-1]:
-                    d[i][j] = d[i-1][j-1]
-                else:
-                    substitution = d[i-1][j-1] + 1
-                    insertion = d[i][j-1] + 1
-                    deletion = d[i-1][j] + 1
-                    d[i][j] = min(substitution, insertion, deletion)
-        
         # WER = (S + D + I) / N = (S + D + I) / (S + D + C)
         # S = substitutions, D = deletions, I = insertions, C = correct words
-        return d[len(ref_words)][len(hyp_words)] / len(ref_words) if ref_words else 0
+        return align(reference.split(), hypothesis.split()).error_rate
     
     def _calculate_overall_accuracy(
         self,
@@ -204,5 +161,86 @@ class AccuracyAssessmentService:
                 
         return result
 
+    def iter_word_differences(
+        self,
+        enhanced: str,
+        tested: str,
+        chunk_words: int = 2000,
+        collapse_context: Optional[int] = None
+    ) -> Iterator[Dict[str, any]]:
+        """
+        Word-level differences, aligned chunk by chunk and yielded as they are found.
+        
+        Words are compared normalized but reported as written. Each event has a type
+        (equal, substitution, deletion: only in enhanced, insertion: only in tested),
+        the text (plus "replacement" for substitutions) and the word offsets in both
+        transcripts. With collapse_context, equal runs longer than twice that keep
+        only their edges and report the middle as {"type": "equal", "collapsed": true}.
+        A final "summary" event carries the totals.
+        """
+        enhanced_words = enhanced.split()
+        tested_words = tested.split()
+        counts = {"equal": 0, "substitution": 0, "deletion": 0, "insertion": 0}
+        tags = {"equal": "equal", "replace": "substitution", "delete": "deletion", "insert": "insertion"}
+        
+        def event(kind, i1, i2, j1, j2):
+            item = {"type": kind, "enhanced_start": i1, "tested_start": j1, "words": max(i2 - i1, j2 - j1)}
+            if kind == "insertion":
+                item["text"] = " ".join(tested_words[j1:j2])
+            else:
+                item["text"] = " ".join(enhanced_words[i1:i2])
+            if kind == "substitution":
+                item["replacement"] = " ".join(tested_words[j1:j2])
+            return item
+        
+        def equal_events(i1, i2, j1, j2):
+            length = i2 - i1
+            if collapse_context is None or collapse_context < 0 or length <= 2 * collapse_context + 1:
+                yield event("equal", i1, i2, j1, j2)
+                return
+            if collapse_context:
+                yield event("equal", i1, i1 + collapse_context, j1, j1 + collapse_context)
+            hidden = length - 2 * collapse_context
+            yield {"type": "equal", "collapsed": True, "words": hidden,
+                   "enhanced_start": i1 + collapse_context, "tested_start": j1 + collapse_context}
+            if collapse_context:
+                yield event("equal", i2 - collapse_context, i2, j2 - collapse_context, j2)
+        
+        # Equal runs are held back so runs split across chunk boundaries come out whole
+        pending = None
+        for tag, i1, i2, j1, j2 in iter_aligned_opcodes(
+            [self._normalize_text(word) for word in enhanced_words],
+            [self._normalize_text(word) for word in tested_words],
+            chunk_size=max(MIN_CHUNK_SIZE, chunk_words)
+        ):
+            kind = tags[tag]
+            if kind == "substitution":
+                # Only paired words are substitutions; the rest of a longer side counts as in align()
+                paired = min(i2 - i1, j2 - j1)
+                counts["substitution"] += paired
+                counts["deletion"] += (i2 - i1) - paired
+                counts["insertion"] += (j2 - j1) - paired
+            else:
+                counts[kind] += max(i2 - i1, j2 - j1)
+            if kind == "equal":
+                pending = (pending[0], i2, pending[2], j2) if pending else (i1, i2, j1, j2)
+                continue
+            if pending:
+                yield from equal_events(*pending)
+                pending = None
+            yield event(kind, i1, i2, j1, j2)
+        if pending:
+            yield from equal_events(*pending)
+        
+        yield {
+            "type": "summary",
+            "enhanced_words": len(enhanced_words),
+            "tested_words": len(tested_words),
+            "matching_words": counts["equal"],
+            "substitutions": counts["substitution"],
+            "deletions": counts["deletion"],
+            "insertions": counts["insertion"],
+        }
+
 # Singleton instance
 accuracy_assessment_service = AccuracyAssessmentService()
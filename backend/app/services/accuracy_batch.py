@@ -0,0 +1,197 @@
+import argparse
+import asyncio
+import json
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Union
+
+from app.core.config import settings
+from app.services.accuracy_assessment_service import accuracy_assessment_service
+from app.core.logging import configure_logging, get_logger
+
+logger = get_logger(__name__)
+
+_pool: Optional[ProcessPoolExecutor] = None
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _pool
+    if _pool is None:
+        _pool = ProcessPoolExecutor(max_workers=settings.ACCURACY_BATCH_WORKERS or None)
+    return _pool
+
+
+def shutdown_pool() -> None:
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+
+
+def parse_items(payload: Union[str, bytes, List, Dict]) -> List[Dict]:
+    """
+    Accept a list of pairs, {"items": [...]}, or JSONL text (one pair per line).
+    Each pair needs enhanced_transcript and tested_transcript; id defaults to its position.
+    Raises ValueError on malformed input.
+    """
+    if isinstance(payload, bytes):
+        payload = payload.decode("utf-8")
+    if isinstance(payload, str):
+        raw = []
+        for line_number, line in enumerate(payload.splitlines(), 1):
+            if line.strip():
+                try:
+                    raw.append(json.loads(line))
+                except json.JSONDecodeError as e:
+                    raise ValueError(f"Line {line_number}: invalid JSON ({e.msg})")
+    elif isinstance(payload, dict):
+        raw = payload.get("items")
+    else:
+        raw = payload
+    if not isinstance(raw, list):
+        raise ValueError("Expected a list of transcript pairs")
+
+    items = []
+    for index, item in enumerate(raw):
+        if not isinstance(item, dict) or not isinstance(item.get("enhanced_transcript"), str) \
+                or not isinstance(item.get("tested_transcript"), str):
+            raise ValueError(f"Item {index}: enhanced_transcript and tested_transcript must be strings")
+        items.append({
+            "index": index,
+            "id": item.get("id", index),
+            "enhanced_transcript": item["enhanced_transcript"],
+            "tested_transcript": item["tested_transcript"],
+        })
+    return items
+
+
+def score_item(item: Dict) -> Dict:
+    """Score one pair; failures are reported on the item instead of failing the batch"""
+    try:
+        metrics = accuracy_assessment_service.calculate_accuracy_metrics(
+            enhanced_transcript=item["enhanced_transcript"],
+            tested_transcript=item["tested_transcript"]
+        )
+        return {"index": item["index"], "id": item["id"], "metrics": metrics}
+    except Exception as e:
+        return {"index": item["index"], "id": item["id"], "error": str(e)}
+
+
+def _score_chunk(chunk: List[Dict]) -> List[Dict]:
+    return [score_item(item) for item in chunk]
+
+
+def _chunks(items: List[Dict], size: int) -> Iterable[List[Dict]]:
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def summarize(results: List[Dict]) -> Dict[str, Any]:
+    """
+    Corpus-level aggregates. Micro averages pool the errors and reference lengths
+    of all pairs (long files weigh more); macro averages are the mean per-pair rate.
+    """
+    scored = [result["metrics"] for result in results if "metrics" in result]
+
+    def rates(errors, reference, rate):
+        total_reference = sum(m[reference] for m in scored)
+        total_errors = sum(sum(m[key] for key in errors) for m in scored)
+        return {
+            "micro": total_errors / total_reference if total_reference else 0.0,
+            "macro": sum(m[rate] for m in scored) / len(scored) if scored else 0.0,
+            "errors": total_errors,
+            "reference_length": total_reference,
+        }
+
+    return {
+        "items": len(results),
+        "scored": len(scored),
+        "failed": len(results) - len(scored),
+        "wer": rates(("word_substitutions", "word_deletions", "word_insertions"), "reference_words", "word_error_rate"),
+        "cer": rates(("substitutions", "deletions", "insertions"), "reference_characters", "character_error_rate"),
+        "mean_overall_accuracy": sum(m["overall_accuracy"] for m in scored) / len(scored) if scored else 0.0,
+    }
+
+
+async def iter_batch(items: List[Dict]) -> AsyncIterator[Dict]:
+    """
+    Score pairs in the process pool, yielding an "item" event per pair and a
+    "progress" event per finished chunk as they complete, then the "summary".
+    """
+    loop = asyncio.get_running_loop()
+    pool = _get_pool()
+    futures = [
+        loop.run_in_executor(pool, _score_chunk, chunk)
+        for chunk in _chunks(items, max(1, settings.ACCURACY_BATCH_CHUNK_SIZE))
+    ]
+    results: List[Dict] = []
+    try:
+        for next_chunk in asyncio.as_completed(futures):
+            chunk_results = await next_chunk
+            results.extend(chunk_results)
+            for result in chunk_results:
+                yield {"type": "item", **result}
+            yield {"type": "progress", "done": len(results), "total": len(items)}
+    finally:
+        # Client went away: drop chunks that have not started
+        for future in futures:
+            future.cancel()
+    yield {"type": "summary", **summarize(results)}
+
+
+async def score_batch_async(items: List[Dict]) -> Dict[str, Any]:
+    """Score a batch in the process pool and return items (in input order) and the summary"""
+    results = []
+    summary = {}
+    async for event in iter_batch(items):
+        event_type = event.pop("type")
+        if event_type == "item":
+            results.append(event)
+        elif event_type == "summary":
+            summary = event
+    results.sort(key=lambda result: result["index"])
+    return {"items": results, "summary": summary}
+
+
+def score_batch(pairs: Union[str, bytes, List, Dict], workers: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Python entry point: score pairs (any format parse_items accepts) with a
+    dedicated process pool and return items and the corpus summary.
+    """
+    items = parse_items(pairs)
+    chunk_size = max(1, settings.ACCURACY_BATCH_CHUNK_SIZE)
+    with ProcessPoolExecutor(max_workers=workers or settings.ACCURACY_BATCH_WORKERS or None) as pool:
+        results = [result for chunk in pool.map(_score_chunk, _chunks(items, chunk_size)) for result in chunk]
+    return {"items": results, "summary": summarize(results)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Score transcript pairs (JSON list or JSONL) for accuracy")
+    parser.add_argument("input", help="JSON or JSONL file of {id, enhanced_transcript, tested_transcript}")
+    parser.add_argument("--jsonl", action="store_true", help="read the input as JSONL (default for .jsonl/.ndjson files)")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--output", help="write the full report here instead of printing the summary")
+    args = parser.parse_args()
+    configure_logging(log_format="text")
+
+    with open(args.input, encoding="utf-8") as f:
+        content = f.read()
+    if args.jsonl or args.input.lower().endswith((".jsonl", ".ndjson")):
+        pairs = content
+    else:
+        try:
+            pairs = json.loads(content)
+        except json.JSONDecodeError:
+            pairs = content  # JSONL
+        if isinstance(pairs, dict) and "items" not in pairs:
+            pairs = content  # one-line JSONL: a single pair, not a {"items": [...]} document
+    report = score_batch(pairs, workers=args.workers)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        logger.info("✅ Scored %s pairs, report saved to %s", report['summary']['scored'], args.output)
+    print(json.dumps(report["summary"], indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -8,6 +8,9 @@ import whisper
 from transformers import Wav2Vec2ForCTC, Wav2Vec2Processor
 import soundfile as sf
 from app.core.config import settings
+from app.core.logging import Truncated, get_logger
+
+logger = get_logger(__name__)
 
 class AudioCrossValidator:
     def __init__(self):
@@ -20,31 +23,31 @@ class AudioCrossValidator:
     def _load_models(self):
         """Load speech recognition models for cross-validation"""
         try:
-            print("🔄 Loading Whisper base model for audio cross-validation (faster processing)...")
+            logger.info("🔄 Loading Whisper base model for audio cross-validation (faster processing)...")
             self.whisper_model = whisper.load_model("base")
-            print("✅ Whisper base model loaded successfully")
+            logger.info("✅ Whisper base model loaded successfully")
         except Exception as e:
-            print(f"⚠️  Whisper model loading failed: {e}")
+            logger.warning("⚠️  Whisper model loading failed: %s", e)
             self.whisper_model = None
         
         try:
-            print("🔄 Loading Wav2Vec2 model for detailed audio analysis...")
+            logger.info("🔄 Loading Wav2Vec2 model for detailed audio analysis...")
             # Use a valid Wav2Vec2 model for Tamil
             model_name = "facebook/wav2vec2-large-xlsr-53"
             self.wav2vec_model = Wav2Vec2ForCTC.from_pretrained(model_name)
             self.wav2vec_processor = Wav2Vec2Processor.from_pretrained(model_name)
-            print("✅ Wav2Vec2 model loaded successfully")
+            logger.info("✅ Wav2Vec2 model loaded successfully")
         except Exception as e:
-            print(f"⚠️  Wav2Vec2 model loading failed: {e}")
-            print("💡 Trying alternative model...")
+            logger.warning("⚠️  Wav2Vec2 model loading failed: %s", e)
+            logger.info("💡 Trying alternative model...")
             try:
                 # Fallback to a more general model
                 model_name = "facebook/wav2vec2-base"
                 self.wav2vec_model = Wav2Vec2ForCTC.from_pretrained(model_name)
                 self.wav2vec_processor = Wav2Vec2Processor.from_pretrained(model_name)
-                print("✅ Wav2Vec2 fallback model loaded successfully")
+                logger.info("✅ Wav2Vec2 fallback model loaded successfully")
             except Exception as e2:
-                print(f"⚠️  Wav2Vec2 fallback model also failed: {e2}")
+                logger.warning("⚠️  Wav2Vec2 fallback model also failed: %s", e2)
                 self.wav2vec_model = None
                 self.wav2vec_processor = None
     
@@ -54,7 +57,7 @@ class AudioCrossValidator:
         Cross-validate transcripts with audio to determine which pipeline is correct for each segment
         """
         try:
-            print("🎵 Starting audio cross-validation...")
+            logger.info("🎵 Starting audio cross-validation...")
             
             # Check if audio files exist
             if not os.path.exists(audio_file1) or not os.path.exists(audio_file2):
@@ -94,7 +97,7 @@ class AudioCrossValidator:
             }
             
         except Exception as e:
-            print(f"❌ Error in audio cross-validation: {e}")
+            logger.error("❌ Error in audio cross-validation: %s", e)
             return {'error': str(e)}
     
     async def _validate_words_with_audio(self, transcript1: str, transcript2: str, 
@@ -115,7 +118,7 @@ class AudioCrossValidator:
         # Use Whisper for word-level validation
         if self.whisper_model:
             try:
-                print("🔍 Using Whisper base model for word-level validation...")
+                logger.debug("🔍 Using Whisper base model for word-level validation...")
                 # Transcribe audio segments with Whisper base model (faster processing)
                 whisper_result1 = self.whisper_model.transcribe(audio1, language="ta", fp16=False)
                 whisper_result2 = self.whisper_model.transcribe(audio2, language="ta", fp16=False)
@@ -123,8 +126,8 @@ class AudioCrossValidator:
                 whisper_text1 = whisper_result1['text'].lower()
                 whisper_text2 = whisper_result2['text'].lower()
                 
-                print(f"📝 Whisper transcription 1: {whisper_text1[:100]}...")
-                print(f"📝 Whisper transcription 2: {whisper_text2[:100]}...")
+                logger.debug("📝 Whisper transcription 1: %s", Truncated(whisper_text1, 100))
+                logger.debug("📝 Whisper transcription 2: %s", Truncated(whisper_text2, 100))
                 
                 # Compare each word with Whisper transcription
                 for i, (word1, word2) in enumerate(zip(words1, words2)):
@@ -163,14 +166,15 @@ class AudioCrossValidator:
                             'confidence_diff': abs(confidence1 - confidence2)
                         })
                 
-                print(f"✅ Word-level validation completed: {len(validation_results['word_confidence_scores'])} words analyzed")
+                logger.info("✅ Word-level validation completed: %s words analyzed",
+                            len(validation_results['word_confidence_scores']))
                 
             except Exception as e:
-                print(f"⚠️  Whisper word validation failed: {e}")
+                logger.warning("⚠️  Whisper word validation failed: %s", e)
                 # Fallback to simple comparison
                 validation_results = self._fallback_word_validation(words1, words2)
         else:
-            print("⚠️  Whisper model not available, using fallback validation")
+            logger.warning("⚠️  Whisper model not available, using fallback validation")
             validation_results = self._fallback_word_validation(words1, words2)
         
         return validation_results
@@ -238,7 +242,7 @@ class AudioCrossValidator:
         # Use Wav2Vec2 for segment-level validation
         if self.wav2vec_model and self.wav2vec_processor:
             try:
-                print("🔍 Using Wav2Vec2 for segment-level validation...")
+                logger.debug("🔍 Using Wav2Vec2 for segment-level validation...")
                 # Process audio with Wav2Vec2
                 inputs1 = self.wav2vec_processor(audio1, sampling_rate=16000, return_tensors="pt")
                 inputs2 = self.wav2vec_processor(audio2, sampling_rate=16000, return_tensors="pt")
@@ -287,14 +291,15 @@ class AudioCrossValidator:
                             'confidence': confidence2
                         })
                 
-                print(f"✅ Segment-level validation completed: {len(validation_results['segment_analysis'])} segments analyzed")
+                logger.info("✅ Segment-level validation completed: %s segments analyzed",
+                            len(validation_results['segment_analysis']))
                 
             except Exception as e:
-                print(f"⚠️  Wav2Vec2 segment validation failed: {e}")
+                logger.warning("⚠️  Wav2Vec2 segment validation failed: %s", e)
                 # Fallback to simple segment comparison
                 validation_results = self._fallback_segment_validation(transcript1, transcript2)
         else:
-            print("⚠️  Wav2Vec2 model not available, using fallback segment validation")
+            logger.warning("⚠️  Wav2Vec2 model not available, using fallback segment validation")
             validation_results = self._fallback_segment_validation(transcript1, transcript2)
         
         return validation_results
@@ -1,10 +1,15 @@
 import ffmpeg
 import os
+import asyncio
 import tempfile
 from pathlib import Path
-from typing import Tuple
+from typing import Dict, Optional, Tuple
 from app.utils.audio_utils import preprocess_audio, to_mono_wav, reduce_noise, extract_embedding, vad_trim_pyannote
 from app.core.config import settings
+from app.core.telemetry import span
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
 
 sb_embedder = None
 try:
@@ -12,16 +17,12 @@ try:
     sb_embedder = EncoderClassifier.from_hparams(
         source='speechbrain/spkrec-ecapa-voxceleb',
         run_opts={'device': 'cpu'})
-    print("✅ Successfully loaded speechbrain embedder")
+    logger.info("✅ Successfully loaded speechbrain embedder")
 except ImportError:
-    print("⚠️  speechbrain not installed. Speaker embedding will be disabled.")
-    print("💡 To install speechbrain, you may need to:")
-    print("   1. Install Visual Studio Build Tools")
-    print("   2. Install CMake")
-    print("   3. Run: pip install speechbrain")
+    logger.warning("⚠️ speechbrain not installed, speaker embedding is disabled "
+                   "(install Visual Studio Build Tools and CMake, then: pip install speechbrain)")
 except Exception as e:
-    print(f"❌ Error loading speechbrain embedder: {e}")
-    print("Speaker embedding extraction will be disabled.")
+    logger.error("❌ Error loading speechbrain embedder, speaker embedding is disabled: %s", e)
 
 class AudioService:
     @staticmethod
@@ -64,19 +65,24 @@ class AudioService:
         return Path(filename).suffix.lower() in audio_extensions
     
     @staticmethod
-    async def validate_and_prepare_audio(file_path: str):
+    async def validate_and_prepare_audio(file_path: str, timings: Optional[Dict[str, float]] = None):
+        # Each CPU-bound step runs in a worker thread so other requests/pipelines keep running
         try:
-            wav = to_mono_wav(file_path)
-            clean = reduce_noise(wav)
+            with span("to_mono", timings):
+                wav = await asyncio.to_thread(to_mono_wav, file_path)
+            with span("noise_reduction", timings):
+                clean = await asyncio.to_thread(reduce_noise, wav)
             # VAD trim with pyannote.audio (16kHz)
-            speech = vad_trim_pyannote(clean, token=settings.HUGGINGFACE_AUTH_TOKEN)
-            embedding = extract_embedding(speech)
+            with span("vad", timings):
+                speech = await asyncio.to_thread(vad_trim_pyannote, clean, settings.HUGGINGFACE_AUTH_TOKEN)
+            with span("embedding", timings):
+                embedding = await asyncio.to_thread(extract_embedding, speech)
             return speech, embedding, "audio"
         except Exception as e:
-            print(f"Warning: Enhanced audio processing failed: {e}")
-            print("Falling back to basic audio processing...")
+            logger.warning("⚠️ Enhanced audio processing failed, falling back to basic processing: %s", e)
             # Fallback to basic processing
-            processed_path = preprocess_audio(file_path)
+            with span("fallback_preprocess", timings):
+                processed_path = await asyncio.to_thread(preprocess_audio, file_path)
             return processed_path, None, "audio"
 
 audio_service = AudioService() 
\ No newline at end of file
@@ -0,0 +1,155 @@
+import io
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import urlparse
+
+import requests
+from azure.core.pipeline.transport import RequestsTransport
+from azure.storage.blob import ContainerClient, ContentSettings
+
+from app.core.config import settings
+from app.core.telemetry import record_upload
+from app.utils.upload_encoding import upload_mime_type
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class _ChunkStream(io.RawIOBase):
+    """Read-only file object over an iterator of byte chunks."""
+
+    def __init__(self, chunks: Iterator[bytes]):
+        self._chunks = chunks
+        self._buffer = b""
+        self.bytes_read = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b) -> int:
+        while not self._buffer:
+            try:
+                self._buffer = next(self._chunks)
+            except StopIteration:
+                return 0
+        n = min(len(b), len(self._buffer))
+        b[:n] = self._buffer[:n]
+        self._buffer = self._buffer[n:]
+        self.bytes_read += n
+        return n
+
+
+def _throughput(num_bytes: int, seconds: float) -> Dict[str, Any]:
+    return {
+        "bytes": num_bytes,
+        "seconds": round(seconds, 3),
+        "mbps": round(num_bytes * 8 / seconds / 1_000_000, 2) if seconds > 0 else None
+    }
+
+
+class BlobTransferService:
+    """
+    Transfer layer for the Azure blob storage Sarvam hands out per batch job.
+    Container clients are reused per SAS container and all of them share one
+    pooled HTTP session; uploads go up as parallel blocks.
+    """
+
+    def __init__(self, block_size: Optional[int] = None, max_concurrency: Optional[int] = None,
+                 max_cached_clients: int = 32):
+        self.block_size = block_size or settings.BLOB_UPLOAD_BLOCK_SIZE
+        self.max_concurrency = max_concurrency or settings.BLOB_MAX_CONCURRENCY
+        self.max_cached_clients = max_cached_clients
+        self._session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=8, pool_maxsize=max(self.max_concurrency * 2, 10))
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        self._transport = RequestsTransport(session=self._session, session_owner=False)
+        self._containers: "OrderedDict[Tuple[str, str, str], ContainerClient]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def parse_sas_url(sas_url: str) -> Tuple[str, str, str, str]:
+        """Split a SAS directory URL into (account_url, container, directory, sas_token)"""
+        parsed = urlparse(sas_url)
+        account_url = f"{parsed.scheme}://{parsed.netloc}"
+        parts = parsed.path.split('/')
+        container_name = parts[1]
+        dir_path = '/'.join(parts[2:]).strip('/')
+        return account_url, container_name, dir_path, parsed.query
+
+    def get_container(self, sas_url: str) -> Tuple[ContainerClient, str]:
+        """Return a cached container client for the SAS URL and the directory inside it"""
+        account_url, container_name, dir_path, sas_token = self.parse_sas_url(sas_url)
+        key = (account_url, container_name, sas_token)
+        with self._lock:
+            container = self._containers.get(key)
+            if container is not None:
+                self._containers.move_to_end(key)
+            else:
+                container = ContainerClient(
+                    account_url=account_url,
+                    container_name=container_name,
+                    credential=sas_token,
+                    transport=self._transport,
+                    max_block_size=self.block_size,
+                    max_single_put_size=self.block_size,
+                )
+                self._containers[key] = container
+                if len(self._containers) > self.max_cached_clients:
+                    self._containers.popitem(last=False)
+        return container, dir_path
+
+    def upload_file(self, sas_url: str, local_file_path: str, content_type: Optional[str] = None) -> Dict[str, Any]:
+        """Upload a file into the SAS directory in parallel blocks and return throughput stats"""
+        container, dir_path = self.get_container(sas_url)
+        filename = os.path.basename(local_file_path)
+        blob_path = f"{dir_path}/{filename}" if dir_path else filename
+        content_type = content_type or upload_mime_type(filename)
+        size = os.path.getsize(local_file_path)
+        start = time.perf_counter()
+        with open(local_file_path, "rb") as data:
+            container.upload_blob(
+                name=blob_path,
+                data=data,
+                length=size,
+                overwrite=True,
+                content_settings=ContentSettings(content_type=content_type),
+                max_concurrency=self.max_concurrency
+            )
+        stats = _throughput(size, time.perf_counter() - start)
+        stats["blob"] = blob_path
+        record_upload("azure_blob", size)
+        logger.info("✅ Uploaded %s to %s (%s): %s bytes in %ss (%s Mbps)",
+                    filename, blob_path, content_type, stats['bytes'], stats['seconds'], stats['mbps'])
+        return stats
+
+    def list_blob_names(self, sas_url: str) -> List[str]:
+        container, dir_path = self.get_container(sas_url)
+        return [blob.name for blob in container.list_blobs(name_starts_with=dir_path)]
+
+    def download_json(self, sas_url: str, blob_name: str) -> Tuple[Any, Dict[str, Any]]:
+        """Stream a JSON blob straight into the parser, without a local file"""
+        container, _ = self.get_container(sas_url)
+        start = time.perf_counter()
+        downloader = container.download_blob(blob_name)
+        stream = _ChunkStream(downloader.chunks())
+        data = json.load(io.TextIOWrapper(io.BufferedReader(stream), encoding="utf-8"))
+        stats = _throughput(stream.bytes_read, time.perf_counter() - start)
+        logger.info("✅ Downloaded %s: %s bytes in %ss (%s Mbps)", blob_name, stats['bytes'], stats['seconds'], stats['mbps'])
+        return data, stats
+
+    def download_to_file(self, sas_url: str, blob_name: str, local_path: str) -> Dict[str, Any]:
+        """Stream a blob to disk chunk by chunk"""
+        container, _ = self.get_container(sas_url)
+        start = time.perf_counter()
+        downloader = container.download_blob(blob_name, max_concurrency=self.max_concurrency)
+        with open(local_path, "wb") as f:
+            num_bytes = downloader.readinto(f)
+        return _throughput(num_bytes, time.perf_counter() - start)
+
+
+blob_transfer_service = BlobTransferService()
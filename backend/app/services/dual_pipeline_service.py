@@ -1,6 +1,7 @@
 import asyncio
 import json
 import os
+import time
 from typing import Dict, Tuple, Optional, List
 from fastapi import HTTPException
 from app.services.sarvam_batch_service import SarvamBatchService
@@ -8,9 +9,14 @@ from app.services.audio_service import audio_service
 from app.services.qc_service import qc_service
 from app.services.audio_cross_validator import audio_cross_validator
 from app.utils.audio_utils import convert_to_wav
-from app.utils.audio_utils import transcribe_with_whisper_cpp
+from app.services.whisper_server_service import whisper_server_service
 from app.core.config import settings
+from app.core.telemetry import span
+from app.utils.rover import rover_merge
 from typing import Optional
+from app.core.logging import Truncated, get_logger
+
+logger = get_logger(__name__)
 
 def convert_mp3_to_wav(mp3_path):
     import subprocess
@@ -31,60 +37,80 @@ class DualPipelineService:
         Process audio through two pipelines:
         1. Direct WAV conversion → Sarvam batch
         2. Enhanced preprocessing → Sarvam batch
+        The two pipelines are independent and run concurrently; a failure in one is
+        reported on that branch and the other branch's transcript is used.
         If transcripts are exactly equal, return one.
         Otherwise, use whisper.cpp (medium model, Tamil) to transcribe the audio and create an optimal transcript by comparing word by word. Never send to QC, always return the optimal transcript.
         """
         try:
-            # Pipeline 1: Direct WAV conversion
-            print("🔄 Starting Pipeline 1: Direct WAV conversion")
-            pipeline1_result = await self._pipeline1_direct_wav(file_path)
-            
-            # Pipeline 2: Enhanced preprocessing
-            print("🔄 Starting Pipeline 2: Enhanced preprocessing")
-            pipeline2_result = await self._pipeline2_enhanced_preprocessing(file_path)
+            total_start = time.perf_counter()
+            timings = {}
+            logger.info("🔄 Starting Pipeline 1 (direct WAV) and Pipeline 2 (enhanced preprocessing) concurrently")
+            with span('pipelines', timings):
+                results = await asyncio.gather(
+                    self._pipeline1_direct_wav(file_path),
+                    self._pipeline2_enhanced_preprocessing(file_path),
+                    return_exceptions=True
+                )
+            pipeline1_result, pipeline2_result = [
+                {'error': str(r), 'timings': {}} if isinstance(r, BaseException) else r
+                for r in results
+            ]
+            # Per-branch stage sums, to compare with the concurrent wall time above
+            timings['pipeline1_total'] = round(sum(pipeline1_result.get('timings', {}).values()), 3)
+            timings['pipeline2_total'] = round(sum(pipeline2_result.get('timings', {}).values()), 3)
 
-            transcript1 = pipeline1_result.get('transcript', '').strip()
-            transcript2 = pipeline2_result.get('transcript', '').strip()
+            transcript1 = (pipeline1_result.get('transcript') or '').strip()
+            transcript2 = (pipeline2_result.get('transcript') or '').strip()
 
             words1 = transcript1.split()
             words2 = transcript2.split()
 
-            if words1 == words2:
-                print("✅ Transcripts are exactly equal, returning result.")
+            failed = [name for name, result in (('pipeline1', pipeline1_result), ('pipeline2', pipeline2_result))
+                      if result.get('error') or not result.get('transcript')]
+            if len(failed) == 2:
+                raise Exception(
+                    f"Both pipelines failed - pipeline1: {pipeline1_result.get('error', 'no transcript')}, "
+                    f"pipeline2: {pipeline2_result.get('error', 'no transcript')}"
+                )
+            if failed or words1 == words2:
+                if failed:
+                    final_transcript = transcript2 if failed[0] == 'pipeline1' else transcript1
+                    failed_result = pipeline1_result if failed[0] == 'pipeline1' else pipeline2_result
+                    reason = f"{failed[0]} failed ({failed_result.get('error', 'no transcript')}), using the other pipeline"
+                    logger.warning("⚠️ %s", reason)
+                else:
+                    final_transcript = transcript1
+                    reason = 'Transcripts are exactly equal'
+                    logger.info("✅ Transcripts are exactly equal, returning result.")
                 comparison = {
-                    'match': True,
-                    'similarity_score': 1.0,
-                    'final_transcript': transcript1,
+                    'match': not failed,
+                    'similarity_score': 1.0 if not failed else 0.0,
+                    'final_transcript': final_transcript,
                     'qc_required': False,
-                    'reason': 'Transcripts are exactly equal',
+                    'reason': reason,
                     'pipeline1_length': len(words1),
                     'pipeline2_length': len(words2)
                 }
+                timings['total'] = round(time.perf_counter() - total_start, 3)
                 return {
                     'pipeline1': pipeline1_result,
                     'pipeline2': pipeline2_result,
                     'comparison': comparison,
-                    'final_transcript': transcript1,
+                    'final_transcript': final_transcript,
                     'qc_required': False,
-                    'qc_case_id': None
+                    'qc_case_id': None,
+                    'timings': timings
                 }
 
             # Use whisper.cpp (medium model, Tamil) to transcribe the audio
-            print("🦜 Transcribing with whisper.cpp for optimal transcript (medium model, Tamil)...")
+            logger.info("🦜 Transcribing with whisper.cpp for optimal transcript (medium model, Tamil)...")
             wav_path = pipeline1_result.get('processed_file', file_path)
-            # Convert to WAV if input is MP3
-            file_ext = os.path.splitext(wav_path)[1].lower()
-            if file_ext == ".mp3":
-                wav_path = convert_mp3_to_wav(wav_path)
-            whisper_model_path = "T-T-App/backend/whisper.cpp/models/ggml-base.bin"
-            whisper_binary_path = r"C:\\Users\\Lenovo\\Desktop\\T-T\\T-T-App\\backend\\whisper.cpp\\build\\bin\\whisper-server.exe"
-            whisper_transcript = transcribe_with_whisper_cpp(
-                audio_path=wav_path,
-                model_path=whisper_model_path,
-                binary_path=whisper_binary_path,
-                language="ta"
-            )
-            print(f"Whisper.cpp transcript:\n{whisper_transcript}")
+            # whisper-server expects 16 kHz mono PCM; pipeline 1 keeps the source sample rate
+            wav_path = await asyncio.to_thread(convert_mp3_to_wav, wav_path)
+            with span('whisper', timings):
+                whisper_transcript = await whisper_server_service.transcribe_text(wav_path, language="ta")
+            logger.debug("Whisper.cpp transcript:\n%s", Truncated(whisper_transcript))
 
             # Save whisper transcript to file
             import datetime
@@ -94,36 +120,22 @@ class DualPipelineService:
             with open(whisper_log_file, "w", encoding="utf-8") as f:
                 f.write(f"Timestamp: {datetime.datetime.now()}\n")
                 f.write(f"Audio file: {wav_path}\n")
-                f.write(f"Model: {whisper_model_path}\n")
+                f.write(f"Model: {settings.WHISPER_MODEL_PATH}\n")
                 f.write(f"Language: ta\n")
                 f.write("-" * 50 + "\n")
                 f.write(whisper_transcript)
-            print(f"✅ Whisper transcript saved to: {whisper_log_file}")
+            logger.info("✅ Whisper transcript saved to: %s", whisper_log_file)
 
             whisper_words = whisper_transcript.strip().split()
 
-            # Build optimal transcript word by word
-            optimal_words = []
-            max_len = max(len(words1), len(words2), len(whisper_words))
-            match_count = 0
-            for i in range(max_len):
-                w1 = words1[i] if i < len(words1) else ''
-                w2 = words2[i] if i < len(words2) else ''
-                w_whisper = whisper_words[i] if i < len(whisper_words) else ''
-                # If either pipeline matches whisper, use that word
-                if w1 == w_whisper:
-                    optimal_words.append(w1)
-                    match_count += 1
-                elif w2 == w_whisper:
-                    optimal_words.append(w2)
-                    match_count += 1
-                else:
-                    # If neither matches, default to pipeline 1's word
-                    optimal_words.append(w1)
+            # Align the three hypotheses and vote per slot; ties go to pipeline 1, then pipeline 2
+            with span('rover_merge', timings):
+                merged = rover_merge([words1, words2, whisper_words])
+            optimal_words = merged['words']
             optimal_transcript = ' '.join(optimal_words)
-            print(f"✅ Optimal transcript created using whisper.cpp: {optimal_transcript}")
-            # Create a dummy comparison result
-            similarity_score = match_count / max_len if max_len > 0 else 0.0
+            logger.info("✅ Optimal transcript created using whisper.cpp: %s", Truncated(optimal_transcript, 200))
+            # Share of aligned slots backed by at least two of the three hypotheses
+            similarity_score = merged['majority_ratio']
             comparison = {
                 'match': similarity_score == 1.0,
                 'similarity_score': similarity_score,
@@ -133,67 +145,76 @@ class DualPipelineService:
                 'pipeline1_length': len(words1),
                 'pipeline2_length': len(words2)
             }
+            timings['total'] = round(time.perf_counter() - total_start, 3)
             return {
                 'pipeline1': pipeline1_result,
                 'pipeline2': pipeline2_result,
                 'comparison': comparison,
                 'final_transcript': optimal_transcript,
                 'qc_required': False,
-                'qc_case_id': None
+                'qc_case_id': None,
+                'timings': timings
             }
         except Exception as e:
-            print(f"❌ Error in dual pipeline processing: {e}")
+            logger.error("❌ Error in dual pipeline processing: %s", e)
             raise HTTPException(status_code=500, detail=f"Dual pipeline processing failed: {str(e)}")
     
     async def _pipeline1_direct_wav(self, file_path: str) -> Dict:
         """Pipeline 1: Convert to WAV and send to Sarvam batch"""
+        timings = {}
         try:
             # Convert to WAV
-            wav_path = convert_to_wav(file_path)
-            print(f"✅ Pipeline 1: Converted to WAV: {wav_path}")
+            with span('convert', timings):
+                wav_path = await asyncio.to_thread(convert_to_wav, file_path)
+            logger.info("✅ Pipeline 1: Converted to WAV: %s", wav_path)
             
             # Send to Sarvam batch
             transcript, diarized = await self.sarvam_batch.batch_transcribe(
                 wav_path, 
                 language_code="ta-IN",
-                diarization=True
+                diarization=True,
+                timings=timings
             )
             
             return {
                 'transcript': transcript,
                 'diarized_transcript': diarized,
-                'processed_file': wav_path
+                'processed_file': wav_path,
+                'timings': timings
             }
             
         except Exception as e:
-            print(f"❌ Pipeline 1 failed: {e}")
-            return {'error': str(e)}
+            logger.error("❌ Pipeline 1 failed: %s", e)
+            return {'error': str(e), 'timings': timings}
     
     async def _pipeline2_enhanced_preprocessing(self, file_path: str) -> Dict:
         """Pipeline 2: Enhanced preprocessing then Sarvam batch"""
+        timings = {}
         try:
             # Enhanced preprocessing (mono, noise reduction, VAD)
-            speech_path, embedding, _ = await audio_service.validate_and_prepare_audio(file_path)
-            print(f"✅ Pipeline 2: Enhanced preprocessing complete: {speech_path}")
+            speech_path, embedding, _ = await audio_service.validate_and_prepare_audio(file_path, timings=timings)
+            logger.info("✅ Pipeline 2: Enhanced preprocessing complete: %s", speech_path)
             
             # Send to Sarvam batch with embeddings
             transcript, diarized = await self.sarvam_batch.batch_transcribe(
                 speech_path,
                 language_code="ta-IN",
                 diarization=True,
-                speaker_embedding=embedding
+                speaker_embedding=embedding,
+                timings=timings
             )
             
             return {
                 'transcript': transcript,
                 'diarized_transcript': diarized,
                 'processed_file': speech_path,
-                'embedding_used': embedding is not None
+                'embedding_used': embedding is not None,
+                'timings': timings
             }
             
         except Exception as e:
-            print(f"❌ Pipeline 2 failed: {e}")
-            return {'error': str(e)}
+            logger.error("❌ Pipeline 2 failed: %s", e)
+            return {'error': str(e), 'timings': timings}
     
     def _compare_transcripts(self, transcript1: str, transcript2: str) -> Dict:
         """
@@ -379,13 +400,13 @@ class DualPipelineService:
                 return comparison_result['final_transcript']
             
             # Use audio cross-validation to determine which pipeline is correct for each word/segment
-            print("🎵 Performing audio cross-validation...")
+            logger.info("🎵 Performing audio cross-validation...")
             audio_validation_result = await audio_cross_validator.cross_validate_with_audio(
                 transcript1, transcript2, audio_file1, audio_file2
             )
             
             if 'error' in audio_validation_result:
-                print(f"⚠️  Audio cross-validation failed: {audio_validation_result['error']}")
+                logger.warning("⚠️  Audio cross-validation failed: %s", audio_validation_result['error'])
                 # Fallback to intelligent merging
                 return await self._create_optimal_transcript_automatically(
                     transcript1, transcript2, comparison_result
@@ -394,18 +415,20 @@ class DualPipelineService:
             optimal_transcript = audio_validation_result.get('optimal_transcript', '')
             
             if optimal_transcript:
-                print(f"✅ Audio cross-validation completed successfully")
-                print(f"   • Word-level validations: {len(audio_validation_result.get('word_validation', {}).get('word_confidence_scores', {}))}")
-                print(f"   • Segment-level validations: {len(audio_validation_result.get('segment_validation', {}).get('segment_analysis', {}))}")
+                logger.info("✅ Audio cross-validation completed successfully")
+                logger.info("   • Word-level validations: %s",
+                            len(audio_validation_result.get('word_validation', {}).get('word_confidence_scores', {})))
+                logger.info("   • Segment-level validations: %s",
+                            len(audio_validation_result.get('segment_validation', {}).get('segment_analysis', {})))
                 return optimal_transcript
             else:
-                print("⚠️  Audio cross-validation didn't produce optimal transcript, using fallback")
+                logger.warning("⚠️  Audio cross-validation didn't produce optimal transcript, using fallback")
                 return await self._create_optimal_transcript_automatically(
                     transcript1, transcript2, comparison_result
                 )
                 
         except Exception as e:
-            print(f"❌ Error in audio cross-validation: {e}")
+            logger.error("❌ Error in audio cross-validation: %s", e)
             # Fallback to intelligent merging
             return await self._create_optimal_transcript_automatically(
                 transcript1, transcript2, comparison_result
@@ -426,7 +449,7 @@ class DualPipelineService:
                 return comparison_result['final_transcript']
             
             # Otherwise, create intelligent merge
-            print("🔄 Creating optimal transcript by merging both pipelines...")
+            logger.info("🔄 Creating optimal transcript by merging both pipelines...")
             
             # Split into words for detailed analysis
             words1 = transcript1.split()
@@ -442,11 +465,11 @@ class DualPipelineService:
             if len(words1) > len(words2) * 1.1:
                 base_transcript = transcript1
                 supplement_words = unique_to_2
-                print(f"📝 Using Pipeline 1 as base (longer transcript)")
+                logger.info("📝 Using Pipeline 1 as base (longer transcript)")
             elif len(words2) > len(words1) * 1.1:
                 base_transcript = transcript2
                 supplement_words = unique_to_1
-                print(f"📝 Using Pipeline 2 as base (longer transcript)")
+                logger.info("📝 Using Pipeline 2 as base (longer transcript)")
             else:
                 # Use the one with better quality (fewer missing words)
                 missing_words_1 = len(comparison_analysis.get('missing_words_pipeline1', []))
@@ -455,22 +478,22 @@ class DualPipelineService:
                 if missing_words_1 < missing_words_2:
                     base_transcript = transcript1
                     supplement_words = unique_to_2
-                    print(f"📝 Using Pipeline 1 as base (fewer missing words)")
+                    logger.info("📝 Using Pipeline 1 as base (fewer missing words)")
                 else:
                     base_transcript = transcript2
                     supplement_words = unique_to_1
-                    print(f"📝 Using Pipeline 2 as base (fewer missing words)")
+                    logger.info("📝 Using Pipeline 2 as base (fewer missing words)")
             
             # Create optimal transcript by merging
             optimal_transcript = self._merge_transcripts_intelligently(
                 base_transcript, supplement_words, comparison_analysis
             )
             
-            print(f"✅ Optimal transcript created with {len(optimal_transcript.split())} words")
+            logger.info("✅ Optimal transcript created with %s words", len(optimal_transcript.split()))
             return optimal_transcript
             
         except Exception as e:
-            print(f"❌ Error creating optimal transcript: {e}")
+            logger.error("❌ Error creating optimal transcript: %s", e)
             # Fallback to the longer transcript
             return transcript1 if len(transcript1) > len(transcript2) else transcript2
     
@@ -512,7 +535,7 @@ class DualPipelineService:
         for wrong, correct in corrections.items():
             if wrong in corrected_transcript:
                 corrected_transcript = corrected_transcript.replace(wrong, correct)
-                print(f"🔧 Applied correction: '{wrong}' → '{correct}'")
+                logger.debug("🔧 Applied correction: '%s' → '%s'", wrong, correct)
         
         return corrected_transcript
     
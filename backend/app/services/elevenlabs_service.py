@@ -1,3 +1,4 @@
+import logging
 import os
 import tempfile
 import time
@@ -7,6 +8,14 @@ import aiofiles
 import asyncio
 import httpx
 from app.core.config import settings
+from app.core.telemetry import record_provider_error, record_upload, span
+from app.utils.upload_encoding import encode_for_upload
+from app.core.logging import Truncated, get_logger
+
+logger = get_logger(__name__)
+
+# Per-word debug lines are sampled: a long file has thousands of words
+_WORD_SAMPLE = {"sample_every": 100}
 
 
 class ElevenLabsService:
@@ -17,31 +26,34 @@ class ElevenLabsService:
     
     def __init__(self):
         self.api_key = settings.ELEVENLABS_API_KEY
-        self.base_url = "https://api.elevenlabs.io/v1"
+        self.base_url = settings.ELEVENLABS_BASE_URL
         self.available = bool(self.api_key)
         
         if not self.available:
-            print("⚠️ ElevenLabs API key not set")
+            logger.warning("⚠️ ElevenLabs API key not set")
     
     async def transcribe_with_speaker_diarization(self, audio_file_path: str) -> List[Dict]:
         try:
             if not self.available:
                 return self._get_mock_transcript()
 
-            print("🎤 Calling ElevenLabs REST API...")
+            logger.info("🎤 Calling ElevenLabs REST API...")
+            
+            # Encode to the negotiated upload format (e.g. FLAC) to cut upload size
+            upload_path = await asyncio.to_thread(encode_for_upload, audio_file_path, "elevenlabs")
             
             # Get file extension to determine MIME type
-            file_extension = os.path.splitext(audio_file_path)[1].lower()
+            file_extension = os.path.splitext(upload_path)[1].lower()
             mime_type = self._get_mime_type(file_extension)
             
-            print(f"📁 Processing file: {audio_file_path} (format: {file_extension})")
+            logger.info("📁 Processing file: %s (format: %s)", upload_path, file_extension)
             
             # Prepare the multipart form data
-            async with aiofiles.open(audio_file_path, 'rb') as f:
+            async with aiofiles.open(upload_path, 'rb') as f:
                 audio_data = await f.read()
             
             # Use original filename with proper MIME type
-            original_filename = os.path.basename(audio_file_path)
+            original_filename = os.path.basename(upload_path)
             
             files = {
                 'file': (original_filename, audio_data, mime_type)
@@ -79,44 +91,49 @@ class ElevenLabsService:
                 'xi-api-key': self.api_key
             }
             
-            print(f"🎤 Sending {len(audio_data)} bytes to ElevenLabs API...")
+            logger.info("🎤 Sending %s bytes to ElevenLabs API...", len(audio_data))
             
             async with httpx.AsyncClient() as client:
                 for i, config in enumerate(configs_to_try):
-                    print(f"🎤 Trying configuration {i+1}: {config}")
+                    logger.info("🎤 Trying configuration %s: %s", i + 1, config)
                     
-                    response = await client.post(
-                        f"{self.base_url}/speech-to-text",
-                        headers=headers,
-                        files=files,
-                        data=config,
-                        timeout=300.0
-                    )
+                    record_upload("elevenlabs", len(audio_data))
+                    with span("elevenlabs"):
+                        response = await client.post(
+                            f"{self.base_url}/speech-to-text",
+                            headers=headers,
+                            files=files,
+                            data=config,
+                            timeout=300.0
+                        )
                     
-                    print(f"🎤 ElevenLabs API response: {response.status_code}")
+                    logger.info("🎤 ElevenLabs API response: %s", response.status_code)
                     
                     if response.status_code == 200:
                         result = response.json()
-                        print(f"✅ ElevenLabs transcription successful with config {i+1}")
-                        print(f"🔍 Raw ElevenLabs response: {result}")
+                        logger.info("✅ ElevenLabs transcription successful with config %s", i + 1)
+                        logger.debug("🔍 Raw ElevenLabs response: %s", Truncated(result))
                         
                         parsed_result = self._parse_transcription_result(result)
                         
                         # Check if the result contains actual speech content
                         if self._has_meaningful_content(parsed_result):
-                            print(f"✅ Found meaningful content with config {i+1}")
+                            logger.info("✅ Found meaningful content with config %s", i + 1)
                             return parsed_result
                         else:
-                            print(f"⚠️ Config {i+1} returned no meaningful content, trying next...")
+                            logger.warning("⚠️ Config %s returned no meaningful content, trying next...", i + 1)
                     else:
-                        print(f"❌ ElevenLabs API error with config {i+1}: {response.status_code} - {response.text}")
+                        logger.error("❌ ElevenLabs API error with config %s: %s - %s",
+                                     i + 1, response.status_code, Truncated(response.text))
+                        record_provider_error("elevenlabs", f"http_{response.status_code}")
                 
                 # If all configs failed, return empty result instead of mock
-                print("❌ All ElevenLabs configurations failed")
+                logger.error("❌ All ElevenLabs configurations failed")
                 return []
                     
         except Exception as e:
-            print(f"❌ ElevenLabs failed: {e}")
+            logger.error("❌ ElevenLabs failed: %s", e)
+            record_provider_error("elevenlabs", type(e).__name__)
             return []
 
     def _get_mime_type(self, file_extension: str) -> str:
@@ -139,8 +156,6 @@ class ElevenLabsService:
     def _parse_transcription_result(self, transcription) -> List[Dict]:
         segments = []
         
-        print(f"🔍 Parsing ElevenLabs result: {transcription}")
-        
         # Handle the REST API response format
         if 'words' in transcription:
             # Group words by speaker
@@ -153,7 +168,7 @@ class ElevenLabsService:
                 start_time = word.get('start', 0.0)
                 end_time = word.get('end', 0.0)
                 
-                print(f"🔍 Word: '{text}' by speaker {speaker} at {start_time}-{end_time}")
+                logger.debug("🔍 Word: '%s' by speaker %s at %s-%s", text, speaker, start_time, end_time, extra=_WORD_SAMPLE)
                 
                 # Start new segment if speaker changes
                 if speaker != current_speaker:
@@ -196,9 +211,10 @@ class ElevenLabsService:
                 'end_time': 0.0
             })
         
-        print(f"🔍 Parsed {len(segments)} segments")
-        for i, segment in enumerate(segments):
-            print(f"🔍 Segment {i}: {segment}")
+        logger.debug("🔍 Parsed %s segments", len(segments))
+        if logger.isEnabledFor(logging.DEBUG):
+            for i, segment in enumerate(segments):
+                logger.debug("🔍 Segment %s: %s", i, Truncated(segment))
         
         return segments
 
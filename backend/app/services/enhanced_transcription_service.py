@@ -1,3 +1,4 @@
+import asyncio
 import json
 import os
 import re
@@ -7,49 +8,49 @@ from typing import Dict, List, Optional
 from difflib import SequenceMatcher
 import httpx
 from app.core.config import settings
+from app.core.telemetry import record_provider_error, span
 # Whisper processing removed as per request
 import unicodedata
-from diff_match_patch import diff_match_patch
 from rapidfuzz import fuzz
+from rapidfuzz.distance import Levenshtein
+from app.core.logging import Truncated, get_logger
+
+logger = get_logger(__name__)
+
 try:
     from tamil_tokenizer.tokenizer import tokenize as tamil_tokenize
 except ImportError:
     def tamil_tokenize(text):
         return text.split()  # fallback: space split
 
-# Import Indic transliteration
-try:
-    from indic_transliteration import sanscript
-    from indic_transliteration.sanscript import transliterate
-    INDIC_AVAILABLE = True
-except ImportError:
-    print("⚠️  indic-transliteration not available. Install with: pip install indic-transliteration")
-    INDIC_AVAILABLE = False
+# Indic transliteration (batched, memoized) for Thanglish segments
+from app.utils.transliteration import INDIC_AVAILABLE, thanglish_to_tamil
+if not INDIC_AVAILABLE:
+    logger.warning("⚠️  indic-transliteration not available. Install with: pip install indic-transliteration")
 
 from app.services.sarvam_batch_service import SarvamBatchService
+from app.services.whisper_server_service import whisper_server_service
+from app.services.sarvam_chat_gateway import sarvam_chat_gateway
+from app.services.llm_cache import llm_cache
+from app.utils.interval_index import IntervalIndex, segment_start, segment_end
+from app.utils.fuzzy_matrix import matched_anywhere
+from app.utils.token_diff import token_diff
+from app.utils import script_analysis
 from supabase_client import supabase
 
-print("🚀 Enhanced Transcription Service - Loading with Sarvam Chat integration...")
+logger.debug("🚀 Enhanced Transcription Service - Loading with Sarvam Chat integration...")
 
-# Import Sarvam client for chat functionality
-import os
-from dotenv import load_dotenv
-from sarvamai import SarvamAI
+# Bump whenever _build_chat_merge_messages changes so cached merges are not reused
+CHAT_MERGE_PROMPT_VERSION = "chat-merge-v1"
 
-load_dotenv()
-SARVAM_API_KEY = os.getenv("SARVAM_API_KEY")
-sarvam_client = None
 
-print(f"🔍 Debug - SARVAM_API_KEY exists: {bool(SARVAM_API_KEY)}")
-if SARVAM_API_KEY:
+def _is_segment_list_json(content: str) -> bool:
+    """Only well-formed merge outputs (a non-empty JSON list of segments) are cached"""
     try:
-        sarvam_client = SarvamAI(api_subscription_key=SARVAM_API_KEY)
-        print("✅ Sarvam client initialized successfully")
-    except Exception as e:
-        print(f"❌ Failed to initialize Sarvam client: {e}")
-        sarvam_client = None
-else:
-    print("⚠️ SARVAM_API_KEY not set in environment variables")
+        segments = json.loads(content.strip())
+    except ValueError:
+        return False
+    return isinstance(segments, list) and bool(segments) and all(isinstance(seg, dict) for seg in segments)
 
 
 class EnhancedTranscriptionService:
@@ -61,22 +62,26 @@ class EnhancedTranscriptionService:
     
     def __init__(self):
         # Initialize Sarvam batch service
-        self.sarvam_batch = SarvamBatchService(api_key=os.getenv("SARVAM_API_KEY", "YOUR_API_KEY"))
+        self.sarvam_batch = SarvamBatchService(api_key=settings.SARVAM_API_KEY or "YOUR_API_KEY")
     
     def _convert_thanglish_to_tamil(self, text: str) -> str:
         """Convert Thanglish (Tamil in English script) to Tamil using Indic transliteration"""
-        if not INDIC_AVAILABLE:
-            print("⚠️  Indic transliteration not available, returning original text")
-            return text
-        
-        try:
-            # Convert to Tamil using ITRANS scheme
-            tamil_text = transliterate(text, sanscript.ITRANS, sanscript.TAMIL)
-            print(f"🔄 Thanglish to Tamil: '{text}' -> '{tamil_text}'")
-            return tamil_text
-        except Exception as e:
-            print(f"❌ Transliteration failed for '{text}': {e}")
-            return text
+        return thanglish_to_tamil([text])[0]
+    
+    def _transliterate_elevenlabs(self, elevenlabs_result: List[Dict]) -> List[Dict]:
+        """Tamil-script copy of the ElevenLabs segments, transliterated in one batched call"""
+        segments = [seg for seg in elevenlabs_result or [] if seg.get("text", "").strip()]
+        tamil_texts = thanglish_to_tamil([seg.get("text", "").strip() for seg in segments])
+        return [
+            {
+                "speaker": segment.get("speaker", "Unknown"),
+                "start": segment.get("start_time", 0.0),
+                "end": segment.get("end_time", 0.0),
+                "text": tamil_text,
+                "confidence": segment.get("confidence", 0.0)
+            }
+            for segment, tamil_text in zip(segments, tamil_texts)
+        ]
     
 
     
@@ -91,11 +96,11 @@ class EnhancedTranscriptionService:
             missing_text = " ".join(missing_words)
             enhanced_text = f"{text} {missing_text}"
             
-            print(f"🔄 Inserted missing words: '{text}' -> '{enhanced_text}'")
+            logger.debug("🔄 Inserted missing words: '%s' -> '%s'", Truncated(text), Truncated(enhanced_text))
             return enhanced_text
             
         except Exception as e:
-            print(f"❌ Error inserting missing words: {e}")
+            logger.error("❌ Error inserting missing words: %s", e)
             return text
     
     def _normalize_text(self, text):
@@ -110,21 +115,21 @@ class EnhancedTranscriptionService:
         import re
         return [s.strip() for s in re.split(r'[\.।\n]', text) if s.strip()]
 
-    def _find_overlap_tokens(self, seg, sarvam_segments):
+    def _find_overlap_tokens(self, seg, sarvam_segments, index: Optional[IntervalIndex] = None):
         # Find Sarvam segment overlapping in time, else fallback to greedy string search
-        seg_start = seg.get('start', seg.get('start_time', 0.0))
-        seg_end = seg.get('end', seg.get('end_time', 0.0))
+        if index is None:
+            index = IntervalIndex(sarvam_segments)
+        seg_start = segment_start(seg)
+        seg_end = segment_end(seg)
         best = None
         best_score = 0
-        for s in sarvam_segments:
-            s_start = s.get('start', s.get('start_time', 0.0))
-            s_end = s.get('end', s.get('end_time', 0.0))
-            # Time overlap heuristic (±1s window)
-            if abs(seg_start - s_start) < 1.5 or abs(seg_end - s_end) < 1.5:
-                score = fuzz.token_sort_ratio(seg['text'], s['text'])
-                if score > best_score:
-                    best = s
-                    best_score = score
+        # Time overlap heuristic (±1.5s window on either endpoint)
+        for i in index.near(seg_start, seg_end, 1.5):
+            s = sarvam_segments[i]
+            score = fuzz.token_sort_ratio(seg['text'], s['text'])
+            if score > best_score:
+                best = s
+                best_score = score
         if best:
             return tamil_tokenize(self._normalize_text(best['text']))
         # fallback: greedy search
@@ -133,26 +138,8 @@ class EnhancedTranscriptionService:
         return []
 
     def _myers_token_diff(self, tokens1, tokens2):
-        dmp = diff_match_patch()
-        # Join tokens with \u200b (zero-width space) to avoid accidental merges
-        s1 = '\u200b'.join(tokens1)
-        s2 = '\u200b'.join(tokens2)
-        diffs = dmp.diff_main(s1, s2)
-        dmp.diff_cleanupSemantic(diffs)
-        # Split back to tokens
-        result = []
-        for op, chunk in diffs:
-            chunk_tokens = chunk.split('\u200b') if chunk else []
-            for tok in chunk_tokens:
-                if not tok:
-                    continue
-                if op == 0:
-                    result.append(('equal', tok))
-                elif op == -1:
-                    result.append(('delete', tok))
-                elif op == 1:
-                    result.append(('insert', tok))
-        return result
+        # Token-level diff (one code point per distinct token), cleanup works on whole tokens
+        return [(op, tok) for op, run in token_diff(tokens1, tokens2, cleanup=True) for tok in run]
 
     def _hybrid_merge_transcripts(self, elevenlabs, sarvam):
         # Preprocess Sarvam into segments (if diarized), else treat as one
@@ -165,11 +152,12 @@ class EnhancedTranscriptionService:
         else:
             sarvam_segments = []
             sarvam_sentences = []
+        sarvam_index = IntervalIndex(sarvam_segments)
         merged = []
         for seg in elevenlabs:
             seg_text = self._normalize_text(seg.get('text', ''))
             E_tokens = tamil_tokenize(seg_text)
-            S_tokens = self._find_overlap_tokens(seg, sarvam_segments)
+            S_tokens = self._find_overlap_tokens(seg, sarvam_segments, sarvam_index)
             diffs = self._myers_token_diff(E_tokens, S_tokens)
             merged_tokens = []
             for op, tok in diffs:
@@ -193,18 +181,12 @@ class EnhancedTranscriptionService:
         # Add any Sarvam sentences not present in any merged segment
         unused = []
         unused_segments = []
-        for i, s in enumerate(sarvam_segments):
-            s_text = s.get('text', '') if isinstance(s, dict) else s
-            s_norm = self._normalize_text(s_text)
-            found = False
-            for m in merged:
-                m_text = self._normalize_text(m['text'])
-                if s_norm in m_text:
-                    found = True
-                    break
-                if fuzz.ratio(s_norm, m_text) >= 85:
-                    found = True
-                    break
+        sarvam_texts = [s.get('text', '') if isinstance(s, dict) else s for s in sarvam_segments]
+        sarvam_norms = [self._normalize_text(t) for t in sarvam_texts]
+        merged_norms = [self._normalize_text(m['text']) for m in merged]
+        # Contained in, or fuzz.ratio >= 85 against, any merged segment
+        matched = matched_anywhere(sarvam_norms, merged_norms, 85)
+        for s, s_text, s_norm, found in zip(sarvam_segments, sarvam_texts, sarvam_norms, matched):
             if not found and s_norm:
                 if isinstance(s, dict):
                     # Diarized segment: preserve all fields
@@ -232,12 +214,16 @@ class EnhancedTranscriptionService:
         merged.sort(key=lambda seg: (seg['start'] is None, seg['start'] if seg['start'] is not None else float('inf')))
         return merged
     
-    async def _sarvam_chat_merge_transcripts(self, elevenlabs_result, sarvam_result):
+    async def _sarvam_chat_merge_transcripts(self, elevenlabs_result, sarvam_result, merge_stats: Optional[Dict] = None):
         """
         Use Sarvam Chat to intelligently compare and correct transcripts.
         Uses ElevenLabs as base and corrects with Sarvam, filling missing words from both.
+        Stretches where both providers already agree skip the LLM; merge_stats, if
+        given, receives the agreement breakdown.
         """
-        print("🔍 Starting Sarvam Chat merge function...")
+        logger.debug("🔍 Starting Sarvam Chat merge function...")
+        if merge_stats is None:
+            merge_stats = {}
         try:
             # Extract text from both transcripts
             elevenlabs_text = " ".join([seg.get('text', '') for seg in elevenlabs_result]) if elevenlabs_result else ""
@@ -247,30 +233,43 @@ class EnhancedTranscriptionService:
             else:
                 sarvam_text = str(sarvam_result or "")
             
-            print(f"🔍 ElevenLabs text length: {len(elevenlabs_text)}")
-            print(f"🔍 Sarvam text length: {len(sarvam_text)}")
+            logger.debug("🔍 ElevenLabs text length: %s", len(elevenlabs_text))
+            logger.debug("🔍 Sarvam text length: %s", len(sarvam_text))
+            
+            # Long diarized transcripts are merged in time windows, concurrently
+            if self._use_windowed_merge(elevenlabs_result, sarvam_result):
+                return await self._windowed_chat_merge(elevenlabs_result, sarvam_result, merge_stats)
+            
+            # Providers already agree on the whole transcript: nothing for the LLM to settle
+            agreement = self._text_agreement(elevenlabs_text, sarvam_text)
+            agreed = isinstance(sarvam_result, list) and bool(sarvam_result) and \
+                agreement >= settings.LLM_MERGE_AGREEMENT_THRESHOLD
+            merge_stats.update(self._agreement_stats([(1.0, agreement, not agreed)]))
+            if agreed:
+                logger.info("✅ Providers agree (%.2f), using Sarvam diarized transcript without LLM merge", agreement)
+                return [dict(seg, confidence=seg.get("confidence", 1.0)) for seg in sarvam_result]
             
             # Use Sarvam Chat to compare and correct transcripts
-            print("🔍 About to call Sarvam Chat API...")
+            logger.debug("🔍 About to call Sarvam Chat API...")
             diarized_segments = await self._get_optimal_transcript_via_chat(elevenlabs_result, sarvam_result)
             
             # Check if Sarvam Chat returned valid diarized segments
             if isinstance(diarized_segments, list) and len(diarized_segments) > 0:
-                print(f"✅ Sarvam Chat returned {len(diarized_segments)} diarized segments")
+                logger.info("✅ Sarvam Chat returned %s diarized segments", len(diarized_segments))
                 # Add confidence field if not present
                 for segment in diarized_segments:
                     if "confidence" not in segment:
                         segment["confidence"] = 1.0
                 return diarized_segments
             else:
-                print("⚠️ Sarvam Chat failed to return valid diarized segments, using fallback")
+                logger.warning("⚠️ Sarvam Chat failed to return valid diarized segments, using fallback")
                 # Use professional merge fallback
                 optimal_text = self._professional_intelligent_merge_fallback(elevenlabs_text, sarvam_text)
         
             # Create diarized final transcript structure using Sarvam diarization with merged text
             if isinstance(sarvam_result, list) and len(sarvam_result) > 1:
                 # Use Sarvam diarization structure but distribute the merged text across segments
-                print(f"🔍 Using Sarvam diarization structure with {len(sarvam_result)} segments")
+                logger.debug("🔍 Using Sarvam diarization structure with %s segments", len(sarvam_result))
                 
                 # Split the optimal text into sentences for distribution
                 sentences = self._split_text_into_sentences(optimal_text)
@@ -297,7 +296,7 @@ class EnhancedTranscriptionService:
                         "confidence": 1.0
                     })
                 
-                print(f"✅ Sarvam Chat merge completed with diarization. Segments: {len(final_transcript)}")
+                logger.info("✅ Sarvam Chat merge completed with diarization. Segments: %s", len(final_transcript))
             else:
                 # Fallback to single segment if no diarization available
                 final_transcript = [{
@@ -307,12 +306,12 @@ class EnhancedTranscriptionService:
                     "end": 0.0,
                     "confidence": 1.0
                 }]
-                print(f"✅ Sarvam Chat merge completed. Single segment: {optimal_text[:100]}...")
+                logger.info("✅ Sarvam Chat merge completed. Single segment: %s", Truncated(optimal_text, 100))
         
             return final_transcript
             
         except Exception as e:
-            print(f"❌ Error in Sarvam Chat merge: {e}")
+            logger.error("❌ Error in Sarvam Chat merge: %s", e)
             # Fallback to professional intelligent merge
             elevenlabs_text = " ".join([seg.get('text', '') for seg in elevenlabs_result]) if elevenlabs_result else ""
             if isinstance(sarvam_result, list):
@@ -335,139 +334,51 @@ class EnhancedTranscriptionService:
         """
         Use Sarvam Chat API to compare and correct transcripts.
         """
-        print("🔍 Entering _get_optimal_transcript_via_chat function")
+        logger.debug("🔍 Entering _get_optimal_transcript_via_chat function")
+        
+        elevenlabs_text = " ".join([seg.get('text', '') for seg in elevenlabs_result]) if elevenlabs_result else ""
+        if isinstance(sarvam_result, list):
+            sarvam_text = " ".join([seg.get('text', '') for seg in sarvam_result])
+        else:
+            sarvam_text = str(sarvam_result or "")
         
         try:
-            # Create a fresh Sarvam client instance to ensure proper initialization
-            if not SARVAM_API_KEY:
-                print("⚠️ SARVAM_API_KEY not available")
+            if not sarvam_chat_gateway.available:
+                logger.warning("⚠️ SARVAM_API_KEY not available")
                 # Fallback to longer transcript
-                elevenlabs_text = " ".join([seg.get('text', '') for seg in elevenlabs_result]) if elevenlabs_result else ""
-                if isinstance(sarvam_result, list):
-                    sarvam_text = " ".join([seg.get('text', '') for seg in sarvam_result])
-                else:
-                    sarvam_text = str(sarvam_result or "")
                 return sarvam_text if len(sarvam_text) > len(elevenlabs_text) else elevenlabs_text
             
-            fresh_client = SarvamAI(api_subscription_key=SARVAM_API_KEY)
-            print("🔍 Fresh Sarvam client created for Chat API")
+            logger.debug("🔍 Preparing Sarvam Chat messages with professional diarized merging prompt...")
+            messages = self._build_chat_merge_messages(elevenlabs_result, sarvam_result)
             
-            # Format ElevenLabs transcript for the prompt
-            elevenlabs_formatted = ""
-            if elevenlabs_result:
-                for i, seg in enumerate(elevenlabs_result):
-                    elevenlabs_formatted += f"Segment {i+1}: Speaker: {seg.get('speaker', 'Unknown')}, Start: {seg.get('start_time', 0):.2f}s, End: {seg.get('end_time', 0):.2f}s\nText: {seg.get('text', '')}\n\n"
-            
-            # Format Sarvam diarized transcript for the prompt
-            sarvam_formatted = ""
-            if isinstance(sarvam_result, list):
-                for i, seg in enumerate(sarvam_result):
-                    sarvam_formatted += f"Segment {i+1}: Speaker: {seg.get('speaker', 'Unknown')}, Start: {seg.get('start', 0):.2f}s, End: {seg.get('end', 0):.2f}s\nText: {seg.get('text', '')}\n\n"
+            logger.debug("🔍 Attempting Sarvam Chat API call...")
             
-            print("🔍 Preparing Sarvam Chat messages with professional diarized merging prompt...")
-            messages = [
-                {
-                    "role": "system",
-                    "content": (
-                        "Act as a professional text merging and diarization expert. You specialize in analyzing and merging Tamil transcripts with speaker diarization to create the most accurate, natural, and coherent final output. "
-                        "Your expertise includes: Tamil grammar and syntax, natural language flow, contextual understanding, speaker voice preservation, technical accuracy, and diarization formatting. "
-                        "Always prioritize coherence and readability while maintaining the authentic voice and emotional expressions of each speaker."
-                    )
-                },
-                {
-                    "role": "user",
-                    "content": (
-                        "Analyze the following two diarized Tamil transcripts and create an optimally merged transcript with proper diarization. Pay special attention to WORD-LEVEL ACCURACY:\n\n"
-                        f"**ElevenLabs Transcript (Primary Source):**\n{elevenlabs_formatted}\n"
-                        f"**Sarvam Diarized Transcript (Secondary Source - Higher Tamil Accuracy):**\n{sarvam_formatted}\n"
-                        "**Critical Requirements:**\n"
-                        "- **WORD-LEVEL COMPARISON**: Compare each word between transcripts and select the most accurate Tamil word\n"
-                        "- **Prioritize Sarvam words for Tamil accuracy**: When words differ (e.g., 'அவர் ரண்டி' vs 'அவரு வண்டி'), choose the Sarvam version ('அவரு வண்டி') as it's more accurate\n"
-                        "- **Correct spelling and grammar**: Fix any TTS errors, wrong spellings, or grammatical mistakes\n"
-                        "- **Maintain accurate speaker identification and timing from Sarvam diarization**\n"
-                        "- **Preserve original speaker's voice and emotional expressions**\n"
-                        "- **Standardize numerical values**: Use digit format with ₹ symbol (₹20 instead of இருபது ரூபாய்)\n"
-                        "- **Resolve TTS errors**: Fix any transcription artifacts or inconsistencies\n"
-                        "- **Preserve contextual details**: Keep all important narrative flow and context\n"
-                        "- **Handle Tanglish appropriately**: Keep English technical terms as-is when contextually correct\n"
-                        "- **Ensure natural flow**: Prioritize coherence and readability\n\n"
-                        "**Word Selection Priority:**\n"
-                        "1. If Sarvam has a different word, prefer Sarvam's version (it's usually more accurate for Tamil)\n"
-                        "2. If ElevenLabs has additional context or words missing in Sarvam, include them\n"
-                        "3. Always choose the word that makes the most grammatical and contextual sense\n\n"
-                        "**Output Format:** Return a JSON array of segments in this exact format:\n"
-                        "[\n"
-                        "  {\"text\": \"merged text for segment 1\", \"speaker\": \"speaker_id\", \"start\": 0.0, \"end\": 5.0},\n"
-                        "  {\"text\": \"merged text for segment 2\", \"speaker\": \"speaker_id\", \"start\": 5.0, \"end\": 10.0}\n"
-                        "]\n\n"
-                        "**Output ONLY the JSON array with merged diarized segments. No explanations or additional text.**"
-                    )
-                }
-            ]
-            
-            # Check if Chat API is available in the SDK
-            if not hasattr(fresh_client, 'chat'):
-                print("🔍 Chat API not available in current SDK version, using professional intelligent fallback merging...")
-                # Professional intelligent fallback: merge transcripts using the same logic as the professional prompt
-                optimal_transcript = self._professional_intelligent_merge_fallback(elevenlabs_text, sarvam_text)
-                print(f"✅ Intelligent merge completed. Length: {len(optimal_transcript)}")
-                print(f"🔍 Merged transcript: {optimal_transcript}")
-                return optimal_transcript
-            
-            print("🔍 Attempting Sarvam Chat API call...")
-            
-            # Make the actual Chat API call
-            response = fresh_client.chat.completions(
-                messages=messages,
+            # Shared async gateway: pooled connections, retries, does not block the event loop
+            response_content = (await sarvam_chat_gateway.complete(
+                messages,
                 max_tokens=2000,
-                temperature=0.1
-            )
-            
-            print(f"🔍 Chat API response received: {response}")
+                temperature=0.1,
+                prompt_version=CHAT_MERGE_PROMPT_VERSION,
+                cache_if=_is_segment_list_json
+            )).strip()
+            logger.debug("🔍 Chat API response: %s", Truncated(response_content, 200))
             
-            # Extract the merged diarized transcript from the response
-            if response and hasattr(response, 'choices') and len(response.choices) > 0:
-                response_content = response.choices[0].message.content.strip()
-                print(f"🔍 Chat API response: {response_content[:200]}...")
+            try:
+                # Parse JSON response
+                diarized_segments = json.loads(response_content)
                 
-                try:
-                    # Parse JSON response
-                    import json
-                    diarized_segments = json.loads(response_content)
+                # Validate the response format
+                if isinstance(diarized_segments, list) and len(diarized_segments) > 0:
+                    logger.info("✅ Sarvam Chat API merge completed with %s diarized segments", len(diarized_segments))
+                    return diarized_segments
+                else:
+                    logger.warning("⚠️ Invalid JSON format from Chat API, using fallback")
+                    raise ValueError("Invalid JSON format")
                     
-                    # Validate the response format
-                    if isinstance(diarized_segments, list) and len(diarized_segments) > 0:
-                        print(f"✅ Sarvam Chat API merge completed with {len(diarized_segments)} diarized segments")
-                        return diarized_segments
-                    else:
-                        print("⚠️ Invalid JSON format from Chat API, using fallback")
-                        raise ValueError("Invalid JSON format")
-                        
-                except (json.JSONDecodeError, ValueError) as e:
-                    print(f"⚠️ Failed to parse JSON response: {e}")
-                    print(f"🔍 Raw response: {response_content}")
-                    # Fallback to professional merge
-                    elevenlabs_text = " ".join([seg.get('text', '') for seg in elevenlabs_result]) if elevenlabs_result else ""
-                    if isinstance(sarvam_result, list):
-                        sarvam_text = " ".join([seg.get('text', '') for seg in sarvam_result])
-                    else:
-                        sarvam_text = str(sarvam_result or "")
-                    optimal_text = self._professional_intelligent_merge_fallback(elevenlabs_text, sarvam_text)
-                    return [{
-                        "text": optimal_text,
-                        "speaker": "speaker_0",
-                        "start": 0.0,
-                        "end": 0.0,
-                        "confidence": 1.0
-                    }]
-            else:
-                print("⚠️ Invalid response from Chat API, using fallback")
+            except (json.JSONDecodeError, ValueError) as e:
+                logger.warning("⚠️ Failed to parse JSON response: %s", e)
+                logger.debug("🔍 Raw response: %s", Truncated(response_content))
                 # Fallback to professional merge
-                elevenlabs_text = " ".join([seg.get('text', '') for seg in elevenlabs_result]) if elevenlabs_result else ""
-                if isinstance(sarvam_result, list):
-                    sarvam_text = " ".join([seg.get('text', '') for seg in sarvam_result])
-                else:
-                    sarvam_text = str(sarvam_result or "")
                 optimal_text = self._professional_intelligent_merge_fallback(elevenlabs_text, sarvam_text)
                 return [{
                     "text": optimal_text,
@@ -478,17 +389,231 @@ class EnhancedTranscriptionService:
                 }]
             
         except Exception as e:
-            print(f"❌ Error in Sarvam Chat API: {e}")
+            logger.error("❌ Error in Sarvam Chat API: %s", e)
             # Return longer transcript as fallback
             return sarvam_text if len(sarvam_text) > len(elevenlabs_text) else elevenlabs_text
     
+    def _build_chat_merge_messages(self, elevenlabs_result, sarvam_result) -> List[Dict]:
+        """Sarvam Chat prompt asking for a merged diarized transcript as a JSON array"""
+        # Format ElevenLabs transcript for the prompt
+        elevenlabs_formatted = ""
+        if elevenlabs_result:
+            for i, seg in enumerate(elevenlabs_result):
+                elevenlabs_formatted += f"Segment {i+1}: Speaker: {seg.get('speaker', 'Unknown')}, Start: {seg.get('start_time', 0):.2f}s, End: {seg.get('end_time', 0):.2f}s\nText: {seg.get('text', '')}\n\n"
+        
+        # Format Sarvam diarized transcript for the prompt
+        sarvam_formatted = ""
+        if isinstance(sarvam_result, list):
+            for i, seg in enumerate(sarvam_result):
+                sarvam_formatted += f"Segment {i+1}: Speaker: {seg.get('speaker', 'Unknown')}, Start: {seg.get('start', 0):.2f}s, End: {seg.get('end', 0):.2f}s\nText: {seg.get('text', '')}\n\n"
+        
+        messages = [
+            {
+                "role": "system",
+                "content": (
+                    "Act as a professional text merging and diarization expert. You specialize in analyzing and merging Tamil transcripts with speaker diarization to create the most accurate, natural, and coherent final output. "
+                    "Your expertise includes: Tamil grammar and syntax, natural language flow, contextual understanding, speaker voice preservation, technical accuracy, and diarization formatting. "
+                    "Always prioritize coherence and readability while maintaining the authentic voice and emotional expressions of each speaker."
+                )
+            },
+            {
+                "role": "user",
+                "content": (
+                    "Analyze the following two diarized Tamil transcripts and create an optimally merged transcript with proper diarization. Pay special attention to WORD-LEVEL ACCURACY:\n\n"
+                    f"**ElevenLabs Transcript (Primary Source):**\n{elevenlabs_formatted}\n"
+                    f"**Sarvam Diarized Transcript (Secondary Source - Higher Tamil Accuracy):**\n{sarvam_formatted}\n"
+                    "**Critical Requirements:**\n"
+                    "- **WORD-LEVEL COMPARISON**: Compare each word between transcripts and select the most accurate Tamil word\n"
+                    "- **Prioritize Sarvam words for Tamil accuracy**: When words differ (e.g., 'அவர் ரண்டி' vs 'அவரு வண்டி'), choose the Sarvam version ('அவரு வண்டி') as it's more accurate\n"
+                    "- **Correct spelling and grammar**: Fix any TTS errors, wrong spellings, or grammatical mistakes\n"
+                    "- **Maintain accurate speaker identification and timing from Sarvam diarization**\n"
+                    "- **Preserve original speaker's voice and emotional expressions**\n"
+                    "- **Standardize numerical values**: Use digit format with ₹ symbol (₹20 instead of இருபது ரூபாய்)\n"
+                    "- **Resolve TTS errors**: Fix any transcription artifacts or inconsistencies\n"
+                    "- **Preserve contextual details**: Keep all important narrative flow and context\n"
+                    "- **Handle Tanglish appropriately**: Keep English technical terms as-is when contextually correct\n"
+                    "- **Ensure natural flow**: Prioritize coherence and readability\n\n"
+                    "**Word Selection Priority:**\n"
+                    "1. If Sarvam has a different word, prefer Sarvam's version (it's usually more accurate for Tamil)\n"
+                    "2. If ElevenLabs has additional context or words missing in Sarvam, include them\n"
+                    "3. Always choose the word that makes the most grammatical and contextual sense\n\n"
+                    "**Output Format:** Return a JSON array of segments in this exact format:\n"
+                    "[\n"
+                    "  {\"text\": \"merged text for segment 1\", \"speaker\": \"speaker_id\", \"start\": 0.0, \"end\": 5.0},\n"
+                    "  {\"text\": \"merged text for segment 2\", \"speaker\": \"speaker_id\", \"start\": 5.0, \"end\": 10.0}\n"
+                    "]\n\n"
+                    "**Output ONLY the JSON array with merged diarized segments. No explanations or additional text.**"
+                )
+            }
+        ]
+        return messages
+    
+    def _use_windowed_merge(self, elevenlabs_result, sarvam_result) -> bool:
+        """Windowed merge needs timed Sarvam segments and a transcript longer than one window"""
+        if settings.LLM_MERGE_MODE != "windowed" or not isinstance(sarvam_result, list) or not sarvam_result:
+            return False
+        if any(seg.get('start') is None or seg.get('end') is None for seg in sarvam_result):
+            return False
+        duration = max(segment_end(seg) for seg in [*(elevenlabs_result or []), *sarvam_result])
+        return duration > settings.LLM_MERGE_WINDOW_SECONDS
+    
+    def _build_merge_windows(self, elevenlabs_result, sarvam_result) -> List[Dict]:
+        """
+        Cut both diarized transcripts into aligned time windows. Each window owns
+        [start, end) and also sees segments within the overlap on either side.
+        """
+        window_seconds = settings.LLM_MERGE_WINDOW_SECONDS
+        overlap = settings.LLM_MERGE_WINDOW_OVERLAP_SECONDS
+        duration = max(segment_end(seg) for seg in [*elevenlabs_result, *sarvam_result])
+        elevenlabs_index = IntervalIndex(elevenlabs_result)
+        sarvam_index = IntervalIndex(sarvam_result)
+        
+        def in_context(segments, index, context_start, context_end):
+            # Segments whose midpoint falls inside the window including its overlap
+            return [
+                segments[i] for i in index.overlapping(context_start, context_end)
+                if context_start <= (segment_start(segments[i]) + segment_end(segments[i])) / 2 <= context_end
+            ]
+        
+        windows = []
+        start = 0.0
+        while start < duration:
+            end = start + window_seconds
+            context_start, context_end = max(0.0, start - overlap), end + overlap
+            windows.append({
+                "start": start,
+                "end": end,
+                "context_start": context_start,
+                "context_end": context_end,
+                "elevenlabs": in_context(elevenlabs_result, elevenlabs_index, context_start, context_end),
+                "sarvam": in_context(sarvam_result, sarvam_index, context_start, context_end),
+            })
+            start = end
+        # The last window owns anything the model timestamps past the end
+        windows[-1]["end"] = float("inf")
+        return windows
+    
+    def _text_agreement(self, elevenlabs_text: str, sarvam_text: str) -> float:
+        """Word-level similarity (1 - normalized word edit distance) of two transcripts"""
+        def words(text):
+            return re.sub(r"[^\w\s\u0B80-\u0BFF]", " ", self._normalize_text(text)).lower().split()
+        elevenlabs_words, sarvam_words = words(elevenlabs_text), words(sarvam_text)
+        if not elevenlabs_words and not sarvam_words:
+            return 1.0
+        return Levenshtein.normalized_similarity(elevenlabs_words, sarvam_words)
+    
+    def _owned_segments(self, segments: List[Dict], window: Dict) -> List[Dict]:
+        """Segments of a window's context whose midpoint falls in the part of the audio it owns"""
+        return [
+            seg for seg in segments
+            if window["start"] <= (segment_start(seg) + segment_end(seg)) / 2 < window["end"]
+        ]
+    
+    def _agreement_stats(self, windows) -> Dict:
+        """Summarize (seconds, agreement, used_llm) per window into the processing_info breakdown"""
+        total = sum(seconds for seconds, _, _ in windows)
+        llm_seconds = sum(seconds for seconds, _, used_llm in windows if used_llm)
+        return {
+            "windows": len(windows),
+            "llm_windows": sum(1 for _, _, used_llm in windows if used_llm),
+            "agreement_threshold": settings.LLM_MERGE_AGREEMENT_THRESHOLD,
+            "mean_agreement": round(sum(a for _, a, _ in windows) / len(windows), 4) if windows else 0.0,
+            "llm_audio_share": round(llm_seconds / total, 4) if total else 0.0,
+        }
+    
+    async def _chat_merge_window(self, elevenlabs_segments: List[Dict], sarvam_segments: List[Dict]) -> Optional[List[Dict]]:
+        """Sarvam Chat merge of one window; None if the call or its JSON output fails"""
+        try:
+            content = await sarvam_chat_gateway.complete(
+                self._build_chat_merge_messages(elevenlabs_segments, sarvam_segments),
+                max_tokens=2000,
+                temperature=0.1,
+                prompt_version=CHAT_MERGE_PROMPT_VERSION,
+                cache_if=_is_segment_list_json
+            )
+            segments = json.loads(content.strip())
+            if isinstance(segments, list) and segments and all(isinstance(seg, dict) for seg in segments):
+                return segments
+            logger.warning("⚠️ Invalid JSON format from Chat API for window")
+        except Exception as e:
+            logger.warning("⚠️ Window chat merge failed: %s", e)
+        return None
+    
+    def _fallback_merge_window(self, elevenlabs_segments: List[Dict], sarvam_segments: List[Dict]) -> List[Dict]:
+        """Rule-based merge of one window, same as the single-call fallback"""
+        elevenlabs_text = " ".join(seg.get('text', '') for seg in elevenlabs_segments)
+        sarvam_text = " ".join(seg.get('text', '') for seg in sarvam_segments)
+        optimal_text = self._professional_intelligent_merge_fallback(elevenlabs_text, sarvam_text)
+        if elevenlabs_segments and optimal_text:
+            return self._distribute_sarvam_text(elevenlabs_segments, optimal_text)
+        return [dict(seg, confidence=seg.get('confidence', 1.0)) for seg in sarvam_segments]
+    
+    async def _merge_window(self, window: Dict, semaphore: asyncio.Semaphore) -> List[Dict]:
+        """Merge one window through Sarvam Chat (falling back on its own) and keep the segments it owns"""
+        window["used_llm"] = False
+        if not window["elevenlabs"] and not window["sarvam"]:
+            return []
+        
+        # High-agreement windows take Sarvam's segments as they are
+        owned_sarvam = self._owned_segments(window["sarvam"], window)
+        window["agreement"] = self._text_agreement(
+            " ".join(seg.get('text', '') for seg in self._owned_segments(window["elevenlabs"], window)),
+            " ".join(seg.get('text', '') for seg in owned_sarvam)
+        )
+        if owned_sarvam and window["agreement"] >= settings.LLM_MERGE_AGREEMENT_THRESHOLD:
+            return [dict(seg, confidence=seg.get('confidence', 1.0)) for seg in owned_sarvam]
+        
+        window["used_llm"] = True
+        segments = None
+        if sarvam_chat_gateway.available:
+            async with semaphore:
+                segments = await self._chat_merge_window(window["elevenlabs"], window["sarvam"])
+        if segments is None:
+            logger.warning("⚠️ Window %.0fs: using professional merge fallback", window['start'])
+            segments = self._fallback_merge_window(window["elevenlabs"], window["sarvam"])
+        
+        # Overlap segments are produced by both neighbours; the window holding the midpoint keeps them
+        owned = []
+        for segment in segments:
+            midpoint = (segment_start(segment) + segment_end(segment)) / 2
+            if not window["context_start"] <= midpoint <= window["context_end"]:
+                # Inputs all sit inside the context, so this timestamp is missing or made up: keep it here
+                midpoint = window["start"]
+            if window["start"] <= midpoint < window["end"]:
+                segment.setdefault("confidence", 1.0)
+                owned.append(segment)
+        return owned
+    
+    async def _windowed_chat_merge(self, elevenlabs_result: List[Dict], sarvam_result: List[Dict],
+                                   merge_stats: Optional[Dict] = None) -> List[Dict]:
+        """Merge long transcripts window by window, with concurrent chat calls under a per-merge cap"""
+        windows = self._build_merge_windows(elevenlabs_result or [], sarvam_result)
+        duration = max(segment_end(seg) for seg in [*(elevenlabs_result or []), *sarvam_result])
+        logger.debug("🔍 Windowed Sarvam Chat merge: %s windows of %ss, concurrency %s",
+                     len(windows), settings.LLM_MERGE_WINDOW_SECONDS, settings.LLM_MERGE_CONCURRENCY)
+        semaphore = asyncio.Semaphore(settings.LLM_MERGE_CONCURRENCY)
+        results = await asyncio.gather(*(self._merge_window(window, semaphore) for window in windows))
+        merged = [segment for window_segments in results for segment in window_segments]
+        merged.sort(key=segment_start)
+        
+        stats = self._agreement_stats([
+            (min(window["end"], duration) - window["start"], window.get("agreement", 1.0), window["used_llm"])
+            for window in windows
+        ])
+        if merge_stats is not None:
+            merge_stats.update(stats)
+        logger.info("✅ Windowed Sarvam Chat merge completed with %s segments (%s/%s windows needed the LLM)",
+                    len(merged), stats['llm_windows'], stats['windows'])
+        return merged
+    
     def _professional_intelligent_merge_fallback(self, elevenlabs_text: str, sarvam_text: str) -> str:
         """
         Professional intelligent fallback merging that follows the same requirements as the professional prompt.
         Uses ElevenLabs as base text and integrates unique content from Sarvam as supplementary text.
         """
         try:
-            print(f"🎭 Professional merge: Base Text ({len(elevenlabs_text)} chars) + Supplementary ({len(sarvam_text)} chars)")
+            logger.info("🎭 Professional merge: Base Text (%s chars) + Supplementary (%s chars)",
+                        len(elevenlabs_text), len(sarvam_text))
             
             # Use ElevenLabs as the foundation (Base Text)
             base_text = elevenlabs_text
@@ -503,11 +628,11 @@ class EnhancedTranscriptionService:
             # Step 3: Apply professional optimizations
             merged_transcript = self._apply_professional_optimizations(merged_transcript)
             
-            print("🔍 Using ElevenLabs as base with professional supplementary integration")
+            logger.debug("🔍 Using ElevenLabs as base with professional supplementary integration")
             return merged_transcript
             
         except Exception as e:
-            print(f"❌ Error in professional merge: {e}")
+            logger.error("❌ Error in professional merge: %s", e)
             # Fallback to quality-based selection
             return self._intelligent_merge_fallback(elevenlabs_text, sarvam_text)
     
@@ -529,7 +654,7 @@ class EnhancedTranscriptionService:
             return cleaned.strip()
             
         except Exception as e:
-            print(f"❌ Error cleaning base text: {e}")
+            logger.error("❌ Error cleaning base text: %s", e)
             return base_text
     
     def _integrate_supplementary_content(self, base_text: str, supplementary_text: str) -> str:
@@ -542,18 +667,18 @@ class EnhancedTranscriptionService:
             base_quality = self._calculate_tamil_quality_score(base_text)
             supp_quality = self._calculate_tamil_quality_score(supplementary_text)
             
-            print(f"🔍 Quality comparison - Base: {base_quality:.1f}, Supplementary: {supp_quality:.1f}")
+            logger.debug("🔍 Quality comparison - Base: %.1f, Supplementary: %.1f", base_quality, supp_quality)
             
             # If supplementary has significantly better quality, use it instead
             if supp_quality > base_quality * 1.2:
-                print("🔍 Supplementary text has significantly better quality, using it as primary")
+                logger.debug("🔍 Supplementary text has significantly better quality, using it as primary")
                 return supplementary_text
             
             # Otherwise, use base text with corrections
             return base_text
             
         except Exception as e:
-            print(f"❌ Error integrating supplementary content: {e}")
+            logger.error("❌ Error integrating supplementary content: %s", e)
             return base_text
     
     def _apply_professional_optimizations(self, text: str) -> str:
@@ -586,7 +711,7 @@ class EnhancedTranscriptionService:
             return optimized.strip()
             
         except Exception as e:
-            print(f"❌ Error applying professional optimizations: {e}")
+            logger.error("❌ Error applying professional optimizations: %s", e)
             return text
     
     def _intelligent_merge_fallback(self, elevenlabs_text: str, sarvam_text: str) -> str:
@@ -595,47 +720,44 @@ class EnhancedTranscriptionService:
         Combines the best elements from both transcripts using rule-based logic.
         """
         try:
-            print(f"🤖 Intelligent merge: ElevenLabs ({len(elevenlabs_text)} chars) vs Sarvam ({len(sarvam_text)} chars)")
+            logger.info("🤖 Intelligent merge: ElevenLabs (%s chars) vs Sarvam (%s chars)",
+                        len(elevenlabs_text), len(sarvam_text))
             
             # Prioritize Tamil quality over length - only use length if difference is extreme
             if len(sarvam_text) > len(elevenlabs_text) * 1.5:
-                print("🔍 Sarvam transcript is much longer, using Sarvam as base")
+                logger.debug("🔍 Sarvam transcript is much longer, using Sarvam as base")
                 return sarvam_text
             elif len(elevenlabs_text) > len(sarvam_text) * 1.5:
-                print("🔍 ElevenLabs transcript is much longer, but checking Tamil quality first...")
+                logger.debug("🔍 ElevenLabs transcript is much longer, but checking Tamil quality first...")
                 # Don't immediately return, continue to Tamil quality analysis
             
-            # Split both transcripts into words for comparison
-            elevenlabs_words = elevenlabs_text.split()
-            sarvam_words = sarvam_text.split()
-            
             # Use the transcript with more Tamil words (better for Tamil accuracy)
-            elevenlabs_tamil_count = sum(1 for word in elevenlabs_words if self._is_tamil_word(word))
-            sarvam_tamil_count = sum(1 for word in sarvam_words if self._is_tamil_word(word))
+            elevenlabs_tamil_count = script_analysis.analyze(elevenlabs_text).tamil_words
+            sarvam_tamil_count = script_analysis.analyze(sarvam_text).tamil_words
             
-            print(f"🔍 Tamil words - ElevenLabs: {elevenlabs_tamil_count}, Sarvam: {sarvam_tamil_count}")
+            logger.debug("🔍 Tamil words - ElevenLabs: %s, Sarvam: %s", elevenlabs_tamil_count, sarvam_tamil_count)
             
             # Check for Tamil quality indicators
             sarvam_quality_score = self._calculate_tamil_quality_score(sarvam_text)
             elevenlabs_quality_score = self._calculate_tamil_quality_score(elevenlabs_text)
             
-            print(f"🔍 Quality scores - ElevenLabs: {elevenlabs_quality_score}, Sarvam: {sarvam_quality_score}")
+            logger.debug("🔍 Quality scores - ElevenLabs: %s, Sarvam: %s", elevenlabs_quality_score, sarvam_quality_score)
             
             # If Sarvam has better Tamil quality or more Tamil words, prefer it
             if (sarvam_quality_score > elevenlabs_quality_score or 
                 sarvam_tamil_count > elevenlabs_tamil_count * 0.9):
-                print("🔍 Sarvam has better Tamil quality, using Sarvam transcript")
+                logger.debug("🔍 Sarvam has better Tamil quality, using Sarvam transcript")
                 return sarvam_text
             
             # If ElevenLabs has better structure, use it as base with corrections
             base_transcript = elevenlabs_text
             corrected_transcript = self._apply_intelligent_corrections(base_transcript, sarvam_text)
             
-            print("🔍 Using ElevenLabs as base with intelligent corrections")
+            logger.debug("🔍 Using ElevenLabs as base with intelligent corrections")
             return corrected_transcript
             
         except Exception as e:
-            print(f"❌ Error in intelligent merge: {e}")
+            logger.error("❌ Error in intelligent merge: %s", e)
             # Fallback to longer transcript
             return sarvam_text if len(sarvam_text) > len(elevenlabs_text) else elevenlabs_text
     
@@ -643,8 +765,7 @@ class EnhancedTranscriptionService:
         """
         Check if a word contains Tamil characters.
         """
-        tamil_range = range(0x0B80, 0x0BFF)  # Tamil Unicode range
-        return any(ord(char) in tamil_range for char in word)
+        return script_analysis.is_tamil_word(word)
     
     def _calculate_tamil_quality_score(self, text: str) -> float:
         """
@@ -656,13 +777,9 @@ class EnhancedTranscriptionService:
                 return 0.0
             
             score = 0.0
-            words = text.split()
             
-            # Count Tamil words
-            tamil_words = sum(1 for word in words if self._is_tamil_word(word))
-            if len(words) > 0:
-                tamil_ratio = tamil_words / len(words)
-                score += tamil_ratio * 10  # Base score from Tamil content
+            # Base score from Tamil content
+            score += script_analysis.analyze(text).tamil_word_ratio * 10
             
             # Check for proper word formations (no broken spacing)
             broken_words = len(re.findall(r'\S\s+\S(?=\S)', text))  # Words with spaces in middle
@@ -684,7 +801,7 @@ class EnhancedTranscriptionService:
             return max(0.0, score)  # Ensure non-negative score
             
         except Exception as e:
-            print(f"❌ Error calculating Tamil quality score: {e}")
+            logger.error("❌ Error calculating Tamil quality score: %s", e)
             return 0.0
     
     def _apply_intelligent_corrections(self, base_text: str, reference_text: str) -> str:
@@ -709,7 +826,7 @@ class EnhancedTranscriptionService:
             return corrected.strip()
             
         except Exception as e:
-            print(f"❌ Error applying corrections: {e}")
+            logger.error("❌ Error applying corrections: %s", e)
             return base_text
     
     def _split_text_into_sentences(self, text: str) -> List[str]:
@@ -741,26 +858,29 @@ class EnhancedTranscriptionService:
             return sentences
             
         except Exception as e:
-            print(f"❌ Error splitting text into sentences: {e}")
+            logger.error("❌ Error splitting text into sentences: %s", e)
             return [text]
 
-    async def process_enhanced_transcription(self, audio_file_path: str) -> Dict:
+    async def process_enhanced_transcription(self, audio_file_path: str, include_transliteration: bool = True) -> Dict:
         """
-        Main method to process audio through all three pipelines
+        Main method to process audio through all three pipelines.
+        include_transliteration=False skips building transliterated_elevenlabs.
         """
         try:
-            print("🔄 Starting enhanced transcription pipeline...")
+            logger.info("🔄 Starting enhanced transcription pipeline...")
             
             # Step 1: Prepare audio (convert to mono WAV at 16kHz) for Sarvam and ElevenLabs
-            prepared_audio = await self._prepare_audio(audio_file_path)
+            with span("ffmpeg_prepare"):
+                prepared_audio = await self._prepare_audio(audio_file_path)
             
             # Step 2: Get ElevenLabs transcript with speaker diarization (now uses prepared WAV)
             elevenlabs_result = await self._get_elevenlabs_transcript(prepared_audio)
             
             # Step 3: Get Sarvam transcript for Tamil accuracy (uses prepared WAV)
-            sarvam_transcript, sarvam_diarized = await self.sarvam_batch.batch_transcribe(
-                prepared_audio, language_code="ta-IN", diarization=True
-            )
+            with span("sarvam_batch"):
+                sarvam_transcript, sarvam_diarized = await self.sarvam_batch.batch_transcribe(
+                    prepared_audio, language_code="ta-IN", diarization=True
+                )
             if sarvam_diarized and "entries" in sarvam_diarized:
                 sarvam_diarized_entries = [
                     {
@@ -776,30 +896,23 @@ class EnhancedTranscriptionService:
 
             # --- Fallback logic: use Sarvam diarized if ElevenLabs is not in Tamil ---
             elevenlabs_text = " ".join([seg.get("text", "") for seg in elevenlabs_result]) if elevenlabs_result else ""
-            if not self._is_tamil(elevenlabs_text):
-                print("⚠️ ElevenLabs output is not in Tamil. Using Sarvam diarized transcript as final transcript.")
-                final_transcript = sarvam_diarized_entries if isinstance(sarvam_diarized_entries, list) else []
-            else:
-                # Always use Sarvam Chat to intelligently merge transcripts
-                print("🤖 Using Sarvam Chat to merge and correct transcripts...")
-                final_transcript = await self._sarvam_chat_merge_transcripts(
-                    elevenlabs_result, sarvam_diarized_entries
-                )
+            merge_stats = {}
+            with llm_cache.track() as llm_cache_stats, span("llm_merge"):
+                if not self._is_tamil(elevenlabs_text):
+                    logger.warning("⚠️ ElevenLabs output is not in Tamil. Using Sarvam diarized transcript as final transcript.")
+                    final_transcript = sarvam_diarized_entries if isinstance(sarvam_diarized_entries, list) else []
+                else:
+                    # Always use Sarvam Chat to intelligently merge transcripts
+                    logger.info("🤖 Using Sarvam Chat to merge and correct transcripts...")
+                    final_transcript = await self._sarvam_chat_merge_transcripts(
+                        elevenlabs_result, sarvam_diarized_entries, merge_stats
+                    )
 
             # Transliterated ElevenLabs (optional)
             transliterated_elevenlabs = []
-            if elevenlabs_result:
-                for segment in elevenlabs_result:
-                    original_text = segment.get("text", "").strip()
-                    if original_text:
-                        tamil_text = self._convert_thanglish_to_tamil(original_text)
-                        transliterated_elevenlabs.append({
-                            "speaker": segment.get("speaker", "Unknown"),
-                            "start": segment.get("start_time", 0.0),
-                            "end": segment.get("end_time", 0.0),
-                            "text": tamil_text,
-                            "confidence": segment.get("confidence", 0.0)
-                        })
+            if include_transliteration and elevenlabs_result:
+                with span("transliteration"):
+                    transliterated_elevenlabs = self._transliterate_elevenlabs(elevenlabs_result)
             # Extract the merged transcript text for display
             merged_transcript_text = ""
             if final_transcript and len(final_transcript) > 0:
@@ -819,11 +932,14 @@ class EnhancedTranscriptionService:
                     "prepared_file": prepared_audio,
                     "whisper_disabled": True,
                     "merge_method": "professional_intelligent_fallback",
-                    "merge_details": "Used professional rule-based merging following expert prompt requirements"
+                    "merge_details": "Used professional rule-based merging following expert prompt requirements",
+                    "llm_cache": llm_cache_stats,
+                    "llm_audio_share": merge_stats.get("llm_audio_share", 0.0),
+                    "merge_agreement": merge_stats
                 }
             }
         except Exception as e:
-            print(f"❌ Error in enhanced transcription: {e}")
+            logger.error("❌ Error in enhanced transcription: %s", e)
             return {
                 "success": False,
                 "error": str(e),
@@ -838,7 +954,7 @@ class EnhancedTranscriptionService:
             base_name = os.path.splitext(os.path.basename(audio_file_path))[0]
             prepared_audio = os.path.join(temp_dir, f"prepared_{base_name}.wav")
             
-            print(f"🔄 Converting audio to WAV format: {audio_file_path} -> {prepared_audio}")
+            logger.info("🔄 Converting audio to WAV format: %s -> %s", audio_file_path, prepared_audio)
             
             # Use ffmpeg to convert to WAV format (not just rename)
             cmd = [
@@ -847,7 +963,7 @@ class EnhancedTranscriptionService:
                 "-y", prepared_audio
             ]
             
-            print(f"🔄 Running ffmpeg command: {' '.join(cmd)}")
+            logger.info("🔄 Running ffmpeg command: %s", ' '.join(cmd))
             
             result = subprocess.run(cmd, capture_output=True, text=True, encoding='utf-8', errors='ignore')
             if result.returncode != 0:
@@ -856,217 +972,74 @@ class EnhancedTranscriptionService:
             # Verify the output file exists and has content
             if os.path.exists(prepared_audio):
                 file_size = os.path.getsize(prepared_audio)
-                print(f"✅ Audio prepared: {prepared_audio} ({file_size} bytes)")
+                logger.info("✅ Audio prepared: %s (%s bytes)", prepared_audio, file_size)
                 return prepared_audio
             else:
                 raise Exception("Prepared audio file not created")
             
         except Exception as e:
-            print(f"❌ Audio preparation failed: {e}")
+            logger.error("❌ Audio preparation failed: %s", e)
             # Fallback to original file
             return audio_file_path
     
     async def _get_whisper_timestamps(self, audio_file_path: str) -> Dict:
-        """Get Whisper timestamps and segments"""
+        """Get Whisper timestamps and segments from the local whisper.cpp server"""
         try:
-            print("🦜 Getting Whisper timestamps...")
-            
-            # Check if binary and model exist
-            if not os.path.exists(self.whisper_binary_path):
-                raise Exception(f"Whisper binary not found: {self.whisper_binary_path}")
-            if not os.path.exists(self.whisper_model_path):
-                raise Exception(f"Whisper model not found: {self.whisper_model_path}")
+            logger.info("🦜 Getting Whisper timestamps...")
             
             # Check if audio file exists and has content
             if not os.path.exists(audio_file_path):
                 raise Exception(f"Audio file not found: {audio_file_path}")
             
             file_size = os.path.getsize(audio_file_path)
-            print(f"📁 Audio file size: {file_size} bytes")
+            logger.info("📁 Audio file size: %s bytes", file_size)
             
             if file_size == 0:
                 raise Exception("Audio file is empty")
             
-            print(f"✅ Using Whisper binary: {self.whisper_binary_path}")
-            print(f"✅ Using Whisper model: {self.whisper_model_path}")
-            
-            # Create temporary output files
-            temp_dir = tempfile.gettempdir()
-            base_name = os.path.splitext(os.path.basename(audio_file_path))[0]
-            json_output = os.path.join(temp_dir, f"{base_name}_whisper.json")
+            whisper_data = await whisper_server_service.transcribe(audio_file_path, response_format="verbose_json")
             
-            # Run whisper-cli with JSON output
-            cmd = [
-                self.whisper_binary_path,
-                "-m", self.whisper_model_path,
-                "-f", audio_file_path,
-                "-oj",  # Output JSON
-                "-of", os.path.splitext(json_output)[0]  # Output file base name
-            ]
-            
-            print(f"🦜 Running command: {' '.join(cmd)}")
-            
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            print(f"🦜 Whisper return code: {result.returncode}")
-            print(f"🦜 Whisper stdout: {result.stdout}")
-            print(f"🦜 Whisper stderr: {result.stderr}")
-            
-            if result.returncode != 0:
-                raise Exception(f"Whisper processing failed: {result.stderr}")
-            
-            # Read the JSON output
-            if os.path.exists(json_output):
-                with open(json_output, 'r', encoding='utf-8') as f:
-                    whisper_data = json.load(f)
-                
-                # Clean up temporary file
-                os.remove(json_output)
-                
-                # Parse the correct structure - Whisper returns 'transcription' array
-                if 'transcription' in whisper_data:
-                    raw_segments = whisper_data['transcription']
-                    segments = []
-                    
-                    for segment in raw_segments:
-                        # Extract timing information
-                        timestamps = segment.get('timestamps', {})
-                        offsets = segment.get('offsets', {})
-                        
-                        # Convert timestamp format "00:00:10,000" to seconds
-                        start_time_str = timestamps.get('from', '00:00:00,000')
-                        end_time_str = timestamps.get('to', '00:00:00,000')
-                        
-                        # Parse timestamp strings to seconds
-                        start_time = self._parse_timestamp_to_seconds(start_time_str)
-                        end_time = self._parse_timestamp_to_seconds(end_time_str)
-                        
-                        # Get text content
-                        text = segment.get('text', '').strip()
-                        
-                        segments.append({
-                            'start': start_time,
-                            'end': end_time,
-                            'text': text
-                        })
-                    
-                    print(f"✅ Whisper timestamps obtained: {len(segments)} segments")
-                    return {"segments": segments, "duration": end_time if segments else 0}
-                else:
-                    # Fallback to old format
-                    segments = whisper_data.get('segments', [])
-                    print(f"✅ Whisper timestamps obtained: {len(segments)} segments")
-                    
-                    if len(segments) == 0:
-                        print("⚠️  Warning: Whisper returned 0 segments. This might indicate:")
-                        print("   - Audio file is too short or silent")
-                        print("   - Audio format issues")
-                        print("   - Model loading problems")
-                        print(f"   - Full whisper data: {whisper_data}")
-                        
-                        # Try with a different model if available
-                        alternative_model = os.path.join(os.path.dirname(self.whisper_model_path), "ggml-medium.bin")
-                        if os.path.exists(alternative_model):
-                            print(f"🔄 Trying alternative model: {alternative_model}")
-                            return await self._try_alternative_model(audio_file_path, alternative_model)
-                    
-                    return whisper_data
-            else:
-                raise Exception("Whisper JSON output file not found")
-                
-        except Exception as e:
-            print(f"❌ Whisper processing failed: {e}")
-            return {"segments": [], "duration": 0}
-    
-    def _parse_timestamp_to_seconds(self, timestamp_str: str) -> float:
-        """Convert timestamp string '00:00:10,000' to seconds"""
-        try:
-            # Remove any leading/trailing whitespace
-            timestamp_str = timestamp_str.strip()
-            
-            # Split by ':' to get hours, minutes, seconds
-            parts = timestamp_str.split(':')
-            if len(parts) == 3:
-                hours = int(parts[0])
-                minutes = int(parts[1])
-                seconds_part = parts[2]
-                
-                # Split seconds part by ',' to get seconds and milliseconds
-                seconds_parts = seconds_part.split(',')
-                if len(seconds_parts) == 2:
-                    seconds = int(seconds_parts[0])
-                    milliseconds = int(seconds_parts[1])
-                    
-                    # Calculate total seconds
-                    total_seconds = hours * 3600 + minutes * 60 + seconds + milliseconds / 1000.0
-                    return total_seconds
-                else:
-                    # If no milliseconds, just use seconds
-                    seconds = int(seconds_parts[0])
-                    return hours * 3600 + minutes * 60 + seconds
-            else:
-                # If format is different, try to parse as float
-                return float(timestamp_str)
-        except Exception as e:
-            print(f"⚠️  Error parsing timestamp '{timestamp_str}': {e}")
-            return 0.0
-    
-    async def _try_alternative_model(self, audio_file_path: str, model_path: str) -> Dict:
-        """Try with an alternative Whisper model"""
-        try:
-            print(f"🦜 Trying alternative model: {model_path}")
-            
-            temp_dir = tempfile.gettempdir()
-            base_name = os.path.splitext(os.path.basename(audio_file_path))[0]
-            json_output = os.path.join(temp_dir, f"{base_name}_whisper_alt.json")
-            
-            cmd = [
-                self.whisper_binary_path,
-                "-m", model_path,
-                "-f", audio_file_path,
-                "-oj",
-                "-of", os.path.splitext(json_output)[0]
+            segments = [
+                {
+                    'start': float(segment.get('start', 0.0)),
+                    'end': float(segment.get('end', 0.0)),
+                    'text': segment.get('text', '').strip()
+                }
+                for segment in whisper_data.get('segments', [])
             ]
             
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            print(f"🦜 Alternative model return code: {result.returncode}")
+            if not segments:
+                logger.warning("⚠️  Warning: Whisper returned 0 segments (audio too short/silent or format issues)")
             
-            if result.returncode == 0 and os.path.exists(json_output):
-                with open(json_output, 'r', encoding='utf-8') as f:
-                    whisper_data = json.load(f)
-                os.remove(json_output)
-                
-                segments = whisper_data.get('segments', [])
-                print(f"✅ Alternative model returned: {len(segments)} segments")
-                return whisper_data
-            else:
-                print("❌ Alternative model also failed")
-                return {"segments": [], "duration": 0}
+            logger.info("✅ Whisper timestamps obtained: %s segments", len(segments))
+            duration = whisper_data.get('duration') or (segments[-1]['end'] if segments else 0)
+            return {"segments": segments, "duration": duration}
                 
         except Exception as e:
-            print(f"❌ Alternative model failed: {e}")
+            logger.error("❌ Whisper processing failed: %s", e)
             return {"segments": [], "duration": 0}
     
     async def _get_elevenlabs_transcript(self, audio_file_path: str) -> List[Dict]:
         """Get ElevenLabs transcript with speaker diarization (now expects WAV)"""
         try:
-            print("🎤 Getting ElevenLabs transcript...")
+            logger.info("🎤 Getting ElevenLabs transcript...")
             
             # Import and use the ElevenLabs service
             from app.services.elevenlabs_service import elevenlabs_service
             
             elevenlabs_transcript = await elevenlabs_service.transcribe_with_speaker_diarization(audio_file_path)
             
-            print(f"✅ ElevenLabs transcript obtained: {len(elevenlabs_transcript)} segments")
+            logger.info("✅ ElevenLabs transcript obtained: %s segments", len(elevenlabs_transcript))
             return elevenlabs_transcript
             
         except Exception as e:
-            print(f"❌ ElevenLabs processing failed: {e}")
+            logger.error("❌ ElevenLabs processing failed: %s", e)
             return []
     
     async def _get_sarvam_transcript(self, audio_file_path: str) -> Dict:
         """Get Sarvam transcript using batch API for Tamil accuracy"""
         try:
-            print("🌐 Getting Sarvam transcript using batch API...")
+            logger.info("🌐 Getting Sarvam transcript using batch API...")
             
             # Import and use the Sarvam batch service
             from app.services.sarvam_batch_service import SarvamBatchService
@@ -1074,11 +1047,10 @@ class EnhancedTranscriptionService:
             
             # Check if API key is available
             if not settings.SARVAM_API_KEY:
-                print("❌ SARVAM_API_KEY not found in environment variables")
-                print("Please set SARVAM_API_KEY in your .env file or environment")
+                logger.error("❌ SARVAM_API_KEY not found, set it in your .env file or environment")
                 return {"transcript": ""}
             
-            print(f"🔑 Using Sarvam API key: {settings.SARVAM_API_KEY[:10]}...")
+            logger.debug("🔑 Using Sarvam API key: %s...", settings.SARVAM_API_KEY[:4])
             
             sarvam_batch_service = SarvamBatchService(settings.SARVAM_API_KEY)
             
@@ -1090,7 +1062,7 @@ class EnhancedTranscriptionService:
             )
             
             if transcript:
-                print(f"✅ Sarvam batch transcript obtained: {len(transcript)} characters")
+                logger.info("✅ Sarvam batch transcript obtained: %s characters", len(transcript))
                 return {
                     "transcript": transcript,
                     "diarized_transcript": diarized_transcript,
@@ -1099,20 +1071,20 @@ class EnhancedTranscriptionService:
                     "processing_time": 0.0
                 }
             else:
-                print("❌ Sarvam batch transcription failed")
+                logger.error("❌ Sarvam batch transcription failed")
                 return {"transcript": ""}
             
         except Exception as e:
-            print(f"❌ Sarvam batch processing failed: {e}")
+            logger.error("❌ Sarvam batch processing failed: %s", e)
             # Fallback to regular API if batch fails
             try:
-                print("🔄 Falling back to regular Sarvam API...")
+                logger.info("🔄 Falling back to regular Sarvam API...")
                 from app.services.sarvam_service import SarvamService
                 sarvam_service = SarvamService()
                 result = await sarvam_service.transcribe_audio(audio_file_path)
                 return result
             except Exception as fallback_error:
-                print(f"❌ Sarvam fallback also failed: {fallback_error}")
+                logger.error("❌ Sarvam fallback also failed: %s", fallback_error)
                 return {"transcript": ""}
     
     def _distribute_sarvam_text(self, elevenlabs_segments: List[Dict], sarvam_text: str) -> List[Dict]:
@@ -1131,7 +1103,7 @@ class EnhancedTranscriptionService:
             # If there's only one ElevenLabs segment, put the entire Sarvam text in it
             if len(elevenlabs_segments) == 1:
                 segment = elevenlabs_segments[0]
-                print(f"🔍 Single segment detected. Using entire Sarvam text: '{sarvam_text[:100]}...'")
+                logger.debug("🔍 Single segment detected. Using entire Sarvam text: '%s'", Truncated(sarvam_text, 100))
                 return [{
                     "speaker": segment.get("speaker", "Unknown"),
                     "start": segment.get("start_time", 0.0),
@@ -1143,7 +1115,7 @@ class EnhancedTranscriptionService:
             # For multiple segments, split Sarvam text into sentences or chunks
             sarvam_sentences = self._split_sarvam_text(sarvam_text)
             
-            print(f"🔍 Multiple segments detected. Split Sarvam text into {len(sarvam_sentences)} sentences")
+            logger.debug("🔍 Multiple segments detected. Split Sarvam text into %s sentences", len(sarvam_sentences))
             
             output = []
             sentence_index = 0
@@ -1156,7 +1128,8 @@ class EnhancedTranscriptionService:
                 if sentence_index < len(sarvam_sentences):
                     # Use Sarvam sentence for this segment
                     sarvam_sentence = sarvam_sentences[sentence_index]
-                    print(f"🔍 Using Sarvam sentence {sentence_index + 1} for segment: '{sarvam_sentence[:50]}...'")
+                    logger.debug("🔍 Using Sarvam sentence %s for segment: '%s'",
+                                 sentence_index + 1, Truncated(sarvam_sentence, 50))
                     
                     output.append({
                         "speaker": segment.get("speaker", "Unknown"),
@@ -1168,7 +1141,7 @@ class EnhancedTranscriptionService:
                     sentence_index += 1
                 else:
                     # If we run out of Sarvam sentences, use original ElevenLabs text
-                    print(f"🔍 Using original ElevenLabs text for segment: '{original_text[:50]}...'")
+                    logger.debug("🔍 Using original ElevenLabs text for segment: '%s'", Truncated(original_text, 50))
                     
                     output.append({
                         "speaker": segment.get("speaker", "Unknown"),
@@ -1181,7 +1154,7 @@ class EnhancedTranscriptionService:
             return output
             
         except Exception as e:
-            print(f"❌ Error distributing Sarvam text: {e}")
+            logger.error("❌ Error distributing Sarvam text: %s", e)
             # Fallback: return original ElevenLabs segments
             return [
                 {
@@ -1201,7 +1174,7 @@ class EnhancedTranscriptionService:
             lines = [line.strip() for line in sarvam_text.split('\n') if line.strip()]
             
             if len(lines) > 1:
-                print(f"🔍 Split by newlines: {len(lines)} lines")
+                logger.debug("🔍 Split by newlines: %s lines", len(lines))
                 return lines
             
             # If no newlines, split by sentence endings
@@ -1210,7 +1183,7 @@ class EnhancedTranscriptionService:
             sentences = [s.strip() for s in sentences if s.strip()]
             
             if len(sentences) > 1:
-                print(f"🔍 Split by sentences: {len(sentences)} sentences")
+                logger.debug("🔍 Split by sentences: %s sentences", len(sentences))
                 return sentences
             
             # If still only one chunk, split by approximate length
@@ -1223,11 +1196,11 @@ class EnhancedTranscriptionService:
                 if chunk:
                     chunks.append(chunk)
             
-            print(f"🔍 Split by chunks: {len(chunks)} chunks")
+            logger.debug("🔍 Split by chunks: %s chunks", len(chunks))
             return chunks
             
         except Exception as e:
-            print(f"❌ Error splitting Sarvam text: {e}")
+            logger.error("❌ Error splitting Sarvam text: %s", e)
             return [sarvam_text]  # Return as single chunk
 
 
@@ -1239,33 +1212,21 @@ class EnhancedTranscriptionService:
     
     def _contains_tamil(self, text: str) -> bool:
         """Check if text contains Tamil characters using Unicode range"""
-        # Unicode range for Tamil: U+0B80 to U+0BFF
-        return any('\u0B80' <= char <= '\u0BFF' for char in text)
+        return script_analysis.contains_tamil(text)
     
     def _contains_tamil_words(self, text: str) -> bool:
         """Check if text contains Tamil words using Unicode range"""
-        # Unicode range for Tamil: U+0B80 to U+0BFF
-        return any('\u0B80' <= char <= '\u0BFF' for char in text)
+        return script_analysis.contains_tamil(text)
     
     def _is_thanglish(self, text: str) -> bool:
         """Detect if text is Thanglish (Tamil in Latin script or code-mixed):
         - Mostly Latin letters, little Tamil Unicode
         """
-        if not text:
-            return False
-        tamil_count = sum('\u0B80' <= c <= '\u0BFF' for c in text)
-        latin_count = sum('a' <= c.lower() <= 'z' for c in text)
-        total_alpha = sum(c.isalpha() for c in text)
-        if total_alpha == 0:
-            return False
-        latin_ratio = latin_count / total_alpha
-        tamil_ratio = tamil_count / total_alpha
-        # Consider Thanglish if mostly Latin and little Tamil
-        return latin_ratio > 0.6 and tamil_ratio < 0.4
+        return script_analysis.is_thanglish(text)
     
     def _is_tamil(self, text):
         """Check if the text contains Tamil script characters."""
-        return any('\u0B80' <= char <= '\u0BFF' for char in text)
+        return script_analysis.contains_tamil(text)
 
     def export_to_srt(self, transcript: List[Dict], output_path: str):
         """Export transcript to SRT format"""
@@ -1282,20 +1243,23 @@ class EnhancedTranscriptionService:
                     f.write(f"{format_timestamp(seg['start'])} --> {format_timestamp(seg['end'])}\n")
                     f.write(f"{seg['speaker']}: {seg['text']}\n\n")
             
-            print(f"✅ SRT file exported: {output_path}")
+            logger.info("✅ SRT file exported: %s", output_path)
             
         except Exception as e:
-            print(f"❌ SRT export failed: {e}")
+            logger.error("❌ SRT export failed: %s", e)
 
     async def store_transcription_in_db(self, transcript_data: dict) -> None:
         """
         Store the enhanced transcript and translation output in Supabase DB.
         """
         try:
-            response = supabase.table("transcripts").insert(transcript_data).execute()
-            print(f"✅ Transcript stored in Supabase: {response.data}")
+            with span("db_write"):
+                response = supabase.table("transcripts").insert(transcript_data).execute()
+            logger.info("✅ Transcript stored in Supabase")
+            logger.debug("Stored row: %s", Truncated(response.data))
         except Exception as e:
-            print(f"❌ Exception while storing transcript in Supabase: {e}")
+            logger.error("❌ Exception while storing transcript in Supabase: %s", e)
+            record_provider_error("supabase", type(e).__name__)
 
 
 # Create service instance
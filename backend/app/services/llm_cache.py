@@ -0,0 +1,147 @@
+import contextvars
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, List, Optional
+
+from app.core.config import backend_path, settings
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Hit/miss counters of the current request, see LLMCache.track()
+_scope_stats: contextvars.ContextVar[Optional[Dict[str, int]]] = contextvars.ContextVar("llm_cache_stats", default=None)
+
+
+class LLMCache:
+    """
+    On-disk (SQLite) cache of LLM responses.
+
+    Keys hash the prompt template version, model, sampling settings and exact
+    messages, so a prompt change or different input never reuses an answer.
+    Entries expire after LLM_CACHE_TTL_SECONDS and the least recently used ones
+    are evicted once the cache grows past LLM_CACHE_MAX_BYTES.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or backend_path(settings.LLM_CACHE_PATH)
+        self.enabled = settings.LLM_CACHE_ENABLED
+        self.stats = {"hits": 0, "misses": 0, "writes": 0, "evictions": 0}
+        self._lock = threading.Lock()
+        self._initialized = False
+
+    def _connect(self) -> sqlite3.Connection:
+        if not self._initialized:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=10)
+        if not self._initialized:
+            with self._lock:
+                if not self._initialized:
+                    conn.execute("PRAGMA journal_mode=WAL")
+                    conn.execute(
+                        "CREATE TABLE IF NOT EXISTS llm_cache ("
+                        "key TEXT PRIMARY KEY, value TEXT NOT NULL, size INTEGER NOT NULL, "
+                        "created_at REAL NOT NULL, last_access REAL NOT NULL)"
+                    )
+                    conn.execute("CREATE INDEX IF NOT EXISTS idx_llm_cache_last_access ON llm_cache(last_access)")
+                    conn.commit()
+                    self._initialized = True
+        return conn
+
+    @contextmanager
+    def _connection(self):
+        conn = self._connect()
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    @staticmethod
+    def make_key(prompt_version: str, model: str, temperature: float,
+                 max_tokens: Optional[int], messages: List[Dict[str, Any]]) -> str:
+        payload = json.dumps(
+            {"prompt_version": prompt_version, "model": model, "temperature": temperature,
+             "max_tokens": max_tokens, "messages": messages},
+            sort_keys=True, ensure_ascii=False
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _count(self, stat: str) -> None:
+        self.stats[stat] += 1
+        scope = _scope_stats.get()
+        if scope is not None and stat in scope:
+            scope[stat] += 1
+
+    def get(self, key: str) -> Optional[str]:
+        if not self.enabled:
+            return None
+        now = time.time()
+        try:
+            with self._connection() as conn:
+                row = conn.execute(
+                    "SELECT value, created_at FROM llm_cache WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None or now - row[1] > settings.LLM_CACHE_TTL_SECONDS:
+                    self._count("misses")
+                    return None
+                conn.execute("UPDATE llm_cache SET last_access = ? WHERE key = ?", (now, key))
+        except sqlite3.Error as e:
+            logger.warning("⚠️ LLM cache read failed: %s", e)
+            return None
+        self._count("hits")
+        return row[0]
+
+    def set(self, key: str, value: str) -> None:
+        if not self.enabled:
+            return
+        now = time.time()
+        size = len(value.encode("utf-8"))
+        try:
+            with self._connection() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO llm_cache (key, value, size, created_at, last_access) VALUES (?, ?, ?, ?, ?)",
+                    (key, value, size, now, now)
+                )
+                self._count("writes")
+                self._evict(conn, now)
+        except sqlite3.Error as e:
+            logger.warning("⚠️ LLM cache write failed: %s", e)
+
+    def _evict(self, conn: sqlite3.Connection, now: float) -> None:
+        expired = conn.execute(
+            "DELETE FROM llm_cache WHERE created_at < ?", (now - settings.LLM_CACHE_TTL_SECONDS,)
+        ).rowcount
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM llm_cache").fetchone()[0]
+        evicted = 0
+        if total > settings.LLM_CACHE_MAX_BYTES:
+            # Drop least recently used entries until back under the limit
+            for key, size in conn.execute("SELECT key, size FROM llm_cache ORDER BY last_access").fetchall():
+                if total <= settings.LLM_CACHE_MAX_BYTES:
+                    break
+                conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                total -= size
+                evicted += 1
+        for _ in range(expired + evicted):
+            self._count("evictions")
+
+    def clear(self) -> None:
+        with self._connection() as conn:
+            conn.execute("DELETE FROM llm_cache")
+
+    @contextmanager
+    def track(self):
+        """Collect hit/miss counts of LLM calls made inside the block (including spawned tasks)"""
+        stats = {"hits": 0, "misses": 0}
+        token = _scope_stats.set(stats)
+        try:
+            yield stats
+        finally:
+            _scope_stats.reset(token)
+
+
+llm_cache = LLMCache()
@@ -1,18 +1,35 @@
 import os
-import json
+import sqlite3
 import time
+import uuid
 import librosa
 import numpy as np
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 from app.services.sarvam_batch_service import SarvamBatchService
 from app.services.audio_cross_validator import audio_cross_validator
+from app.services.qc_store import (
+    LEGACY_QC_DIR, QCStore, decode_cursor, encode_cursor, legacy_case_files, normalize_timestamp
+)
 from app.core.config import settings
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+QC_STATUSES = ('pending', 'audio_validated', 'completed')
+OPEN_STATUSES = ('pending', 'audio_validated')
 
 class QCService:
     def __init__(self):
-        self.qc_queue_dir = os.path.join(os.path.dirname(__file__), '../../qc_queue')
-        os.makedirs(self.qc_queue_dir, exist_ok=True)
+        self.qc_queue_dir = LEGACY_QC_DIR
+        self.store = QCStore()
+        os.makedirs(os.path.dirname(self.store.path), exist_ok=True)
+        if self.store.is_empty() and legacy_case_files(self.qc_queue_dir):
+            logger.warning(
+                "⚠️ Found QC case files in %s that are not in the QC store %s; "
+                "import them with: python -m app.services.qc_store migrate %s",
+                self.qc_queue_dir, self.store.path, self.qc_queue_dir
+            )
         self.sarvam_batch = SarvamBatchService(settings.SARVAM_API_KEY)
     
     def add_to_qc_queue(self, dual_pipeline_result: Dict) -> str:
@@ -20,7 +37,7 @@ class QCService:
         Add a case to QC queue when transcripts don't match
         Returns the QC case ID
         """
-        qc_case_id = f"qc_{int(time.time())}_{os.getpid()}"
+        qc_case_id = f"qc_{int(time.time())}_{os.getpid()}_{uuid.uuid4().hex[:8]}"
         
         qc_case = {
             'qc_case_id': qc_case_id,
@@ -35,12 +52,9 @@ class QCService:
             'optimal_transcript': None
         }
         
-        # Save to QC queue
-        qc_file_path = os.path.join(self.qc_queue_dir, f"{qc_case_id}.json")
-        with open(qc_file_path, 'w', encoding='utf-8') as f:
-            json.dump(qc_case, f, indent=2, ensure_ascii=False)
+        self.store.add(qc_case)
         
-        print(f"📋 Added to QC queue: {qc_case_id}")
+        logger.info("📋 Added to QC queue: %s", qc_case_id)
         return qc_case_id
     
     async def perform_audio_cross_validation(self, qc_case_id: str) -> Dict:
@@ -79,14 +93,12 @@ class QCService:
             optimal_transcript = cross_validation_result.get('optimal_transcript', '')
             
             # Update QC case with results
-            qc_case.update({
+            self.store.update(qc_case_id, {
                 'audio_cross_validation': cross_validation_result,
                 'optimal_transcript': optimal_transcript,
                 'status': 'audio_validated'
             })
             
-            self._save_qc_case(qc_case_id, qc_case)
-            
             return {
                 'cross_validation': cross_validation_result,
                 'optimal_transcript': optimal_transcript,
@@ -94,7 +106,7 @@ class QCService:
             }
             
         except Exception as e:
-            print(f"❌ Error in audio cross-validation: {e}")
+            logger.error("❌ Error in audio cross-validation: %s", e)
             return {'error': str(e)}
     
     async def _analyze_transcript_accuracy(self, transcript1: str, transcript2: str, 
@@ -139,7 +151,7 @@ class QCService:
             }
             
         except Exception as e:
-            print(f"❌ Error analyzing transcript accuracy: {e}")
+            logger.error("❌ Error analyzing transcript accuracy: %s", e)
             return {'error': str(e)}
     
     def _analyze_transcript_differences(self, transcript1: str, transcript2: str) -> Dict:
@@ -292,7 +304,7 @@ class QCService:
             return optimal_transcript
             
         except Exception as e:
-            print(f"❌ Error creating optimal transcript: {e}")
+            logger.error("❌ Error creating optimal transcript: %s", e)
             # Fallback to the longer transcript
             return transcript1 if len(transcript1) > len(transcript2) else transcript2
     
@@ -324,102 +336,64 @@ class QCService:
     
     def _get_qc_case(self, qc_case_id: str) -> Optional[Dict]:
         """Get a specific QC case"""
-        qc_file_path = os.path.join(self.qc_queue_dir, f"{qc_case_id}.json")
-        if not os.path.exists(qc_file_path):
-            return None
-        
         try:
-            with open(qc_file_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except Exception as e:
-            print(f"Error reading QC case {qc_case_id}: {e}")
+            return self.store.get(qc_case_id)
+        except sqlite3.Error as e:
+            logger.error("Error reading QC case %s: %s", qc_case_id, e)
             return None
     
-    def _save_qc_case(self, qc_case_id: str, qc_case: Dict) -> bool:
-        """Save a QC case"""
-        qc_file_path = os.path.join(self.qc_queue_dir, f"{qc_case_id}.json")
-        try:
-            with open(qc_file_path, 'w', encoding='utf-8') as f:
-                json.dump(qc_case, f, indent=2, ensure_ascii=False)
-            return True
-        except Exception as e:
-            print(f"Error saving QC case {qc_case_id}: {e}")
-            return False
-    
-    def get_qc_queue(self) -> List[Dict]:
-        """Get all pending QC cases"""
-        qc_cases = []
-        for filename in os.listdir(self.qc_queue_dir):
-            if filename.endswith('.json'):
-                file_path = os.path.join(self.qc_queue_dir, filename)
-                try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        qc_case = json.load(f)
-                        if qc_case.get('status') in ['pending', 'audio_validated']:
-                            qc_cases.append(qc_case)
-                except Exception as e:
-                    print(f"Error reading QC case {filename}: {e}")
+    def get_qc_queue(self, statuses: Optional[List[str]] = None, limit: Optional[int] = None,
+                     cursor: Optional[str] = None, since: Optional[str] = None, until: Optional[str] = None,
+                     min_similarity: Optional[float] = None, max_similarity: Optional[float] = None) -> Dict:
+        """
+        Get one page of QC case summaries, oldest first (open cases unless statuses are given).
+        Pass the returned next_cursor back to get the following page; it is None on the last one.
+        Raises ValueError for an unknown status or a malformed cursor.
+        """
+        statuses = statuses or list(OPEN_STATUSES)
+        unknown = [status for status in statuses if status not in QC_STATUSES]
+        if unknown:
+            raise ValueError(f"Unknown QC status: {', '.join(unknown)} (expected one of {', '.join(QC_STATUSES)})")
+        limit = max(1, min(limit or settings.QC_QUEUE_PAGE_SIZE, settings.QC_QUEUE_MAX_PAGE_SIZE))
+        after = decode_cursor(cursor) if cursor else None
         
-        return sorted(qc_cases, key=lambda x: x['timestamp'])
+        qc_cases, next_key = self.store.page(
+            statuses, limit, after=after,
+            since=normalize_timestamp(since, 'since'), until=normalize_timestamp(until, 'until'),
+            min_similarity=min_similarity, max_similarity=max_similarity
+        )
+        return {
+            'qc_cases': qc_cases,
+            'next_cursor': encode_cursor(next_key) if next_key else None
+        }
     
     def update_qc_case(self, qc_case_id: str, qc_notes: str, final_decision: str, processed_by: str) -> bool:
         """Update a QC case with decision"""
-        qc_file_path = os.path.join(self.qc_queue_dir, f"{qc_case_id}.json")
-        
-        if not os.path.exists(qc_file_path):
-            return False
-        
         try:
-            with open(qc_file_path, 'r', encoding='utf-8') as f:
-                qc_case = json.load(f)
-            
-            qc_case.update({
+            updated = self.store.update(qc_case_id, {
                 'status': 'completed',
                 'qc_notes': qc_notes,
                 'final_decision': final_decision,
                 'processed_by': processed_by,
                 'processed_at': datetime.now().isoformat()
             })
-            
-            with open(qc_file_path, 'w', encoding='utf-8') as f:
-                json.dump(qc_case, f, indent=2, ensure_ascii=False)
-            
-            print(f"✅ Updated QC case: {qc_case_id}")
-            return True
-            
-        except Exception as e:
-            print(f"Error updating QC case {qc_case_id}: {e}")
+        except sqlite3.Error as e:
+            logger.error("Error updating QC case %s: %s", qc_case_id, e)
+            return False
+        
+        if updated is None:
             return False
+        logger.info("✅ Updated QC case: %s", qc_case_id)
+        return True
     
     def get_qc_stats(self) -> Dict:
-        """Get QC queue statistics"""
-        total_cases = 0
-        pending_cases = 0
-        completed_cases = 0
-        audio_validated_cases = 0
-        
-        for filename in os.listdir(self.qc_queue_dir):
-            if filename.endswith('.json'):
-                total_cases += 1
-                file_path = os.path.join(self.qc_queue_dir, filename)
-                try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        qc_case = json.load(f)
-                        status = qc_case.get('status', 'pending')
-                        if status == 'pending':
-                            pending_cases += 1
-                        elif status == 'completed':
-                            completed_cases += 1
-                        elif status == 'audio_validated':
-                            audio_validated_cases += 1
-                except:
-                    pass
-        
+        """Get QC queue statistics (from the store's status counters, no case is read)"""
+        counts = self.store.status_counts()
         return {
-            'total_cases': total_cases,
-            'pending_cases': pending_cases,
-            'completed_cases': completed_cases,
-            'audio_validated_cases': audio_validated_cases
+            'total_cases': sum(counts.values()),
+            'pending_cases': counts.get('pending', 0),
+            'completed_cases': counts.get('completed', 0),
+            'audio_validated_cases': counts.get('audio_validated', 0)
         }
 
 # Create global instance
@@ -0,0 +1,315 @@
+import argparse
+import base64
+import heapq
+import json
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from app.core.config import BACKEND_DIR, backend_path, settings
+from app.core.logging import configure_logging, get_logger
+
+logger = get_logger(__name__)
+
+LEGACY_QC_DIR = os.path.join(BACKEND_DIR, "qc_queue")
+
+
+def default_db_path() -> str:
+    return backend_path(settings.QC_DB_PATH)
+
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS qc_cases ("
+    "qc_case_id TEXT PRIMARY KEY, timestamp TEXT NOT NULL, status TEXT NOT NULL, "
+    "processed_at TEXT, data TEXT NOT NULL, similarity REAL, summary TEXT)",
+    # Queue pages walk (status, timestamp, qc_case_id) in key order, see QCStore.page()
+    "CREATE INDEX IF NOT EXISTS idx_qc_cases_queue ON qc_cases(status, timestamp, qc_case_id)",
+    "CREATE INDEX IF NOT EXISTS idx_qc_cases_timestamp ON qc_cases(timestamp)",
+    "CREATE TABLE IF NOT EXISTS qc_status_counts (status TEXT PRIMARY KEY, count INTEGER NOT NULL)",
+    # Counters are maintained by triggers in the writing transaction, so they never drift from the rows
+    "CREATE TRIGGER IF NOT EXISTS qc_cases_count_insert AFTER INSERT ON qc_cases BEGIN "
+    "INSERT INTO qc_status_counts (status, count) VALUES (new.status, 1) "
+    "ON CONFLICT(status) DO UPDATE SET count = count + 1; END",
+    "CREATE TRIGGER IF NOT EXISTS qc_cases_count_delete AFTER DELETE ON qc_cases BEGIN "
+    "UPDATE qc_status_counts SET count = count - 1 WHERE status = old.status; END",
+    "CREATE TRIGGER IF NOT EXISTS qc_cases_count_update AFTER UPDATE OF status ON qc_cases "
+    "WHEN old.status IS NOT new.status BEGIN "
+    "UPDATE qc_status_counts SET count = count - 1 WHERE status = old.status; "
+    "INSERT INTO qc_status_counts (status, count) VALUES (new.status, 1) "
+    "ON CONFLICT(status) DO UPDATE SET count = count + 1; END",
+)
+
+
+def summarize(qc_case: Dict) -> Dict:
+    """Queue listing projection of a case: status and scores, without transcripts or diarization"""
+    comparison = (qc_case.get('dual_pipeline_result') or {}).get('comparison') or {}
+    return {
+        'qc_case_id': qc_case['qc_case_id'],
+        'timestamp': qc_case.get('timestamp'),
+        'status': qc_case.get('status') or 'pending',
+        'similarity_score': comparison.get('similarity_score'),
+        'reason': comparison.get('reason'),
+        'pipeline1_length': comparison.get('pipeline1_length'),
+        'pipeline2_length': comparison.get('pipeline2_length'),
+        'audio_validated': qc_case.get('audio_cross_validation') is not None,
+        'has_optimal_transcript': bool(qc_case.get('optimal_transcript')),
+        'final_decision': qc_case.get('final_decision'),
+        'processed_by': qc_case.get('processed_by'),
+        'processed_at': qc_case.get('processed_at'),
+    }
+
+
+def encode_cursor(key: Tuple[str, str]) -> str:
+    return base64.urlsafe_b64encode(json.dumps(list(key)).encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> Tuple[str, str]:
+    """(timestamp, qc_case_id) of the last case of the previous page; ValueError if malformed"""
+    try:
+        timestamp, qc_case_id = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from e
+    if not isinstance(timestamp, str) or not isinstance(qc_case_id, str):
+        raise ValueError(f"Invalid cursor: {cursor!r}")
+    return timestamp, qc_case_id
+
+
+def normalize_timestamp(value: Optional[str], name: str) -> Optional[str]:
+    """
+    ISO date/datetime filter bound in the stored format (naive local time,
+    datetime.isoformat()); offsets such as Z or +05:30 are converted to local time.
+    ValueError if the value does not parse.
+    """
+    if value is None:
+        return None
+    text = value.strip()
+    # datetime.fromisoformat only accepts a trailing Z from Python 3.11 on
+    if text[-1:] in ("Z", "z"):
+        text = text[:-1] + "+00:00"
+    try:
+        parsed = datetime.fromisoformat(text)
+    except ValueError:
+        raise ValueError(f"{name} must be an ISO 8601 date or datetime, got {value!r}")
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone().replace(tzinfo=None)
+    return parsed.isoformat()
+
+
+class QCStore:
+    """
+    SQLite (WAL) store of QC cases.
+
+    Each case is kept as its JSON document plus indexed status/timestamp columns,
+    its similarity score and its queue summary (see summarize()); per-status
+    counts live in qc_status_counts and are updated by triggers, so statistics
+    never scan the cases. Updates merge fields into a case inside one IMMEDIATE
+    transaction instead of rewriting a file.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or default_db_path()
+        self._lock = threading.Lock()
+        self._initialized = False
+
+    def _connect(self) -> sqlite3.Connection:
+        # Autocommit mode: transactions are opened explicitly in _transaction()
+        conn = sqlite3.connect(self.path, timeout=10, isolation_level=None)
+        if not self._initialized:
+            with self._lock:
+                if not self._initialized:
+                    conn.execute("PRAGMA journal_mode=WAL")
+                    for statement in _SCHEMA:
+                        conn.execute(statement)
+                    self._initialized = True
+        return conn
+
+    @contextmanager
+    def _transaction(self):
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+        finally:
+            conn.close()
+
+    @contextmanager
+    def _reader(self):
+        conn = self._connect()
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _row(qc_case: Dict) -> tuple:
+        summary = summarize(qc_case)
+        similarity = summary['similarity_score']
+        return (
+            qc_case["qc_case_id"],
+            qc_case.get("timestamp") or "",
+            qc_case.get("status") or "pending",
+            qc_case.get("processed_at"),
+            json.dumps(qc_case, ensure_ascii=False),
+            similarity if isinstance(similarity, (int, float)) else None,
+            json.dumps(summary, ensure_ascii=False),
+        )
+
+    def add(self, qc_case: Dict) -> None:
+        """Insert a new case; sqlite3.IntegrityError if its id is already stored"""
+        with self._transaction() as conn:
+            conn.execute(
+                "INSERT INTO qc_cases (qc_case_id, timestamp, status, processed_at, data, similarity, summary) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                self._row(qc_case)
+            )
+
+    def get(self, qc_case_id: str) -> Optional[Dict]:
+        with self._reader() as conn:
+            row = conn.execute("SELECT data FROM qc_cases WHERE qc_case_id = ?", (qc_case_id,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def update(self, qc_case_id: str, fields: Dict[str, Any]) -> Optional[Dict]:
+        """Merge fields into a case atomically; returns the updated case, or None if it does not exist"""
+        with self._transaction() as conn:
+            row = conn.execute("SELECT data FROM qc_cases WHERE qc_case_id = ?", (qc_case_id,)).fetchone()
+            if row is None:
+                return None
+            qc_case = json.loads(row[0])
+            qc_case.update(fields)
+            conn.execute(
+                "UPDATE qc_cases SET timestamp = ?, status = ?, processed_at = ?, data = ?, similarity = ?, "
+                "summary = ? WHERE qc_case_id = ?",
+                self._row(qc_case)[1:] + (qc_case_id,)
+            )
+        return qc_case
+
+    def page(self, statuses: Iterable[str], limit: int, after: Optional[Tuple[str, str]] = None,
+             since: Optional[str] = None, until: Optional[str] = None,
+             min_similarity: Optional[float] = None,
+             max_similarity: Optional[float] = None) -> Tuple[List[Dict], Optional[Tuple[str, str]]]:
+        """
+        One page of case summaries in the given statuses, oldest first, starting
+        after the (timestamp, qc_case_id) key `after`. since/until bound the
+        timestamp (ISO strings, until exclusive). Returns the summaries and the
+        key to continue from, or None on the last page.
+
+        Each status is read as a range of idx_qc_cases_queue stopped after
+        limit + 1 rows and the sorted runs are merged, so a page costs the same
+        however many cases are queued (similarity filters are checked on the
+        scanned rows).
+        """
+        conditions, params = [], []
+        if after is not None:
+            conditions.append("(timestamp, qc_case_id) > (?, ?)")
+            params.extend(after)
+        if since is not None:
+            conditions.append("timestamp >= ?")
+            params.append(since)
+        if until is not None:
+            conditions.append("timestamp < ?")
+            params.append(until)
+        if min_similarity is not None:
+            conditions.append("similarity >= ?")
+            params.append(min_similarity)
+        if max_similarity is not None:
+            conditions.append("similarity <= ?")
+            params.append(max_similarity)
+        query = (
+            "SELECT timestamp, qc_case_id, summary FROM qc_cases WHERE status = ?"
+            + "".join(f" AND {condition}" for condition in conditions)
+            + " ORDER BY timestamp, qc_case_id LIMIT ?"
+        )
+        with self._reader() as conn:
+            runs = [conn.execute(query, [status, *params, limit + 1]).fetchall() for status in dict.fromkeys(statuses)]
+        rows = list(heapq.merge(*runs))[:limit + 1]
+        next_key = (rows[limit - 1][0], rows[limit - 1][1]) if len(rows) > limit else None
+        return [json.loads(row[2]) for row in rows[:limit]], next_key
+
+    def status_counts(self) -> Dict[str, int]:
+        with self._reader() as conn:
+            rows = conn.execute("SELECT status, count FROM qc_status_counts WHERE count > 0").fetchall()
+        return dict(rows)
+
+    def is_empty(self) -> bool:
+        with self._reader() as conn:
+            return conn.execute("SELECT 1 FROM qc_cases LIMIT 1").fetchone() is None
+
+    def import_cases(self, qc_cases: Iterable[Dict]) -> int:
+        """Insert cases whose id is not stored yet (in one transaction); returns how many were added"""
+        added = 0
+        with self._transaction() as conn:
+            for qc_case in qc_cases:
+                added += conn.execute(
+                    "INSERT OR IGNORE INTO qc_cases (qc_case_id, timestamp, status, processed_at, data, similarity, "
+                    "summary) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    self._row(qc_case)
+                ).rowcount
+        return added
+
+
+def legacy_case_files(directory: str) -> List[str]:
+    """Case files written by the JSON-file queue (one <qc_case_id>.json per case)"""
+    if not os.path.isdir(directory):
+        return []
+    return sorted(
+        os.path.join(directory, name) for name in os.listdir(directory)
+        if name.endswith(".json") and name.startswith("qc_")
+    )
+
+
+def migrate_json_dir(directory: str, store: "QCStore") -> Dict[str, int]:
+    """
+    Import qc_queue/*.json case files into the store. Cases already present are
+    left untouched, so the migration can be re-run safely.
+    """
+    qc_cases = []
+    failed = 0
+    files = legacy_case_files(directory)
+    for path in files:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                qc_case = json.load(f)
+            qc_case.setdefault("qc_case_id", os.path.splitext(os.path.basename(path))[0])
+            qc_cases.append(qc_case)
+        except (OSError, ValueError) as e:
+            logger.error("❌ Could not read QC case file %s: %s", path, e)
+            failed += 1
+    imported = store.import_cases(qc_cases)
+    return {
+        "files": len(files),
+        "imported": imported,
+        "already_present": len(qc_cases) - imported,
+        "failed": failed,
+    }
+
+
+def main() -> None:
+    """
+    Usage (from backend/):
+        python -m app.services.qc_store migrate qc_queue
+        python -m app.services.qc_store migrate qc_queue --db qc_queue/qc_cases.sqlite3
+    """
+    parser = argparse.ArgumentParser(description="QC case store maintenance")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    migrate = subparsers.add_parser("migrate", help="import qc_queue/*.json case files")
+    migrate.add_argument("directory", help="directory holding the <qc_case_id>.json files")
+    migrate.add_argument("--db", default=default_db_path(), help="SQLite store path (default: QC_DB_PATH)")
+    args = parser.parse_args()
+
+    configure_logging(log_format="text")
+    os.makedirs(os.path.dirname(args.db) or ".", exist_ok=True)
+    result = migrate_json_dir(args.directory, QCStore(args.db))
+    logger.info("📋 Migrated QC cases into %s", args.db)
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -2,171 +2,200 @@ import requests
 import aiofiles
 import asyncio
 import os
+import re
 import json
-from typing import Optional
-from azure.storage.blob import BlobClient, ContainerClient, ContentSettings
-from urllib.parse import urlparse, parse_qs
-import mimetypes
+from typing import Dict, List, Optional
+from app.core.config import settings
+from app.services.blob_transfer_service import blob_transfer_service
+from app.utils.upload_encoding import encode_for_upload
+from app.core.telemetry import record_provider_error, span
+from app.core.logging import Truncated, get_logger
+
+logger = get_logger(__name__)
+
+
+def _natural_key(name: str) -> list:
+    # part2.json before part10.json
+    return [int(part) if part.isdigit() else part for part in re.split(r"(\d+)", name)]
+
 
 class SarvamBatchService:
     def __init__(self, api_key: str):
         self.api_key = api_key
+        self.base_url = settings.SARVAM_BASE_URL
         self.headers = {"API-Subscription-Key": self.api_key}
 
     def initialize_job(self) -> Optional[dict]:
-        url = "https://api.sarvam.ai/speech-to-text/job/init"
+        url = f"{self.base_url}/speech-to-text/job/init"
         try:
             response = requests.post(url, headers=self.headers)
-            print(f"🔍 Job initialization response: {response.status_code}")
+            logger.debug("🔍 Job initialization response: %s", response.status_code)
             if response.status_code == 202:
                 result = response.json()
-                print(f"✅ Job initialized with ID: {result.get('job_id', 'unknown')}")
+                logger.info("✅ Job initialized with ID: %s", result.get('job_id', 'unknown'))
                 return result
             else:
-                print(f"❌ Job initialization failed: {response.status_code} - {response.text}")
+                logger.error("❌ Job initialization failed: %s - %s", response.status_code, Truncated(response.text))
+                record_provider_error("sarvam_batch", f"init_http_{response.status_code}")
                 return None
         except Exception as e:
-            print(f"❌ Job initialization error: {e}")
+            logger.error("❌ Job initialization error: %s", e)
+            record_provider_error("sarvam_batch", "init_exception")
             return None
 
-    def start_job(self, job_id: str, language_code: str) -> Optional[dict]:
-        url = "https://api.sarvam.ai/speech-to-text/job"
-        headers = {**self.headers, "Content-Type": "application/json"}
-        data = {"job_id": job_id, "job_parameters": {"language_code": language_code}}
-        response = requests.post(url, headers=headers, data=json.dumps(data))
-        if response.status_code == 200:
-            return response.json()
-        print(f"Failed to start job: {response.status_code} {response.text}")  # Debug print
-        return None
-
     def check_job_status(self, job_id: str) -> Optional[dict]:
-        url = f"https://api.sarvam.ai/speech-to-text/job/{job_id}/status"
+        url = f"{self.base_url}/speech-to-text/job/{job_id}/status"
         response = requests.get(url, headers=self.headers)
         if response.status_code == 200:
             return response.json()
+        record_provider_error("sarvam_batch", f"status_http_{response.status_code}")
         return None
 
-    def _get_blob_info(self, sas_url: str):
-        parsed = urlparse(sas_url)
-        account_url = f"{parsed.scheme}://{parsed.netloc}"
-        container_name = parsed.path.split('/')[1]
-        # Directory path after container
-        dir_path = '/'.join(parsed.path.split('/')[2:])
-        sas_token = parsed.query
-        return account_url, container_name, dir_path, sas_token
-
-    def upload_file_to_azure(self, input_storage_path: str, local_file_path: str):
-        account_url, container_name, dir_path, sas_token = self._get_blob_info(input_storage_path)
-        # The dir_path is the directory, we need to upload to dir_path/filename
-        filename = os.path.basename(local_file_path)
-        blob_path = f"{dir_path}/{filename}" if dir_path else filename
-        blob = BlobClient(account_url=account_url, container_name=container_name, blob_name=blob_path, credential=sas_token)
-        # Guess the MIME type
-        mime_type, _ = mimetypes.guess_type(filename)
-        if not mime_type:
-            mime_type = "application/octet-stream"
-        with open(local_file_path, "rb") as data:
-            blob.upload_blob(
-                data,
-                overwrite=True,
-                content_settings=ContentSettings(content_type=mime_type)
-            )
-        print(f"✅ Uploaded {filename} to Azure Blob Storage at {blob_path} with content type {mime_type}")
+    def upload_file_to_azure(self, input_storage_path: str, local_file_path: str) -> dict:
+        # Uploads to input_storage_path/filename in parallel blocks over a pooled connection
+        return blob_transfer_service.upload_file(input_storage_path, local_file_path)
 
     def list_blobs(self, output_storage_path: str):
-        account_url, container_name, dir_path, sas_token = self._get_blob_info(output_storage_path)
-        container = ContainerClient(account_url=account_url, container_name=container_name, credential=sas_token)
-        blob_list = container.list_blobs(name_starts_with=dir_path)
-        return [blob.name for blob in blob_list]
-
-    def download_result_json(self, output_storage_path: str, destination_dir: str) -> Optional[str]:
-        account_url, container_name, dir_path, sas_token = self._get_blob_info(output_storage_path)
-        container = ContainerClient(account_url=account_url, container_name=container_name, credential=sas_token)
-        blobs = list(container.list_blobs(name_starts_with=dir_path))
-        json_blob = next((b for b in blobs if b.name.endswith('.json')), None)
-        if not json_blob:
-            print("No result JSON found in output storage.")
+        return blob_transfer_service.list_blob_names(output_storage_path)
+
+    def fetch_results(self, output_storage_path: str, job_id: Optional[str] = None) -> Optional[dict]:
+        """
+        Stream every JSON output blob of a job straight into memory and merge them.
+        Raw outputs are only written to disk when SARVAM_PERSIST_RAW_OUTPUTS is enabled.
+        """
+        json_blobs = sorted(
+            (name for name in self.list_blobs(output_storage_path) if name.endswith('.json')), key=_natural_key
+        )
+        if not json_blobs:
+            logger.warning("⚠️ No result JSON found in output storage.")
             return None
-        blob_client = container.get_blob_client(json_blob.name)
-        os.makedirs(destination_dir, exist_ok=True)
-        local_path = os.path.join(destination_dir, os.path.basename(json_blob.name))
-        with open(local_path, "wb") as f:
-            data = blob_client.download_blob().readall()
-            f.write(data)
-        print(f"✅ Downloaded result JSON to {local_path}")
-        return local_path
+        results = []
+        for blob_name in json_blobs:
+            data, _ = blob_transfer_service.download_json(output_storage_path, blob_name)
+            if settings.SARVAM_PERSIST_RAW_OUTPUTS:
+                self._persist_raw_output(job_id, blob_name, data)
+            results.append(data)
+        return self._merge_results(results)
+
+    def _merge_results(self, results: List[dict]) -> dict:
+        """Merge multi-file job outputs: join transcripts in blob order and diarized entries by start time"""
+        if len(results) == 1:
+            return results[0]
+        transcripts = []
+        entries = []
+        has_diarization = False
+        for result in results:
+            if not isinstance(result, dict):
+                continue
+            text = result.get("transcript") or result.get("text")
+            if text:
+                transcripts.append(text)
+            diarized = result.get("diarized_transcript")
+            if isinstance(diarized, dict):
+                has_diarization = True
+                entries.extend(diarized.get("entries") or [])
+        if all(isinstance(entry.get("start_time_seconds"), (int, float)) for entry in entries):
+            entries.sort(key=lambda entry: entry["start_time_seconds"])
+        first = next((r for r in results if isinstance(r, dict)), {})
+        merged: Dict = {**first, "transcript": " ".join(transcripts)}
+        merged["diarized_transcript"] = {"entries": entries} if has_diarization else None
+        logger.info("✅ Merged %s result files (%s diarized entries)", len(results), len(entries))
+        return merged
+
+    def _persist_raw_output(self, job_id: Optional[str], blob_name: str, data) -> None:
+        # Job-scoped directory so concurrent jobs never collide on file names
+        job_dir = os.path.join(settings.SARVAM_RAW_OUTPUT_DIR, job_id or "unknown_job")
+        os.makedirs(job_dir, exist_ok=True)
+        local_path = os.path.join(job_dir, os.path.basename(blob_name))
+        with open(local_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        logger.debug("🐛 Persisted raw Sarvam output to %s", local_path)
 
     async def batch_transcribe(self, wav_path:str, language_code:str="ta-IN",
-                               diarization:bool=True, speaker_embedding=None):
+                               diarization:bool=True, speaker_embedding=None,
+                               timings: Optional[Dict[str, float]] = None):
+        # Blocking HTTP/storage calls run in worker threads so concurrent jobs overlap.
+        # Stage durations are recorded into `timings` when a dict is passed.
         # Step 1: Initialize the job
-        job_info = self.initialize_job()
+        with span("sarvam_init", timings):
+            job_info = await asyncio.to_thread(self.initialize_job)
         if not job_info:
-            print("Job initialization failed")
+            logger.error("❌ Job initialization failed")
             return None, None
         job_id = job_info["job_id"]
         input_storage_path = job_info["input_storage_path"]
         output_storage_path = job_info["output_storage_path"]
 
-        # Step 2: Upload file to Azure
-        self.upload_file_to_azure(input_storage_path, wav_path)
-        print("File upload step complete. Waiting before starting job...")
-        await asyncio.sleep(5)  # Wait 5 seconds to ensure file is available
+        # Step 2: Encode for upload (e.g. FLAC) and upload file to Azure
+        with span("upload_encode", timings):
+            upload_path = await asyncio.to_thread(encode_for_upload, wav_path, "sarvam_batch")
+        with span("sarvam_upload", timings):
+            await asyncio.to_thread(self.upload_file_to_azure, input_storage_path, upload_path)
+        logger.info("File upload step complete. Waiting before starting job...")
+        await asyncio.sleep(settings.SARVAM_BATCH_SETTLE_SECONDS)  # ensure the file is available
 
         # Step 3: Start the job
         job_parameters = {"language_code": language_code,
                           "with_diarization": str(diarization).lower()}
         if speaker_embedding is not None:
             job_parameters["speaker_embedding"] = speaker_embedding.tolist()
-        job_start_response = self.start_job_with_params(job_id, job_parameters)
+        with span("sarvam_start", timings):
+            job_start_response = await asyncio.to_thread(self.start_job_with_params, job_id, job_parameters)
         if not job_start_response:
-            print("Failed to start job (see above for details)")
+            logger.error("❌ Failed to start job (see above for details)")
             return None, None
 
         # Step 4: Poll for job status
-        print("Polling for job status...")
-        while True:
-            job_status = self.check_job_status(job_id)
-            if not job_status:
-                print("Failed to get job status")
-                return None, None
-            status = job_status["job_state"]
-            if status == "Completed":
-                print("Job completed successfully!")
-                break
-            elif status == "Failed":
-                print("Job failed!")
-                return None, None
-            else:
-                print(f"Current status: {status}")
-                await asyncio.sleep(10)
+        logger.info("Polling for job status...")
+        with span("sarvam_poll", timings):
+            while True:
+                job_status = await asyncio.to_thread(self.check_job_status, job_id)
+                if not job_status:
+                    logger.error("❌ Failed to get job status")
+                    return None, None
+                status = job_status["job_state"]
+                if status == "Completed":
+                    logger.info("✅ Job %s completed", job_id)
+                    break
+                elif status == "Failed":
+                    logger.error("❌ Job %s failed", job_id)
+                    record_provider_error("sarvam_batch", "job_failed")
+                    return None, None
+                else:
+                    logger.debug("Current status: %s", status)
+                    await asyncio.sleep(settings.SARVAM_BATCH_POLL_SECONDS)
 
-        # Step 5: Download results from Azure
-        result_json_path = self.download_result_json(output_storage_path, "downloads")
-        if not result_json_path:
-            print("No result JSON found.")
+        # Step 5: Stream results from Azure straight into memory
+        with span("sarvam_download", timings):
+            result_data = await asyncio.to_thread(self.fetch_results, output_storage_path, job_id)
+        if not result_data:
+            logger.warning("⚠️ No result JSON found.")
             return None, None
         # Step 6: Extract transcript and diarized_transcript
-        with open(result_json_path, "r", encoding="utf-8") as f:
-            result_data = json.load(f)
         transcript = result_data.get("transcript") or result_data.get("text") or str(result_data)
         diarized_transcript = result_data.get("diarized_transcript")
-        print(f"Transcript: {transcript[:200]}..." if transcript else "No transcript found.")
+        if transcript:
+            logger.debug("Transcript: %s", Truncated(transcript, 200))
+        else:
+            logger.warning("⚠️ No transcript found.")
         return transcript, diarized_transcript
 
     def start_job_with_params(self, job_id: str, job_parameters: dict) -> Optional[dict]:
-        url = "https://api.sarvam.ai/speech-to-text/job"
+        url = f"{self.base_url}/speech-to-text/job"
         headers = {**self.headers, "Content-Type": "application/json"}
         data = {"job_id": job_id, "job_parameters": job_parameters}
         try:
             response = requests.post(url, headers=headers, data=json.dumps(data))
-            print(f"🔍 Start job response: {response.status_code}")
+            logger.debug("🔍 Start job response: %s", response.status_code)
             if response.status_code == 200:
                 result = response.json()
-                print(f"✅ Job started successfully")
+                logger.info("✅ Job started successfully")
                 return result
             else:
-                print(f"❌ Failed to start job: {response.status_code} - {response.text}")
+                logger.error("❌ Failed to start job: %s - %s", response.status_code, Truncated(response.text))
+                record_provider_error("sarvam_batch", f"start_http_{response.status_code}")
                 return None
         except Exception as e:
-            print(f"❌ Start job error: {e}")
+            logger.error("❌ Start job error: %s", e)
+            record_provider_error("sarvam_batch", "start_exception")
             return None 
\ No newline at end of file
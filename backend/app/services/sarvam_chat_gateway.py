@@ -0,0 +1,140 @@
+import asyncio
+import random
+from typing import Callable, Dict, List, Optional
+
+import httpx
+
+from app.core.config import settings
+from app.core.telemetry import record_provider_error, span
+from app.services.llm_cache import llm_cache
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Status codes worth retrying: rate limiting and transient server errors
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+class SarvamChatGateway:
+    """
+    Shared async client for the Sarvam chat completions API.
+
+    One pooled httpx client serves every caller; a semaphore caps the calls in
+    flight, each call has its own timeout, and rate-limit/transient failures are
+    retried with exponential backoff (honouring Retry-After).
+    """
+
+    def __init__(self, api_key: Optional[str] = None, base_url: Optional[str] = None):
+        self.api_key = api_key if api_key is not None else settings.SARVAM_API_KEY
+        self.base_url = base_url or settings.SARVAM_BASE_URL
+        self.model = settings.SARVAM_CHAT_MODEL
+        self._client: Optional[httpx.AsyncClient] = None
+        self._semaphore = asyncio.Semaphore(settings.SARVAM_CHAT_CONCURRENCY)
+
+    @property
+    def available(self) -> bool:
+        return bool(self.api_key)
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                headers={"api-subscription-key": self.api_key},
+                timeout=httpx.Timeout(settings.SARVAM_CHAT_TIMEOUT, connect=10.0),
+                limits=httpx.Limits(
+                    max_connections=settings.SARVAM_CHAT_CONCURRENCY,
+                    max_keepalive_connections=settings.SARVAM_CHAT_CONCURRENCY
+                )
+            )
+        return self._client
+
+    def _backoff(self, attempt: int, response: Optional[httpx.Response] = None) -> float:
+        retry_after = response.headers.get("retry-after") if response is not None else None
+        if retry_after:
+            try:
+                return float(retry_after)
+            except ValueError:
+                pass
+        return settings.SARVAM_CHAT_BACKOFF_SECONDS * (2 ** attempt) + random.uniform(0, 0.5)
+
+    async def complete(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float = 0.2,
+        max_tokens: Optional[int] = None,
+        timeout: Optional[float] = None,
+        prompt_version: Optional[str] = None,
+        cache_if: Optional[Callable[[str], bool]] = None
+    ) -> str:
+        """
+        Run one chat completion and return the assistant message content.
+        Raises RuntimeError once retries are exhausted or on a non-retryable error.
+
+        prompt_version: version tag of the prompt template; enables the response cache
+        cache_if: only cache responses for which this returns True (e.g. valid JSON)
+        """
+        if not self.available:
+            raise RuntimeError("SARVAM_API_KEY is not configured")
+
+        cache_key = None
+        if prompt_version and temperature <= settings.LLM_CACHE_MAX_TEMPERATURE:
+            cache_key = llm_cache.make_key(prompt_version, self.model, temperature, max_tokens, messages)
+            cached = await asyncio.to_thread(llm_cache.get, cache_key)
+            if cached is not None:
+                return cached
+
+        content = await self._request(messages, temperature, max_tokens, timeout)
+        if cache_key and (cache_if is None or cache_if(content)):
+            await asyncio.to_thread(llm_cache.set, cache_key, content)
+        return content
+
+    async def _request(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float,
+        max_tokens: Optional[int],
+        timeout: Optional[float]
+    ) -> str:
+        payload = {"model": self.model, "messages": messages, "temperature": temperature}
+        if max_tokens is not None:
+            payload["max_tokens"] = max_tokens
+
+        last_error: Optional[Exception] = None
+        for attempt in range(settings.SARVAM_CHAT_MAX_RETRIES + 1):
+            response = None
+            try:
+                async with self._semaphore:
+                    with span("sarvam_chat"):
+                        response = await self._get_client().post(
+                            "/v1/chat/completions",
+                            json=payload,
+                            timeout=timeout or settings.SARVAM_CHAT_TIMEOUT
+                        )
+                if response.is_error:
+                    record_provider_error("sarvam_chat", f"http_{response.status_code}")
+                if response.status_code not in RETRY_STATUS_CODES:
+                    response.raise_for_status()
+                    return response.json()["choices"][0]["message"]["content"] or ""
+                last_error = httpx.HTTPStatusError(
+                    f"Sarvam chat returned {response.status_code}", request=response.request, response=response
+                )
+            except (httpx.TimeoutException, httpx.TransportError) as e:
+                record_provider_error("sarvam_chat", type(e).__name__)
+                last_error = e
+            except (httpx.HTTPStatusError, KeyError, IndexError, ValueError) as e:
+                raise RuntimeError(f"Sarvam chat request failed: {e}")
+
+            if attempt < settings.SARVAM_CHAT_MAX_RETRIES:
+                delay = self._backoff(attempt, response)
+                logger.warning("⚠️ Sarvam chat attempt %s failed (%s), retrying in %.1fs", attempt + 1, last_error, delay)
+                await asyncio.sleep(delay)
+
+        raise RuntimeError(f"Sarvam chat failed after {settings.SARVAM_CHAT_MAX_RETRIES + 1} attempts: {last_error}")
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+sarvam_chat_gateway = SarvamChatGateway()
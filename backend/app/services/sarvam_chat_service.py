@@ -1,31 +1,18 @@
-import os
-from dotenv import load_dotenv
-from sarvamai import SarvamAI
 import logging
-from typing import Optional
 
-load_dotenv()
+from app.services.sarvam_chat_gateway import sarvam_chat_gateway
 
-SARVAM_API_KEY = os.getenv("SARVAM_API_KEY")
-client: Optional[SarvamAI] = None
+# Bump whenever the translation prompt changes so cached translations are not reused
+TRANSLATION_PROMPT_VERSION = "translation-v1"
 
-if SARVAM_API_KEY:
-    try:
-        client = SarvamAI(api_subscription_key=SARVAM_API_KEY)
-    except Exception as e:
-        logging.warning(f"Failed to initialize Sarvam client: {e}")
-        client = None
-else:
-    logging.warning("SARVAM_API_KEY is not set in the environment or .env file. Enhanced translation will be disabled.")
-
-def get_more_accurate_translation(transcribed_text: str, translated_text: str) -> str:
+async def get_more_accurate_translation(transcribed_text: str, translated_text: str) -> str:
     """
     Use Sarvam LLM to compare the original Tamil and the initial English translation,
     and output a grammatically correct, natural, and contextually adapted English translation.
     Only output the improved English translation as a single, natural passage. Do NOT include any explanations, headings, markdown, or extra comments.
     """
-    if not client:
-        logging.warning("Sarvam client not available, returning original translation")
+    if not sarvam_chat_gateway.available:
+        logging.warning("SARVAM_API_KEY is not set, returning original translation")
         return translated_text
     
     try:
@@ -52,11 +39,9 @@ def get_more_accurate_translation(transcribed_text: str, translated_text: str) -
                 )
             }
         ]
-        response = client.chat.completions(
-            messages=messages,
-            temperature=0.2
+        return await sarvam_chat_gateway.complete(
+            messages, temperature=0.2, prompt_version=TRANSLATION_PROMPT_VERSION
         )
-        return response.choices[0].message.content
     except Exception as e:
         logging.error(f"Error in enhanced translation: {e}")
         return translated_text 
\ No newline at end of file
@@ -2,11 +2,16 @@
 
 import httpx
 import aiofiles
+import asyncio
 import os
-import mimetypes
 from typing import Optional, Dict, Any
 from app.core.config import settings
+from app.core.telemetry import record_provider_error, record_upload, span
 from app.schemas.transcription import TranscriptionResponse, TranslationResponse
+from app.utils.upload_encoding import encode_for_upload, upload_mime_type
+from app.core.logging import Truncated, get_logger
+
+logger = get_logger(__name__)
 
 class SarvamService:
     def __init__(self):
@@ -27,13 +32,12 @@ class SarvamService:
         Transcribe audio using Sarvam AI's Saarika speech-to-text API, with optional diarization
         """
         url = f"{self.base_url}/speech-to-text"
+        upload_path = await asyncio.to_thread(encode_for_upload, file_path, "sarvam")
         
-        async with aiofiles.open(file_path, 'rb') as audio_file:
+        async with aiofiles.open(upload_path, 'rb') as audio_file:
             file_bytes = await audio_file.read()
-            filename = os.path.basename(file_path)
-            mime_type, _ = mimetypes.guess_type(filename)
-            if not mime_type:
-                mime_type = "application/octet-stream"
+            filename = os.path.basename(upload_path)
+            mime_type = upload_mime_type(upload_path)
             files = {
                 'file': (filename, file_bytes, mime_type)
             }
@@ -45,15 +49,23 @@ class SarvamService:
             if with_diarization:
                 data['with_diarization'] = 'true'
             
+            record_upload("sarvam_stt", len(file_bytes))
             async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    url, 
-                    headers=self.headers, 
-                    files=files,
-                    data=data,
-                    timeout=60.0
-                )
-                print("Sarvam API response:", response.status_code, response.text)  # Debug print
+                with span("sarvam_stt"):
+                    try:
+                        response = await client.post(
+                            url, 
+                            headers=self.headers, 
+                            files=files,
+                            data=data,
+                            timeout=60.0
+                        )
+                    except httpx.TransportError as e:
+                        record_provider_error("sarvam_stt", type(e).__name__)
+                        raise
+                logger.debug("Sarvam API response: %s %s", response.status_code, Truncated(response.text))
+                if response.is_error:
+                    record_provider_error("sarvam_stt", f"http_{response.status_code}")
                 response.raise_for_status()
                 result = response.json()
                 diarized_transcript = result.get('diarized_transcript')
@@ -78,13 +90,13 @@ class SarvamService:
         """
         try:
             # Since batch API doesn't exist, we'll use regular API with audio splitting
-            print("🌐 Using Sarvam regular API with audio splitting...")
+            logger.info("🌐 Using Sarvam regular API with audio splitting...")
             
             # For now, just use the regular API
             return await self.transcribe_audio(file_path, language_code, model, with_diarization)
             
         except Exception as e:
-            print(f"❌ Sarvam processing failed: {e}")
+            logger.error("❌ Sarvam processing failed: %s", e)
             return TranscriptionResponse(
                 transcription="",
                 language_detected=language_code,
@@ -130,12 +142,19 @@ class SarvamService:
                     "mode": "formal",
                     "model": "sarvam-translate:v1"
                 }
-                response = await client.post(
-                    url,
-                    headers={**self.headers, "Content-Type": "application/json"},
-                    json=payload,
-                    timeout=30.0
-                )
+                with span("sarvam_translate"):
+                    try:
+                        response = await client.post(
+                            url,
+                            headers={**self.headers, "Content-Type": "application/json"},
+                            json=payload,
+                            timeout=30.0
+                        )
+                    except httpx.TransportError as e:
+                        record_provider_error("sarvam_translate", type(e).__name__)
+                        raise
+                if response.is_error:
+                    record_provider_error("sarvam_translate", f"http_{response.status_code}")
                 response.raise_for_status()
                 result = response.json()
                 translated_chunks.append(result.get('translated_text', ''))
@@ -0,0 +1,172 @@
+import asyncio
+import os
+import subprocess
+import threading
+import time
+from collections import deque
+from typing import Dict, Optional
+
+import aiofiles
+import httpx
+
+from app.core.config import backend_path, settings
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# stderr lines of the server process kept for startup error messages
+STDERR_TAIL_LINES = 50
+
+
+class WhisperServerService:
+    """
+    Managed local whisper.cpp server.
+
+    The `whisper-server` process is started once (lazily or at app startup) with the
+    configured model, health-checked, and reached over localhost HTTP through a pooled
+    client. If the process dies or stops answering it is restarted on the next call.
+    Set WHISPER_SERVER_URL to use an externally managed server instead.
+    """
+
+    def __init__(self):
+        self.binary_path = backend_path(settings.WHISPER_SERVER_BINARY)
+        self.model_path = backend_path(settings.WHISPER_MODEL_PATH)
+        self.manage_process = not settings.WHISPER_SERVER_URL
+        self.base_url = settings.WHISPER_SERVER_URL or f"http://{settings.WHISPER_SERVER_HOST}:{settings.WHISPER_SERVER_PORT}"
+        self._process: Optional[subprocess.Popen] = None
+        self._client: Optional[httpx.AsyncClient] = None
+        self._lock = asyncio.Lock()
+        self._stderr_tail: deque = deque(maxlen=STDERR_TAIL_LINES)
+        self.restart_count = 0
+
+    @property
+    def available(self) -> bool:
+        if not self.manage_process:
+            return True
+        return os.path.exists(self.binary_path) and os.path.exists(self.model_path)
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=httpx.Timeout(settings.WHISPER_REQUEST_TIMEOUT, connect=5.0),
+                limits=httpx.Limits(
+                    max_connections=settings.WHISPER_SERVER_MAX_CONNECTIONS,
+                    max_keepalive_connections=settings.WHISPER_SERVER_MAX_CONNECTIONS
+                )
+            )
+        return self._client
+
+    def _drain_stderr(self, process: subprocess.Popen, tail: deque) -> None:
+        # whisper-server logs every request to stderr; an unread pipe fills up and blocks the server
+        for line in iter(process.stderr.readline, b""):
+            text = line.decode("utf-8", errors="ignore").rstrip()
+            tail.append(text)
+            logger.debug("whisper-server: %s", text)
+        process.stderr.close()
+
+    def _process_alive(self) -> bool:
+        return self._process is not None and self._process.poll() is None
+
+    async def health_check(self) -> bool:
+        """True once the server answers and the model is loaded"""
+        client = self._get_client()
+        try:
+            response = await client.get("/health", timeout=2.0)
+            if response.status_code == 404:
+                # Older whisper-server builds have no /health; any answer on / means it is up
+                response = await client.get("/", timeout=2.0)
+            return response.status_code < 500
+        except httpx.HTTPError:
+            return False
+
+    async def ensure_running(self) -> None:
+        async with self._lock:
+            if self.manage_process and not self._process_alive():
+                await self._start()
+            elif not await self.health_check():
+                if not self.manage_process:
+                    raise RuntimeError(f"whisper server at {self.base_url} is not healthy")
+                logger.warning("⚠️ whisper-server not answering health checks, restarting")
+                await self._start()
+
+    async def _start(self) -> None:
+        if not self.available:
+            raise RuntimeError(f"whisper.cpp binary or model not found: {self.binary_path}, {self.model_path}")
+        await self._stop_process()
+        cmd = [
+            self.binary_path,
+            "-m", self.model_path,
+            "--host", settings.WHISPER_SERVER_HOST,
+            "--port", str(settings.WHISPER_SERVER_PORT),
+            "-t", str(settings.WHISPER_SERVER_THREADS),
+        ]
+        logger.info("🦜 Starting whisper-server: %s", ' '.join(cmd))
+        self._process = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+        self._stderr_tail = deque(maxlen=STDERR_TAIL_LINES)
+        drainer = threading.Thread(
+            target=self._drain_stderr, args=(self._process, self._stderr_tail), name="whisper-server-stderr", daemon=True
+        )
+        drainer.start()
+        self.restart_count += 1
+        started = time.perf_counter()
+        while time.perf_counter() - started < settings.WHISPER_SERVER_STARTUP_TIMEOUT:
+            if not self._process_alive():
+                drainer.join(timeout=1.0)
+                stderr = "\n".join(self._stderr_tail)
+                raise RuntimeError(f"whisper-server exited with code {self._process.returncode}: {stderr.strip()[-500:]}")
+            if await self.health_check():
+                logger.info("✅ whisper-server ready in %.1fs at %s", time.perf_counter() - started, self.base_url)
+                return
+            await asyncio.sleep(0.5)
+        await self._stop_process()
+        raise RuntimeError(f"whisper-server did not become healthy within {settings.WHISPER_SERVER_STARTUP_TIMEOUT}s")
+
+    async def _stop_process(self) -> None:
+        process, self._process = self._process, None
+        if process is not None and process.poll() is None:
+            process.terminate()
+            # Waiting on the process in a worker thread keeps the event loop serving requests
+            try:
+                await asyncio.to_thread(process.wait, 10)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                await asyncio.to_thread(process.wait)
+
+    async def transcribe(self, audio_path: str, language: str = "ta",
+                         response_format: str = "verbose_json") -> Dict:
+        """
+        Transcribe a 16 kHz WAV file. Returns the server's JSON response
+        (`text` plus `segments` with start/end seconds for verbose_json).
+        """
+        async with aiofiles.open(audio_path, "rb") as f:
+            audio_data = await f.read()
+        data = {"response_format": response_format, "language": language, "temperature": "0.0"}
+        for attempt in range(2):
+            await self.ensure_running()
+            try:
+                response = await self._get_client().post(
+                    "/inference",
+                    files={"file": (os.path.basename(audio_path), audio_data, "audio/wav")},
+                    data=data
+                )
+                response.raise_for_status()
+                return response.json()
+            except httpx.TransportError as e:
+                # Connection refused/reset usually means the server died mid-request
+                if attempt == 1:
+                    raise RuntimeError(f"whisper-server request failed: {e}")
+                logger.warning("⚠️ whisper-server request failed (%s), retrying after restart check", e)
+
+    async def transcribe_text(self, audio_path: str, language: str = "ta") -> str:
+        result = await self.transcribe(audio_path, language=language, response_format="json")
+        return result.get("text", "")
+
+    async def shutdown(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        await self._stop_process()
+
+
+whisper_server_service = WhisperServerService()
@@ -0,0 +1,117 @@
+# Optimal edit alignment of a reference and a hypothesis (words or characters)
+from typing import Dict, Iterator, Sequence, Tuple, Union
+
+from rapidfuzz.distance import Levenshtein
+
+
+class Alignment:
+    """
+    Counts of one minimum-edit alignment of hypothesis against reference:
+    hits, substitutions, deletions (reference only) and insertions (hypothesis only).
+    """
+
+    __slots__ = ("hits", "substitutions", "deletions", "insertions", "reference_length", "hypothesis_length")
+
+    def __init__(self, hits: int, substitutions: int, deletions: int, insertions: int,
+                 reference_length: int, hypothesis_length: int):
+        self.hits = hits
+        self.substitutions = substitutions
+        self.deletions = deletions
+        self.insertions = insertions
+        self.reference_length = reference_length
+        self.hypothesis_length = hypothesis_length
+
+    @property
+    def errors(self) -> int:
+        return self.substitutions + self.deletions + self.insertions
+
+    @property
+    def error_rate(self) -> float:
+        """(S + D + I) / N, N = reference length (WER for words, CER for characters)"""
+        return self.errors / self.reference_length if self.reference_length else 0.0
+
+    @property
+    def accuracy(self) -> float:
+        """Aligned matches over the longer sequence"""
+        longest = max(self.reference_length, self.hypothesis_length)
+        return self.hits / longest if longest else 0.0
+
+    @property
+    def similarity(self) -> float:
+        """2 * matches / (len(ref) + len(hyp)), the fuzz.ratio measure taken over this alignment"""
+        total = self.reference_length + self.hypothesis_length
+        return 2 * self.hits / total if total else 1.0
+
+    def as_dict(self) -> Dict[str, Union[int, float]]:
+        return {
+            "hits": self.hits,
+            "substitutions": self.substitutions,
+            "deletions": self.deletions,
+            "insertions": self.insertions,
+            "reference_length": self.reference_length,
+            "hypothesis_length": self.hypothesis_length,
+            "error_rate": self.error_rate,
+        }
+
+
+def align(reference: Sequence, hypothesis: Sequence) -> Alignment:
+    """
+    Align two sequences (strings, or lists of hashable tokens such as words).
+    rapidfuzz computes the edit script with a bit-parallel Levenshtein and
+    Hirschberg's divide and conquer, so memory stays linear in the input length.
+    """
+    counts = {"replace": 0, "delete": 0, "insert": 0}
+    for tag, _, _ in Levenshtein.editops(reference, hypothesis):
+        counts[tag] += 1
+    substitutions, deletions = counts["replace"], counts["delete"]
+    return Alignment(
+        hits=len(reference) - substitutions - deletions,
+        substitutions=substitutions,
+        deletions=deletions,
+        insertions=counts["insert"],
+        reference_length=len(reference),
+        hypothesis_length=len(hypothesis),
+    )
+
+
+# Shortest equal run trusted as a cut point between chunks
+MIN_ANCHOR = 3
+
+# Smallest chunk the API accepts; shorter windows rarely contain an anchor and mostly re-align
+MIN_CHUNK_SIZE = 200
+
+
+def iter_aligned_opcodes(reference: Sequence, hypothesis: Sequence,
+                         chunk_size: int = 2000) -> Iterator[Tuple[str, int, int, int, int]]:
+    """
+    Alignment opcodes (tag, ref_start, ref_end, hyp_start, hyp_end) computed chunk by chunk.
+
+    Each step aligns chunk_size reference tokens against a proportional stretch of
+    the hypothesis (plus slack) and commits everything up to the last equal run of
+    at least MIN_ANCHOR tokens, so the alignment resynchronizes at the next chunk.
+    A window without such a run (an insertion or deletion longer than the window)
+    is doubled on both sides until one appears; once it covers the rest of both
+    inputs everything left is aligned in one go. Work per chunk is bounded by the
+    longest unanchored stretch and the first opcodes are available immediately;
+    the result is optimal within each window and near-optimal overall.
+    """
+    ratio = max(1.0, len(hypothesis) / len(reference)) if reference else 1.0
+    chunk_size = max(1, chunk_size)
+    i = j = 0
+    while i < len(reference) or j < len(hypothesis):
+        ref_span, hyp_span = chunk_size, int(chunk_size * ratio) + chunk_size // 2
+        while True:
+            ref_end = min(len(reference), i + ref_span)
+            hyp_end = min(len(hypothesis), j + hyp_span)
+            opcodes = list(Levenshtein.opcodes(reference[i:ref_end], hypothesis[j:hyp_end]))
+            if ref_end == len(reference) and hyp_end == len(hypothesis):
+                break
+            anchors = [k for k, op in enumerate(opcodes) if op.tag == "equal" and op.src_end - op.src_start >= MIN_ANCHOR]
+            if anchors:
+                opcodes = opcodes[:anchors[-1] + 1]
+                break
+            ref_span, hyp_span = ref_span * 2, hyp_span * 2
+        for op in opcodes:
+            yield op.tag, i + op.src_start, i + op.src_end, j + op.dest_start, j + op.dest_end
+        last = opcodes[-1]
+        i, j = i + last.src_end, j + last.dest_end
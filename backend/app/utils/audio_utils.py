@@ -12,6 +12,9 @@ import torchaudio
 from app.core.config import settings
 import subprocess
 from pyannote.audio import Pipeline
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
 
 SAMPLE_RATE = 16000
 VAD_MODE     = 2               # 0-3
@@ -26,16 +29,12 @@ try:
     sb_embedder = EncoderClassifier.from_hparams(
         source='speechbrain/spkrec-ecapa-voxceleb',
         run_opts={'device': 'cpu'})
-    print("✅ Successfully loaded speechbrain embedder")
+    logger.info("✅ Successfully loaded speechbrain embedder")
 except ImportError:
-    print("⚠️  speechbrain not installed. Speaker embedding will be disabled.")
-    print("💡 To install speechbrain, you may need to:")
-    print("   1. Install Visual Studio Build Tools")
-    print("   2. Install CMake")
-    print("   3. Run: pip install speechbrain")
+    logger.warning("⚠️ speechbrain not installed, speaker embedding is disabled "
+                   "(install Visual Studio Build Tools and CMake, then: pip install speechbrain)")
 except Exception as e:
-    print(f"❌ Error loading speechbrain embedder: {e}")
-    print("Speaker embedding extraction will be disabled.")
+    logger.error("❌ Error loading speechbrain embedder, speaker embedding is disabled: %s", e)
 
 # Initialize pyannote models with error handling - make it optional
 pn_model = None
@@ -43,44 +42,38 @@ pn_infer = None
 try:
     from pyannote.audio import Model, Inference
     if settings.HUGGINGFACE_AUTH_TOKEN:
-        print(f"🔑 Attempting to load pyannote model with token: {settings.HUGGINGFACE_AUTH_TOKEN[:10]}...")
+        logger.info("🔑 Attempting to load pyannote model with HUGGINGFACE_AUTH_TOKEN")
         pn_model = Model.from_pretrained("pyannote/embedding", 
                                         use_auth_token=settings.HUGGINGFACE_AUTH_TOKEN)
         pn_infer = Inference(pn_model, window=EMB_WINDOW)
-        print("✅ Successfully loaded pyannote embedding model with authentication")
+        logger.info("✅ Successfully loaded pyannote embedding model with authentication")
     else:
-        print("⚠️  HUGGINGFACE_AUTH_TOKEN not set. Pyannote model will not be available.")
+        logger.warning("⚠️  HUGGINGFACE_AUTH_TOKEN not set. Pyannote model will not be available.")
 except ImportError:
-    print("⚠️  pyannote.audio not installed. Pyannote model will not be available.")
-    print("💡 To install pyannote.audio, you may need to:")
-    print("   1. Install Visual Studio Build Tools")
-    print("   2. Install CMake")
-    print("   3. Run: pip install pyannote.audio")
+    logger.warning("⚠️ pyannote.audio not installed, the pyannote model is not available "
+                   "(install Visual Studio Build Tools and CMake, then: pip install pyannote.audio)")
 except Exception as e:
-    print(f"❌ Error loading pyannote embedding model: {e}")
-    print("💡 You may need to:")
-    print("   1. Visit https://hf.co/pyannote/embedding to accept the user conditions")
-    print("   2. Check if your token has the right permissions")
-    print("   3. Try logging in with: huggingface-cli login")
-    print("Speaker embedding extraction will be disabled.")
+    logger.error("❌ Error loading pyannote embedding model, speaker embedding is disabled: %s "
+                 "(accept the conditions at https://hf.co/pyannote/embedding, check the token's permissions "
+                 "or run: huggingface-cli login)", e)
 
 def resample_audio(file_path, target_sr=16000):
     y, sr = librosa.load(file_path, sr=None)
-    print(f"[resample_audio] Original duration: {len(y)/sr:.2f}s, Sample rate: {sr}")
+    logger.debug("[resample_audio] Original duration: %.2fs, Sample rate: %s", len(y) / sr, sr)
     y_resampled = librosa.resample(y, orig_sr=sr, target_sr=target_sr)
-    print(f"[resample_audio] Resampled duration: {len(y_resampled)/target_sr:.2f}s, Sample rate: {target_sr}")
+    logger.debug("[resample_audio] Resampled duration: %.2fs, Sample rate: %s", len(y_resampled) / target_sr, target_sr)
     return y_resampled, target_sr
 
 def normalize_amplitude(audio):
     rms = np.sqrt(np.mean(audio ** 2))
     normalized_audio = audio / (rms + 1e-6)
     result = normalized_audio * 0.1
-    print(f"[normalize_amplitude] Duration: {len(result)/16000:.2f}s")
+    logger.debug("[normalize_amplitude] Duration: %.2fs", len(result) / 16000)
     return result  # Keep it within [-1, 1]
 
 def trim_silence(audio, sr, top_db=40):
     trimmed_audio, _ = librosa.effects.trim(audio, top_db=top_db)
-    print(f"[trim_silence] Duration after trim: {len(trimmed_audio)/sr:.2f}s")
+    logger.debug("[trim_silence] Duration after trim: %.2fs", len(trimmed_audio) / sr)
     return trimmed_audio
 
 def remove_quiet_sections(audio, sr, db_threshold=40):
@@ -94,7 +87,7 @@ def remove_quiet_sections(audio, sr, db_threshold=40):
     cleaned.export(temp_file, format="wav")
     y, _ = librosa.load(temp_file, sr=sr)
     os.remove(temp_file)
-    print(f"[remove_quiet_sections] Duration after remove: {len(y)/sr:.2f}s")
+    logger.debug("[remove_quiet_sections] Duration after remove: %.2fs", len(y) / sr)
     return y
 
 def high_pass_filter(audio, sr, cutoff=85):
@@ -102,7 +95,7 @@ def high_pass_filter(audio, sr, cutoff=85):
     norm_cutoff = cutoff / nyquist
     b, a = butter(1, norm_cutoff, btype='high', analog=False)
     result = lfilter(b, a, audio)
-    print(f"[high_pass_filter] Duration: {len(result)/sr:.2f}s")
+    logger.debug("[high_pass_filter] Duration: %.2fs", len(result) / sr)
     return result
 
 def convert_to_wav(input_path):
@@ -112,26 +105,26 @@ def convert_to_wav(input_path):
         audio = AudioSegment.from_file(input_path)
         audio = audio.set_channels(1)  # force mono for compatibility
         audio.export(wav_path, format="wav")
-        print(f"[convert_to_wav] Converted {input_path} to {wav_path}")
+        logger.info("[convert_to_wav] Converted %s to %s", input_path, wav_path)
         return wav_path
     except Exception as e:
-        print(f"[convert_to_wav] Error converting {input_path} to WAV: {e}")
+        logger.error("[convert_to_wav] Error converting %s to WAV: %s", input_path, e)
         return input_path
 
 def preprocess_audio(file_path):
     if not os.path.exists(file_path):
-        print(f"[preprocess_audio] File does not exist: {file_path}")
+        logger.error("[preprocess_audio] File does not exist: %s", file_path)
         raise FileNotFoundError(f"File does not exist: {file_path}")
     try:
         wav_path = convert_to_wav(file_path)
         if not os.path.exists(wav_path):
-            print(f"[preprocess_audio] WAV conversion failed: {wav_path}")
+            logger.error("[preprocess_audio] WAV conversion failed: %s", wav_path)
             raise FileNotFoundError(f"WAV conversion failed: {wav_path}")
         # Skip all further processing, just return the WAV path
-        print(f"[preprocess_audio] Only WAV conversion applied. Output: {wav_path}")
+        logger.info("[preprocess_audio] Only WAV conversion applied. Output: %s", wav_path)
         return wav_path
     except Exception as e:
-        print(f"[preprocess_audio] Error: {e}. Returning original file path.")
+        logger.error("[preprocess_audio] Error: %s. Returning original file path.", e)
         return file_path 
 
 def to_mono_wav(path:str)->str:
@@ -153,7 +146,7 @@ def reduce_noise(wav_path:str)->str:
 
 def extract_embedding(wav_path:str)->np.ndarray:
     if sb_embedder is None:
-        print("⚠️  speechbrain embedder not available. Returning dummy embedding.")
+        logger.warning("⚠️  speechbrain embedder not available. Returning dummy embedding.")
         # Return a dummy embedding of appropriate size (192 for speechbrain)
         return np.zeros(192)
     
@@ -161,33 +154,10 @@ def extract_embedding(wav_path:str)->np.ndarray:
         emb = sb_embedder.encode_batch(torchaudio.load(wav_path)[0]).squeeze().numpy()
         return emb 
     except Exception as e:
-        print(f"❌ Error extracting embedding: {e}")
+        logger.error("❌ Error extracting embedding: %s", e)
         # Return a dummy embedding as fallback
         return np.zeros(192) 
 
-def transcribe_with_whisper_cpp(audio_path, model_path, binary_path, language="ta"):
-    """
-    Transcribe audio using whisper.cpp (whisper-server.exe) via subprocess.
-    Returns the transcript as a string.
-    Raises RuntimeError if the binary is missing or the subprocess fails.
-    """
-    import os
-    import subprocess
-    abs_binary_path = os.path.abspath(binary_path)
-    try:
-        result = subprocess.run(
-            [abs_binary_path, "-m", model_path, "-f", audio_path, "--language", language],
-            capture_output=True, text=True, check=True
-        )
-        return result.stdout
-    except FileNotFoundError:
-        raise RuntimeError(f"whisper.cpp binary not found at: {abs_binary_path}")
-    except subprocess.CalledProcessError as e:
-        # Raise with stderr so the error message is visible
-        raise RuntimeError(f"whisper.cpp failed: {e.stderr.strip()}")
-    except Exception as e:
-        raise RuntimeError(f"whisper.cpp failed: {e}")
-
 def vad_trim_pyannote(wav_path, token):
     """
     Trim audio using pyannote.audio VAD pipeline. Returns path to trimmed 16kHz audio.
@@ -196,7 +166,7 @@ def vad_trim_pyannote(wav_path, token):
     vad_result = pipeline(wav_path)
     speech_segments = [(segment.start, segment.end) for segment in vad_result.get_timeline()]
     if not speech_segments:
-        print("⚠️  No speech detected by pyannote VAD. Returning original file.")
+        logger.warning("⚠️  No speech detected by pyannote VAD. Returning original file.")
         return wav_path
     audio, sr = sf.read(wav_path)
     speech_audio = np.concatenate([
@@ -209,5 +179,5 @@ def vad_trim_pyannote(wav_path, token):
         sr = 16000
     out_path = wav_path.replace(".wav", "_speech.wav")
     sf.write(out_path, speech_audio, sr, subtype='PCM_16')
-    print(f"[vad_trim_pyannote] Trimmed with pyannote VAD: {out_path}")
+    logger.info("[vad_trim_pyannote] Trimmed with pyannote VAD: %s", out_path)
     return out_path 
\ No newline at end of file
@@ -0,0 +1,57 @@
+# Batch fuzzy matching on top of rapidfuzz's score matrix
+from typing import Callable, List, Optional, Sequence, Tuple
+
+import numpy as np
+from rapidfuzz import fuzz, process
+
+# Rows scored per cdist call, bounds the matrix to ROW_CHUNK x len(choices) float32s
+ROW_CHUNK = 1024
+
+# Joins choices for the substring test; cannot occur in normalized transcript text
+_SEPARATOR = "\x00"
+
+
+def score_matrix(queries: Sequence[str], choices: Sequence[str], scorer: Callable = fuzz.ratio,
+                 score_cutoff: Optional[float] = None, workers: int = -1) -> np.ndarray:
+    """
+    Full len(queries) x len(choices) score matrix, computed on all cores.
+    Scores below score_cutoff are returned as 0.
+    """
+    return process.cdist(queries, choices, scorer=scorer, score_cutoff=score_cutoff,
+                         dtype=np.float32, workers=workers)
+
+
+def best_matches(queries: Sequence[str], choices: Sequence[str], threshold: float,
+                 scorer: Callable = fuzz.ratio, workers: int = -1) -> List[Optional[Tuple[int, float]]]:
+    """
+    For each query, the (index, score) of its best choice scoring at least
+    threshold, or None. Ties go to the earliest choice. Inputs are expected to
+    be normalized already.
+    """
+    results: List[Optional[Tuple[int, float]]] = [None] * len(queries)
+    if not queries or not choices:
+        return results
+    for offset in range(0, len(queries), ROW_CHUNK):
+        scores = score_matrix(queries[offset:offset + ROW_CHUNK], choices, scorer, threshold, workers)
+        best = scores.argmax(axis=1)
+        best_scores = scores[np.arange(len(best)), best]
+        for row in np.nonzero(best_scores >= threshold)[0]:
+            results[offset + row] = (int(best[row]), float(best_scores[row]))
+    return results
+
+
+def contained_in_any(queries: Sequence[str], choices: Sequence[str]) -> List[bool]:
+    """For each query, whether it is a substring of any choice (one search per query)"""
+    joined = _SEPARATOR.join(choices)
+    return [bool(q) and _SEPARATOR not in q and q in joined for q in queries]
+
+
+def matched_anywhere(queries: Sequence[str], choices: Sequence[str], threshold: float,
+                     scorer: Callable = fuzz.ratio, workers: int = -1) -> List[bool]:
+    """For each query, whether it is contained in or fuzzy-matches (>= threshold) any choice"""
+    contained = contained_in_any(queries, choices)
+    pending = [i for i, found in enumerate(contained) if not found]
+    matches = best_matches([queries[i] for i in pending], choices, threshold, scorer, workers)
+    for i, match in zip(pending, matches):
+        contained[i] = match is not None
+    return contained
@@ -0,0 +1,67 @@
+# Time-interval index over diarized transcript segments
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
+from typing import Dict, List, Sequence
+
+
+def segment_start(segment: Dict) -> float:
+    """Start time of a segment in seconds, accepting both `start` and `start_time` keys"""
+    value = segment.get('start', segment.get('start_time', 0.0))
+    return float(value) if value is not None else 0.0
+
+
+def segment_end(segment: Dict) -> float:
+    """End time of a segment in seconds, accepting both `end` and `end_time` keys"""
+    value = segment.get('end', segment.get('end_time', 0.0))
+    return float(value) if value is not None else 0.0
+
+
+class IntervalIndex:
+    """
+    Static sorted-endpoint index over segment time intervals.
+
+    Built once in O(n log n); each query is a bisect plus the matches it returns.
+    Queries return segment positions (indices into `segments`) in ascending order,
+    so callers that break ties by list order behave as with a linear scan.
+    """
+
+    def __init__(self, segments: Sequence[Dict]):
+        self.segments = list(segments)
+        starts = [segment_start(s) for s in self.segments]
+        ends = [segment_end(s) for s in self.segments]
+
+        self._start_order = sorted(range(len(starts)), key=starts.__getitem__)
+        self._starts = [starts[i] for i in self._start_order]
+        self._end_order = sorted(range(len(ends)), key=ends.__getitem__)
+        self._ends = [ends[i] for i in self._end_order]
+        # Ends in start order and their running maximum, for overlap queries
+        self._ends_by_start = [ends[i] for i in self._start_order]
+        self._max_end = list(accumulate(self._ends_by_start, max))
+
+    def __len__(self) -> int:
+        return len(self.segments)
+
+    def near_start(self, t: float, tolerance: float) -> List[int]:
+        """Segments whose start is strictly within `tolerance` seconds of t"""
+        lo = bisect_right(self._starts, t - tolerance)
+        hi = bisect_left(self._starts, t + tolerance)
+        return sorted(self._start_order[lo:hi])
+
+    def near_end(self, t: float, tolerance: float) -> List[int]:
+        """Segments whose end is strictly within `tolerance` seconds of t"""
+        lo = bisect_right(self._ends, t - tolerance)
+        hi = bisect_left(self._ends, t + tolerance)
+        return sorted(self._end_order[lo:hi])
+
+    def near(self, start: float, end: float, tolerance: float) -> List[int]:
+        """Segments whose start is near `start` or whose end is near `end`"""
+        return sorted(set(self.near_start(start, tolerance)) | set(self.near_end(end, tolerance)))
+
+    def overlapping(self, start: float, end: float) -> List[int]:
+        """Segments intersecting [start, end] (touching endpoints count)"""
+        hi = bisect_right(self._starts, end)
+        # Nothing before the first position whose running max end reaches `start` can overlap
+        lo = bisect_left(self._max_end, start, 0, hi)
+        return sorted(
+            self._start_order[k] for k in range(lo, hi) if self._ends_by_start[k] >= start
+        )
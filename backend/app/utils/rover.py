@@ -0,0 +1,206 @@
+# ROVER-style alignment and voting over N transcript hypotheses
+from collections import defaultdict
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from rapidfuzz.distance import Levenshtein
+
+# Half-width of the DP band, in words, around the length-scaled diagonal
+DEFAULT_BAND = 64
+
+# Cost used for cells outside the band or the matrix (int32, leaves headroom for additions)
+_INF = 1 << 29
+
+
+def _to_ids(hypotheses: Sequence[Sequence[str]]) -> List[np.ndarray]:
+    """Map words to integer ids shared across all hypotheses"""
+    vocab: Dict[str, int] = {}
+    return [
+        np.fromiter((vocab.setdefault(w, len(vocab)) for w in words), dtype=np.int64, count=len(words))
+        for words in hypotheses
+    ]
+
+
+def banded_align(a: np.ndarray, b: np.ndarray, band: int = DEFAULT_BAND) -> List[Tuple[Optional[int], Optional[int]]]:
+    """
+    Levenshtein alignment of token id arrays a and b restricted to a band around
+    the diagonal, O(len(a) * band) time and memory.
+
+    Returns (i, j) index pairs in order; i or j is None for an insertion/deletion.
+    """
+    n, m = len(a), len(b)
+    if n == 0 or m == 0:
+        return [(None, j) for j in range(m)] if n == 0 else [(i, None) for i in range(n)]
+
+    # Row i covers columns lo[i] .. lo[i] + width - 1 around the diagonal scaled to m/n;
+    # the band is at least one row step wide so consecutive rows stay connected
+    band = max(band, -(-m // n), 1)
+    width = 2 * band + 1
+    lo = (np.arange(n + 1, dtype=np.int64) * m) // n - band
+    offsets = np.arange(width, dtype=np.int64)
+
+    # Substitution cost for every banded cell at once; diagonal moves into j < 1 or j > m are invalid
+    cols = lo[1:, None] + offsets - 1
+    in_range = (cols >= 0) & (cols < m)
+    sub = np.where(in_range, b[np.clip(cols, 0, m - 1)] != a[:, None], _INF).astype(np.int32)
+
+    # Each stored row is padded with _INF on both sides so shifted reads of the previous row stay in bounds
+    pad = int(np.max(np.diff(lo))) + 1
+    dist = np.full((n + 1, width + pad + 1), _INF, dtype=np.int32)
+    row0 = lo[0] + offsets
+    dist[0, 1:width + 1] = np.where((row0 >= 0) & (row0 <= m), row0, _INF)
+    offsets32 = offsets.astype(np.int32)
+    shifts = np.diff(lo).tolist()
+    ends = (m - lo[1:]).tolist()
+    best = np.empty(width, dtype=np.int32)
+    up = np.empty(width, dtype=np.int32)
+    for i in range(1, n + 1):
+        shift = shifts[i - 1]
+        prev = dist[i - 1]
+        row = dist[i, 1:width + 1]
+        np.add(prev[shift:shift + width], sub[i - 1], out=best)
+        np.add(prev[shift + 1:shift + 1 + width], 1, out=up)
+        np.minimum(best, up, out=best)
+        # Horizontal moves: row[k] = min_k'<=k (best[k'] + k - k'), i.e. a running min of best - k
+        best -= offsets32
+        np.minimum.accumulate(best, out=row)
+        row += offsets32
+        last = ends[i - 1]
+        if last < width - 1:
+            row[max(last + 1, 0):] = _INF
+
+    def cell(i: int, j: int) -> int:
+        k = j - lo[i]
+        return int(dist[i, k + 1]) if 0 <= k < width else _INF
+
+    pairs: List[Tuple[Optional[int], Optional[int]]] = []
+    i, j = n, m
+    while i > 0 or j > 0:
+        current = cell(i, j)
+        if i > 0 and j > 0 and cell(i - 1, j - 1) + (a[i - 1] != b[j - 1]) == current:
+            i -= 1
+            j -= 1
+            pairs.append((i, j))
+        elif i > 0 and cell(i - 1, j) + 1 == current:
+            i -= 1
+            pairs.append((i, None))
+        else:
+            j -= 1
+            pairs.append((None, j))
+    pairs.reverse()
+    return pairs
+
+
+def _align_insertions(runs: List[List[str]]) -> List[List[Optional[str]]]:
+    """
+    Slots for the words several hypotheses insert in the same backbone gap. Runs
+    are aligned against each other (each against the first word seen per slot so
+    far) so that agreeing insertions share a slot instead of being stacked by position.
+    Runs can be as long as a whole transcript when the backbone is missing a stretch,
+    so they get rapidfuzz's exact linear-memory alignment rather than the banded one.
+    """
+    count = len(runs)
+    slots: List[List[Optional[str]]] = []
+    for h, run in enumerate(runs):
+        if not run:
+            continue
+        if not slots:
+            slots = [[None] * count for _ in run]
+            for slot, word in zip(slots, run):
+                slot[h] = word
+            continue
+        representative = [next(entry for entry in slot if entry is not None) for slot in slots]
+        merged: List[List[Optional[str]]] = []
+
+        def add_own_slots(words: List[str]) -> None:
+            for word in words:
+                merged.append([None] * count)
+                merged[-1][h] = word
+
+        for op in Levenshtein.opcodes(representative, run):
+            if op.tag in ("equal", "replace"):
+                # Pair words one to one; a longer side of a replace keeps its own slots
+                paired = min(op.src_end - op.src_start, op.dest_end - op.dest_start)
+                for k in range(paired):
+                    slot = slots[op.src_start + k]
+                    slot[h] = run[op.dest_start + k]
+                    merged.append(slot)
+                merged.extend(slots[op.src_start + paired:op.src_end])
+                add_own_slots(run[op.dest_start + paired:op.dest_end])
+            elif op.tag == "delete":
+                merged.extend(slots[op.src_start:op.src_end])
+            else:
+                add_own_slots(run[op.dest_start:op.dest_end])
+        slots = merged
+    return slots
+
+
+def align_hypotheses(hypotheses: Sequence[Sequence[str]], band: int = DEFAULT_BAND) -> List[List[Optional[str]]]:
+    """
+    Align N word sequences into a lattice of slots. Each slot holds one entry per
+    hypothesis (None where that hypothesis has no word). The first hypothesis is
+    the backbone every other one is aligned against.
+    """
+    if not hypotheses:
+        return []
+    ids = _to_ids(hypotheses)
+    backbone = hypotheses[0]
+    count = len(hypotheses)
+
+    # Backbone slots, plus words other hypotheses insert before backbone word g
+    main = [[word] + [None] * (count - 1) for word in backbone]
+    inserts: Dict[int, List[List[str]]] = defaultdict(lambda: [[] for _ in range(count)])
+
+    for h in range(1, count):
+        gap = 0
+        for i, j in banded_align(ids[0], ids[h], band):
+            if i is None:
+                inserts[gap][h].append(hypotheses[h][j])
+            else:
+                if j is not None:
+                    main[i][h] = hypotheses[h][j]
+                gap = i + 1
+
+    lattice: List[List[Optional[str]]] = []
+    for g in range(len(backbone) + 1):
+        if g in inserts:
+            lattice.extend(_align_insertions(inserts[g]))
+        if g < len(backbone):
+            lattice.append(main[g])
+    return lattice
+
+
+def vote(lattice: List[List[Optional[str]]], weights: Optional[Sequence[float]] = None) -> Tuple[List[str], int]:
+    """
+    Pick the best-supported entry of every slot (None means "no word here").
+    Ties go to the earliest hypothesis. Returns the words and the number of
+    slots won by a strict majority.
+    """
+    words: List[str] = []
+    majority_slots = 0
+    for slot in lattice:
+        w = weights or [1.0] * len(slot)
+        support: Dict[Optional[str], float] = {}
+        for entry, weight in zip(slot, w):
+            support[entry] = support.get(entry, 0.0) + weight
+        top = max(support.values())
+        # Dict preserves first-seen order, so the earliest hypothesis wins ties
+        winner = next(entry for entry, score in support.items() if score == top)
+        if top * 2 > sum(w):
+            majority_slots += 1
+        if winner is not None:
+            words.append(winner)
+    return words, majority_slots
+
+
+def rover_merge(hypotheses: Sequence[Sequence[str]], weights: Optional[Sequence[float]] = None,
+                band: int = DEFAULT_BAND) -> Dict:
+    """Align and vote N word sequences, listed in priority order"""
+    lattice = align_hypotheses(hypotheses, band)
+    words, majority_slots = vote(lattice, weights)
+    return {
+        'words': words,
+        'transcript': ' '.join(words),
+        'slots': len(lattice),
+        'majority_ratio': majority_slots / len(lattice) if lattice else 0.0,
+    }
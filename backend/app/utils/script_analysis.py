@@ -0,0 +1,122 @@
+# Single-pass script analysis (Tamil / Latin) shared by the Tamil and Thanglish heuristics
+import re
+from functools import lru_cache
+
+TAMIL_BLOCK = "\u0B80-\u0BFF"
+
+# One scan over the text: whitespace, then runs of Tamil, Latin, other letters and everything else.
+# Tamil vowel signs are not \w, so the Tamil run is tried before the "other" run.
+_RUNS = re.compile(
+    rf"(\s+)"
+    rf"|([{TAMIL_BLOCK}]+)"
+    rf"|([A-Za-z]+)"
+    rf"|([^\W\d_A-Za-z{TAMIL_BLOCK}]+)"
+    rf"|((?:(?![\s{TAMIL_BLOCK}])[\W\d_])+)"
+)
+_SPACE, _TAMIL, _LATIN, _ALPHA, _OTHER = 1, 2, 3, 4, 5
+
+_TAMIL_CHAR = re.compile(f"[{TAMIL_BLOCK}]")
+
+# Tamil block characters str.isalpha rejects: vowel signs, virama, digits and symbols
+_TAMIL_NON_LETTER = re.compile(
+    "[" + "".join(re.escape(chr(point)) for point in range(0x0B80, 0x0C00) if not chr(point).isalpha()) + "]"
+)
+
+# Distinct strings kept; transcripts re-check the same segments many times per request
+CACHE_SIZE = 8192
+
+
+class ScriptProfile:
+    """Per-script character and word counts of one text"""
+
+    __slots__ = ("tamil_chars", "latin_chars", "alpha_chars", "words", "tamil_words", "latin_words")
+
+    def __init__(self, tamil_chars=0, latin_chars=0, alpha_chars=0, words=0, tamil_words=0, latin_words=0):
+        self.tamil_chars = tamil_chars
+        self.latin_chars = latin_chars
+        # Letters as counted by str.isalpha (Tamil vowel signs are not letters)
+        self.alpha_chars = alpha_chars
+        self.words = words
+        # Words with at least one Tamil character
+        self.tamil_words = tamil_words
+        # Words with Latin letters and no Tamil characters
+        self.latin_words = latin_words
+
+    @property
+    def has_tamil(self) -> bool:
+        return self.tamil_chars > 0
+
+    @property
+    def tamil_ratio(self) -> float:
+        return self.tamil_chars / self.alpha_chars if self.alpha_chars else 0.0
+
+    @property
+    def latin_ratio(self) -> float:
+        return self.latin_chars / self.alpha_chars if self.alpha_chars else 0.0
+
+    @property
+    def tamil_word_ratio(self) -> float:
+        return self.tamil_words / self.words if self.words else 0.0
+
+    @property
+    def thanglish_ratio(self) -> float:
+        """Share of words written in Latin script only"""
+        return self.latin_words / self.words if self.words else 0.0
+
+    @property
+    def is_thanglish(self) -> bool:
+        """Mostly Latin letters with little Tamil: Tamil in Latin script or code-mixed"""
+        return self.alpha_chars > 0 and self.latin_ratio > 0.6 and self.tamil_ratio < 0.4
+
+    def __repr__(self):
+        fields = ", ".join(f"{name}={getattr(self, name)}" for name in self.__slots__)
+        return f"ScriptProfile({fields})"
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def analyze(text: str) -> ScriptProfile:
+    """Script profile of text, computed in one regex pass and memoized per string"""
+    profile = ScriptProfile()
+    if not text:
+        return profile
+    in_word = word_tamil = word_latin = False
+    for match in _RUNS.finditer(text):
+        kind = match.lastindex
+        if kind == _SPACE:
+            if in_word:
+                profile.words += 1
+                profile.tamil_words += word_tamil
+                profile.latin_words += word_latin and not word_tamil
+            in_word = word_tamil = word_latin = False
+            continue
+        in_word = True
+        length = match.end() - match.start()
+        if kind == _TAMIL:
+            word_tamil = True
+            profile.tamil_chars += length
+        elif kind == _LATIN:
+            word_latin = True
+            profile.latin_chars += length
+            profile.alpha_chars += length
+        elif kind == _ALPHA:
+            profile.alpha_chars += length
+    if in_word:
+        profile.words += 1
+        profile.tamil_words += word_tamil
+        profile.latin_words += word_latin and not word_tamil
+    if profile.tamil_chars:
+        profile.alpha_chars += profile.tamil_chars - len(_TAMIL_NON_LETTER.findall(text))
+    return profile
+
+
+def contains_tamil(text: str) -> bool:
+    """Whether text has any Tamil character (no full analysis needed)"""
+    return bool(text) and _TAMIL_CHAR.search(text) is not None
+
+
+def is_tamil_word(word: str) -> bool:
+    return contains_tamil(word)
+
+
+def is_thanglish(text: str) -> bool:
+    return analyze(text).is_thanglish
@@ -0,0 +1,62 @@
+# Token-level diffs on top of diff_match_patch
+from typing import Dict, List, Sequence, Tuple
+
+from diff_match_patch import diff_match_patch
+
+_OPS = {0: 'equal', -1: 'delete', 1: 'insert'}
+
+# First code point handed out to a token; surrogates are skipped since they cannot stand alone
+_FIRST_CODE_POINT = 0x100
+_SURROGATES = range(0xD800, 0xE000)
+
+
+def tokens_to_chars(*token_lists: Sequence[str]) -> Tuple[List[str], List[str]]:
+    """
+    Encode each token list as a string with one character per distinct token,
+    like dmp's linesToChars. Returns the encoded strings and the code -> token table.
+    """
+    codes: Dict[str, str] = {}
+    table: List[str] = []
+    encoded = []
+    for tokens in token_lists:
+        chars = []
+        for token in tokens:
+            code = codes.get(token)
+            if code is None:
+                point = _FIRST_CODE_POINT + len(table)
+                if point >= _SURROGATES.start:
+                    point += len(_SURROGATES)
+                code = chr(point)
+                codes[token] = code
+                table.append(token)
+            chars.append(code)
+        encoded.append(''.join(chars))
+    return encoded, table
+
+
+def _decode(chars: str, table: List[str]) -> List[str]:
+    tokens = []
+    for char in chars:
+        point = ord(char)
+        if point >= _SURROGATES.stop:
+            point -= len(_SURROGATES)
+        tokens.append(table[point - _FIRST_CODE_POINT])
+    return tokens
+
+
+def token_diff(tokens1: Sequence[str], tokens2: Sequence[str], timeout: float = 1.0,
+               cleanup: bool = False) -> List[Tuple[str, List[str]]]:
+    """
+    Diff two token sequences. Returns runs of ('equal' | 'delete' | 'insert', tokens),
+    where delete means only in tokens1 and insert only in tokens2.
+
+    timeout: seconds dmp may spend before returning a coarser diff (0 = no limit).
+    cleanup: apply dmp's semantic cleanup, which here works on whole tokens.
+    """
+    (text1, text2), table = tokens_to_chars(tokens1, tokens2)
+    dmp = diff_match_patch()
+    dmp.Diff_Timeout = timeout
+    diffs = dmp.diff_main(text1, text2, False)
+    if cleanup:
+        dmp.diff_cleanupSemantic(diffs)
+    return [(_OPS[op], _decode(chars, table)) for op, chars in diffs if chars]
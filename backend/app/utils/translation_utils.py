@@ -1,10 +1,14 @@
 import torch
 from transformers import AutoModelForSeq2SeqLM, AutoTokenizer
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
 try:
     from IndicTransToolkit.processor import IndicProcessor
 except ImportError:
     IndicProcessor = None
-    print("⚠️ IndicTransToolkit not installed. Install with: pip install git+https://github.com/AI4Bharat/IndicTrans2.git")
+    logger.warning("⚠️ IndicTransToolkit not installed. Install with: pip install git+https://github.com/AI4Bharat/IndicTrans2.git")
 
 DEVICE = "cuda" if torch.cuda.is_available() else "cpu"
 
@@ -0,0 +1,108 @@
+# Batched, memoized Thanglish (Latin-script Tamil) to Tamil transliteration
+import re
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Sequence
+
+from app.core.config import settings
+from app.utils import script_analysis
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+try:
+    from indic_transliteration import sanscript
+    from indic_transliteration.sanscript import transliterate
+    INDIC_AVAILABLE = True
+except ImportError:
+    INDIC_AVAILABLE = False
+
+# Within a Thanglish text only Latin-script words are transliterated; Tamil script, digits and punctuation pass through
+_LATIN_WORD = re.compile(r"[A-Za-z]+")
+
+
+class WordCache:
+    """Bounded LRU of word -> transliteration"""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._words: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, word: str) -> Optional[str]:
+        with self._lock:
+            tamil = self._words.get(word)
+            if tamil is None:
+                self.misses += 1
+                return None
+            self._words.move_to_end(word)
+            self.hits += 1
+            return tamil
+
+    def put(self, word: str, tamil: str) -> None:
+        with self._lock:
+            self._words[word] = tamil
+            self._words.move_to_end(word)
+            while len(self._words) > self.maxsize:
+                self._words.popitem(last=False)
+
+    def __len__(self):
+        return len(self._words)
+
+
+word_cache = WordCache(settings.TRANSLITERATION_CACHE_SIZE)
+
+
+def _transliterate_words(words: List[str]) -> Dict[str, str]:
+    """Transliterate distinct words in one call (newline-joined), per word if the batch misaligns"""
+    batch = transliterate("\n".join(words), sanscript.ITRANS, sanscript.TAMIL).split("\n")
+    if len(batch) != len(words):
+        batch = [transliterate(word, sanscript.ITRANS, sanscript.TAMIL) for word in words]
+    return dict(zip(words, batch))
+
+
+def thanglish_to_tamil(texts: Sequence[str]) -> List[str]:
+    """
+    Transliterate the Latin-script words of every Thanglish text to Tamil script.
+    Only texts script_analysis detects as Thanglish (mostly Latin letters, little
+    Tamil script) are converted, so English words inside Tamil-script speech stay
+    as they are. All texts share one transliteration call for the words not
+    already cached; other texts are returned unchanged.
+    """
+    if not INDIC_AVAILABLE:
+        logger.warning("⚠️  Indic transliteration not available, returning original text")
+        return list(texts)
+
+    resolved: Dict[str, str] = {}
+    pending: List[str] = []
+    thanglish = [script_analysis.is_thanglish(text) for text in texts]
+    for text, convert in zip(texts, thanglish):
+        if not convert:
+            continue
+        for word in _LATIN_WORD.findall(text):
+            if word in resolved:
+                continue
+            tamil = word_cache.get(word)
+            if tamil is None:
+                pending.append(word)
+                tamil = word
+            resolved[word] = tamil
+
+    if pending:
+        try:
+            transliterated = _transliterate_words(pending)
+        except Exception as e:
+            logger.error("❌ Transliteration failed for %s words: %s", len(pending), e)
+            transliterated = {}
+        for word, tamil in transliterated.items():
+            word_cache.put(word, tamil)
+            resolved[word] = tamil
+
+    if not resolved:
+        return list(texts)
+    return [
+        _LATIN_WORD.sub(lambda match: resolved[match.group()], text) if convert else text
+        for text, convert in zip(texts, thanglish)
+    ]
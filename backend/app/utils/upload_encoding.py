@@ -0,0 +1,136 @@
+# Upload encoding utilities
+import os
+import hashlib
+import mimetypes
+import subprocess
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Tuple
+from app.core.config import settings
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Codec settings for each upload format
+UPLOAD_ENCODERS = {
+    "wav": {"ext": ".wav", "mime": "audio/wav", "lossy": False,
+            "args": ["-c:a", "pcm_s16le"]},
+    "flac": {"ext": ".flac", "mime": "audio/flac", "lossy": False,
+             "args": ["-c:a", "flac", "-compression_level", "8"]},
+    # libopus only accepts 8/12/16/24/48 kHz input, so pin speech rate
+    "opus": {"ext": ".ogg", "mime": "audio/ogg", "lossy": True,
+             "args": ["-c:a", "libopus", "-application", "voip", "-ar", "16000"]},
+    "mp3": {"ext": ".mp3", "mime": "audio/mpeg", "lossy": True,
+            "args": ["-c:a", "libmp3lame"]},
+}
+
+# Formats each provider accepts for upload
+PROVIDER_UPLOAD_FORMATS = {
+    "elevenlabs": {"flac", "opus", "mp3", "wav"},
+    "sarvam": {"flac", "mp3", "wav"},
+    "sarvam_batch": {"flac", "mp3", "wav"},
+}
+
+_PROVIDER_FORMAT_SETTINGS = {
+    "elevenlabs": "ELEVENLABS_UPLOAD_FORMAT",
+    "sarvam": "SARVAM_UPLOAD_FORMAT",
+    "sarvam_batch": "SARVAM_BATCH_UPLOAD_FORMAT",
+}
+
+# (source path, mtime, size, format, bitrate) -> encoded path, shared by
+# every provider and retry that asks for the same encoding; LRU of
+# UPLOAD_ENCODING_CACHE_SIZE entries whose files are deleted on eviction
+_encoded_cache: "OrderedDict[Tuple, str]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def negotiate_upload_format(provider: str) -> str:
+    """Pick the upload format for a provider, falling back to WAV if unsupported."""
+    override = getattr(settings, _PROVIDER_FORMAT_SETTINGS.get(provider, ""), "")
+    preferred = (override or settings.UPLOAD_AUDIO_FORMAT or "wav").lower()
+    supported = PROVIDER_UPLOAD_FORMATS.get(provider, {"wav"})
+    if preferred not in UPLOAD_ENCODERS or preferred not in supported:
+        logger.debug("[upload_encoding] %s does not accept '%s', using wav", provider, preferred)
+        return "wav"
+    return preferred
+
+
+def upload_mime_type(file_path: str) -> str:
+    """MIME type for an upload, preferring the encoder table over the system map."""
+    ext = os.path.splitext(file_path)[1].lower()
+    for encoder in UPLOAD_ENCODERS.values():
+        if encoder["ext"] == ext:
+            return encoder["mime"]
+    mime_type, _ = mimetypes.guess_type(file_path)
+    return mime_type or "application/octet-stream"
+
+
+def encode_audio(input_path: str, fmt: str, bitrate: str = None) -> str:
+    """Encode audio to the given upload format with ffmpeg and return the new path."""
+    encoder = UPLOAD_ENCODERS[fmt]
+    bitrate = bitrate or settings.UPLOAD_AUDIO_BITRATE
+    base_name = os.path.splitext(os.path.basename(input_path))[0]
+    suffix = f"_{bitrate}" if encoder["lossy"] else ""
+    # Hash the source path so same-named files from different jobs don't collide
+    path_hash = hashlib.md5(os.path.abspath(input_path).encode('utf-8')).hexdigest()[:8]
+    output_path = os.path.join(tempfile.gettempdir(),
+                               f"upload_{base_name}_{path_hash}_{fmt}{suffix}{encoder['ext']}")
+    cmd = ["ffmpeg", "-y", "-i", input_path, "-vn", *encoder["args"]]
+    if encoder["lossy"]:
+        cmd += ["-b:a", bitrate]
+    cmd.append(output_path)
+    result = subprocess.run(cmd, capture_output=True, text=True, encoding='utf-8', errors='ignore')
+    if result.returncode != 0 or not os.path.exists(output_path):
+        raise RuntimeError(f"ffmpeg {fmt} encoding failed: {result.stderr.strip()[-500:]}")
+    return output_path
+
+
+def _cache_encoded(key: Tuple, encoded_path: str) -> None:
+    with _cache_lock:
+        _encoded_cache[key] = encoded_path
+        _encoded_cache.move_to_end(key)
+        evicted = []
+        while len(_encoded_cache) > max(1, settings.UPLOAD_ENCODING_CACHE_SIZE):
+            evicted.append(_encoded_cache.popitem(last=False)[1])
+        # A re-encoded source (new mtime) reuses its output path; keep files still referenced
+        evicted = [path for path in evicted if path not in _encoded_cache.values()]
+    for path in evicted:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+def encode_for_upload(input_path: str, provider: str) -> str:
+    """
+    Return the file to upload to a provider, encoded in its negotiated format.
+    Encodings are cached per source file so several providers and retries share one encode.
+    Falls back to the original file if encoding fails.
+    """
+    fmt = negotiate_upload_format(provider)
+    if input_path.lower().endswith(UPLOAD_ENCODERS[fmt]["ext"]):
+        return input_path
+    try:
+        stat = os.stat(input_path)
+    except OSError as e:
+        logger.warning("[upload_encoding] Cannot stat %s: %s", input_path, e)
+        return input_path
+    bitrate = settings.UPLOAD_AUDIO_BITRATE if UPLOAD_ENCODERS[fmt]["lossy"] else None
+    key = (os.path.abspath(input_path), stat.st_mtime_ns, stat.st_size, fmt, bitrate)
+    with _cache_lock:
+        cached = _encoded_cache.get(key)
+        if cached:
+            _encoded_cache.move_to_end(key)
+    if cached and os.path.exists(cached):
+        return cached
+    try:
+        encoded_path = encode_audio(input_path, fmt, bitrate)
+    except Exception as e:
+        logger.warning("[upload_encoding] %s. Uploading original file.", e)
+        return input_path
+    encoded_size = os.path.getsize(encoded_path)
+    logger.info("[upload_encoding] %s: %s -> %s (%s -> %s bytes)",
+                provider, os.path.basename(input_path), fmt, stat.st_size, encoded_size)
+    _cache_encoded(key, encoded_path)
+    return encoded_path
@@ -0,0 +1,460 @@
+#!/usr/bin/env python3
+"""
+Offline end-to-end benchmark: run the enhanced pipeline, the dual pipeline and
+POST /transcribe over a corpus of audio files, replaying recorded provider
+responses (ElevenLabs, Sarvam STT/batch/translate/chat, whisper.cpp) instead of
+calling the live APIs. Local work (ffmpeg, preprocessing, merging) runs for real.
+
+Corpus layout (one directory):
+    <name>.<mp3|wav|...>        audio
+    <name>.txt                  reference transcript (optional, enables WER/CER)
+    <name>.recording.json       recorded provider responses (written by --record)
+
+Each run reports wall time, CPU time (this process plus child processes such as
+ffmpeg), peak RSS, per-stage wall time (summed when stages overlap) and WER/CER
+against the reference. Recorded provider latency can be replayed with
+--replay-latency; by default provider calls return immediately.
+
+Usage (from backend/):
+    python -m benchmarks.e2e run --corpus corpus/ --record          # live APIs, saves recordings
+    python -m benchmarks.e2e run --corpus corpus/ --output new.json  # offline replay
+    python -m benchmarks.e2e compare base.json new.json --max-slowdown 0.1 --max-wer-increase 0.005
+"""
+
+import argparse
+import asyncio
+import contextvars
+import functools
+import hashlib
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import threading
+import time
+from typing import Dict, List, Optional
+
+from app.core.config import settings
+from app.schemas.transcription import TranscriptionResponse, TranslationResponse
+from app.services.accuracy_assessment_service import accuracy_assessment_service
+from app.utils.alignment import align
+
+TARGETS = ("enhanced", "dual", "transcribe")
+
+# Stage wall times and replay-key context of the run in progress
+_stages: contextvars.ContextVar[Optional[Dict[str, float]]] = contextvars.ContextVar("e2e_stages", default=None)
+_caller: contextvars.ContextVar[str] = contextvars.ContextVar("e2e_caller", default="")
+
+
+def _digest(value) -> str:
+    return hashlib.sha256(json.dumps(value, sort_keys=True, ensure_ascii=False).encode("utf-8")).hexdigest()[:16]
+
+
+class Recording:
+    """Provider responses of one audio file, keyed by call (and payload hash where calls repeat)"""
+
+    def __init__(self, path: str, mode: str, replay_latency: bool = False):
+        self.path = path
+        self.mode = mode  # record | replay
+        self.replay_latency = replay_latency
+        self.calls: Dict[str, Dict] = {}
+        if mode == "replay":
+            with open(path, encoding="utf-8") as f:
+                self.calls = json.load(f)["calls"]
+
+    async def call(self, key: str, live):
+        """Replay the response for key, or in record mode run live() and store its result"""
+        if self.mode == "replay":
+            if key not in self.calls:
+                raise RuntimeError(f"No recorded response for {key} in {self.path}")
+            entry = self.calls[key]
+            if self.replay_latency:
+                await asyncio.sleep(entry.get("latency", 0.0))
+            return entry["response"]
+        start = time.perf_counter()
+        response = await live()
+        self.calls[key] = {"response": response, "latency": round(time.perf_counter() - start, 3)}
+        return response
+
+    def save(self) -> None:
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump({"calls": self.calls}, f, ensure_ascii=False, indent=2)
+
+
+def _timed(stage: str, fn):
+    """Wrap an async function so its wall time accumulates under stage in the current run"""
+    @functools.wraps(fn)
+    async def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return await fn(*args, **kwargs)
+        finally:
+            stages = _stages.get()
+            if stages is not None:
+                stages[stage] = round(stages.get(stage, 0.0) + time.perf_counter() - start, 3)
+    return wrapper
+
+
+def _as_caller(caller: str, fn):
+    """Tag provider calls made inside fn, so concurrent branches replay their own responses"""
+    @functools.wraps(fn)
+    async def wrapper(*args, **kwargs):
+        token = _caller.set(caller)
+        try:
+            return await fn(*args, **kwargs)
+        finally:
+            _caller.reset(token)
+    return wrapper
+
+
+class ProviderShims:
+    """Route every external provider call through the active Recording"""
+
+    def __init__(self):
+        self.recording: Optional[Recording] = None
+
+    def install(self, mode: str) -> None:
+        from app.services import elevenlabs_service as elevenlabs_module
+        from app.services.dual_pipeline_service import DualPipelineService
+        from app.services.enhanced_transcription_service import EnhancedTranscriptionService
+        from app.services.llm_cache import llm_cache
+        from app.services.sarvam_batch_service import SarvamBatchService
+        from app.services.sarvam_chat_gateway import sarvam_chat_gateway
+        from app.services.sarvam_service import sarvam_service
+        from app.services.whisper_server_service import whisper_server_service
+        from app.services.audio_service import audio_service
+
+        # Cached LLM answers would skip the provider call (and the recording)
+        llm_cache.enabled = False
+        if mode == "replay" and not sarvam_chat_gateway.api_key:
+            sarvam_chat_gateway.api_key = "replay"
+
+        elevenlabs = elevenlabs_module.elevenlabs_service
+        live_elevenlabs = elevenlabs.transcribe_with_speaker_diarization
+        live_batch = SarvamBatchService.batch_transcribe
+        live_stt = sarvam_service.transcribe_audio
+        live_translate = sarvam_service.translate_text
+        live_whisper = whisper_server_service.transcribe
+        live_chat = sarvam_chat_gateway._request
+
+        async def elevenlabs_shim(audio_file_path):
+            return await self.recording.call("elevenlabs", lambda: live_elevenlabs(audio_file_path))
+
+        async def batch_shim(batch_self, wav_path, language_code="ta-IN", diarization=True,
+                             speaker_embedding=None, timings=None):
+            async def live():
+                return list(await live_batch(batch_self, wav_path, language_code, diarization,
+                                             speaker_embedding, timings))
+            transcript, diarized = await self.recording.call(f"sarvam_batch:{_caller.get()}", live)
+            return transcript, diarized
+
+        async def stt_shim(file_path, language_code="ta-IN", model="saarika:v1", with_diarization=False):
+            async def live():
+                return (await live_stt(file_path, language_code, model, with_diarization)).model_dump()
+            return TranscriptionResponse(**await self.recording.call("sarvam_stt", live))
+
+        async def translate_shim(text, source_lang="ta-IN", target_lang="en-IN"):
+            async def live():
+                return (await live_translate(text, source_lang, target_lang)).model_dump()
+            key = f"sarvam_translate:{_digest([text, source_lang, target_lang])}"
+            return TranslationResponse(**await self.recording.call(key, live))
+
+        async def whisper_shim(audio_path, language="ta", response_format="verbose_json"):
+            key = f"whisper:{response_format}"
+            return await self.recording.call(key, lambda: live_whisper(audio_path, language, response_format))
+
+        async def chat_shim(messages, temperature, max_tokens, timeout):
+            key = f"sarvam_chat:{_digest([messages, temperature, max_tokens])}"
+            return await self.recording.call(key, lambda: live_chat(messages, temperature, max_tokens, timeout))
+
+        elevenlabs.transcribe_with_speaker_diarization = _timed("provider:elevenlabs", elevenlabs_shim)
+        SarvamBatchService.batch_transcribe = _timed("provider:sarvam_batch", batch_shim)
+        sarvam_service.transcribe_audio = _timed("provider:sarvam_stt", stt_shim)
+        sarvam_service.translate_text = _timed("provider:sarvam_translate", translate_shim)
+        whisper_server_service.transcribe = _timed("provider:whisper", whisper_shim)
+        sarvam_chat_gateway._request = _timed("provider:sarvam_chat", chat_shim)
+
+        # Local stages worth seeing on their own
+        audio_service.validate_and_prepare_audio = _timed(
+            "audio_preprocess", audio_service.validate_and_prepare_audio)
+        for cls, method, stage in (
+            (EnhancedTranscriptionService, "_prepare_audio", "prepare_audio"),
+            (EnhancedTranscriptionService, "_sarvam_chat_merge_transcripts", "merge"),
+        ):
+            setattr(cls, method, _timed(stage, getattr(cls, method)))
+        for cls, method, caller in (
+            (DualPipelineService, "_pipeline1_direct_wav", "pipeline1"),
+            (DualPipelineService, "_pipeline2_enhanced_preprocessing", "pipeline2"),
+            (EnhancedTranscriptionService, "process_enhanced_transcription", "enhanced"),
+        ):
+            setattr(cls, method, _as_caller(caller, getattr(cls, method)))
+
+
+class RssSampler:
+    """Peak resident memory of this process while a run is in progress (Linux /proc, else ru_maxrss)"""
+
+    def __init__(self, interval: float = 0.05):
+        self.interval = interval
+        self.peak_kb = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @staticmethod
+    def _current_kb() -> int:
+        try:
+            with open("/proc/self/status") as f:
+                for line in f:
+                    if line.startswith("VmRSS:"):
+                        return int(line.split()[1])
+        except OSError:
+            pass
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    def _run(self):
+        while not self._stop.is_set():
+            self.peak_kb = max(self.peak_kb, self._current_kb())
+            self._stop.wait(self.interval)
+
+    def __enter__(self):
+        self.peak_kb = self._current_kb()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+        self.peak_kb = max(self.peak_kb, self._current_kb())
+
+
+def _cpu_seconds() -> float:
+    children = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return time.process_time() + children.ru_utime + children.ru_stime
+
+
+def _transcript_text(target: str, result) -> str:
+    if target == "enhanced":
+        return " ".join(seg.get("text", "") for seg in result.get("final_transcript") or [])
+    if target == "dual":
+        return result.get("final_transcript") or ""
+    return result.get("transcription") or ""
+
+
+def _error_rates(reference: Optional[str], hypothesis: str) -> Dict:
+    if reference is None:
+        return {}
+    ref = accuracy_assessment_service._normalize_text(reference)
+    hyp = accuracy_assessment_service._normalize_text(hypothesis)
+    words, chars = align(ref.split(), hyp.split()), align(ref, hyp)
+    return {
+        "wer": round(words.error_rate, 4),
+        "cer": round(chars.error_rate, 4),
+        "word_errors": words.errors,
+        "reference_words": words.reference_length,
+        "char_errors": chars.errors,
+        "reference_chars": chars.reference_length,
+    }
+
+
+async def _run_target(target: str, audio_path: str, client) -> Dict:
+    if target == "enhanced":
+        from app.services.enhanced_transcription_service import enhanced_transcription_service
+        result = await enhanced_transcription_service.process_enhanced_transcription(audio_path)
+        if not result.get("success"):
+            raise RuntimeError(result.get("error", "enhanced pipeline failed"))
+        return result
+    if target == "dual":
+        from app.services.dual_pipeline_service import dual_pipeline_service
+        return await dual_pipeline_service.process_dual_pipeline(audio_path)
+    with open(audio_path, "rb") as f:
+        response = await client.post(
+            "/transcribe", files={"file": (os.path.basename(audio_path), f.read())}, timeout=None
+        )
+    if response.status_code != 200:
+        raise RuntimeError(f"/transcribe returned {response.status_code}: {response.text[:200]}")
+    return response.json()
+
+
+async def _measure(target: str, audio_path: str, reference: Optional[str], client) -> Dict:
+    stages: Dict[str, float] = {}
+    token = _stages.set(stages)
+    report = {"file": os.path.basename(audio_path), "target": target}
+    cpu_start, wall_start = _cpu_seconds(), time.perf_counter()
+    try:
+        with RssSampler() as rss:
+            result = await _run_target(target, audio_path, client)
+        report["ok"] = True
+        report.update(_error_rates(reference, _transcript_text(target, result)))
+        if target == "dual":
+            stages.update({f"dual:{name}": value for name, value in (result.get("timings") or {}).items()})
+    except Exception as e:
+        report["ok"] = False
+        report["error"] = str(getattr(e, "detail", e))
+        rss = None
+    finally:
+        _stages.reset(token)
+    report["wall_s"] = round(time.perf_counter() - wall_start, 3)
+    report["cpu_s"] = round(_cpu_seconds() - cpu_start, 3)
+    report["peak_rss_mb"] = round(rss.peak_kb / 1024, 1) if rss else None
+    report["stages"] = stages
+    return report
+
+
+def _discover(corpus: str) -> List[Dict]:
+    items = []
+    for name in sorted(os.listdir(corpus)):
+        stem, ext = os.path.splitext(name)
+        if ext.lower() not in settings.ALLOWED_EXTENSIONS:
+            continue
+        reference_path = os.path.join(corpus, f"{stem}.txt")
+        reference = None
+        if os.path.exists(reference_path):
+            with open(reference_path, encoding="utf-8") as f:
+                reference = f.read()
+        items.append({
+            "audio": os.path.join(corpus, name),
+            "reference": reference,
+            "recording": os.path.join(corpus, f"{stem}.recording.json"),
+        })
+    return items
+
+
+def _summarize(runs: List[Dict]) -> Dict:
+    summary = {}
+    for target in sorted({run["target"] for run in runs}):
+        ok = [run for run in runs if run["target"] == target and run["ok"]]
+        scored = [run for run in ok if "wer" in run]
+        walls = sorted(run["wall_s"] for run in ok)
+        reference_words = sum(run["reference_words"] for run in scored)
+        reference_chars = sum(run["reference_chars"] for run in scored)
+        summary[target] = {
+            "runs": sum(1 for run in runs if run["target"] == target),
+            "failed": sum(1 for run in runs if run["target"] == target and not run["ok"]),
+            "wall_s_total": round(sum(walls), 3),
+            "wall_s_p50": walls[len(walls) // 2] if walls else None,
+            "cpu_s_total": round(sum(run["cpu_s"] for run in ok), 3),
+            "peak_rss_mb": max((run["peak_rss_mb"] for run in ok), default=None),
+            "wer": round(sum(run["word_errors"] for run in scored) / reference_words, 4) if reference_words else None,
+            "cer": round(sum(run["char_errors"] for run in scored) / reference_chars, 4) if reference_chars else None,
+        }
+    return summary
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def run(args) -> Dict:
+    import httpx
+    from app.main import app
+
+    mode = "record" if args.record else "replay"
+    shims = ProviderShims()
+    shims.install(mode)
+
+    items = _discover(args.corpus)
+    if not items:
+        raise SystemExit(f"No audio files found in {args.corpus}")
+
+    runs = []
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://e2e") as client:
+        for item in items:
+            if mode == "replay" and not os.path.exists(item["recording"]):
+                print(f"⚠️ Skipping {item['audio']}: no recording (run with --record first)", file=sys.stderr)
+                continue
+            shims.recording = Recording(item["recording"], mode, args.replay_latency)
+            for target in args.targets:
+                for _ in range(args.repeat):
+                    report = await _measure(target, item["audio"], item["reference"], client)
+                    print(f"{'✅' if report['ok'] else '❌'} {report['target']:<10} {report['file']}: "
+                          f"{report['wall_s']}s wall, {report['cpu_s']}s cpu, WER {report.get('wer')}",
+                          file=sys.stderr)
+                    runs.append(report)
+            if mode == "record":
+                shims.recording.save()
+
+    return {
+        "meta": {
+            "mode": mode,
+            "commit": _git_commit(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "corpus": os.path.abspath(args.corpus),
+            "replay_latency": args.replay_latency,
+        },
+        "runs": runs,
+        "summary": _summarize(runs),
+    }
+
+
+def compare(base: Dict, new: Dict, max_slowdown: float, max_wer_increase: float) -> Dict:
+    """Per-target deltas between two reports; a regression is slower wall time or worse WER/CER beyond the limits"""
+    targets = {}
+    regressions = []
+    for target, after in new["summary"].items():
+        before = base["summary"].get(target)
+        if before is None:
+            continue
+        delta = {}
+        for key in ("wall_s_total", "cpu_s_total", "peak_rss_mb", "wer", "cer"):
+            if before.get(key) is not None and after.get(key) is not None:
+                delta[key] = {"base": before[key], "new": after[key], "change": round(after[key] - before[key], 4)}
+        wall = delta.get("wall_s_total")
+        if wall and wall["base"] and wall["change"] / wall["base"] > max_slowdown:
+            regressions.append(f"{target}: wall time +{wall['change'] / wall['base']:.1%}")
+        for metric in ("wer", "cer"):
+            if metric in delta and delta[metric]["change"] > max_wer_increase:
+                regressions.append(f"{target}: {metric.upper()} +{delta[metric]['change']:.4f}")
+        if after.get("failed", 0) > before.get("failed", 0):
+            regressions.append(f"{target}: {after['failed'] - before['failed']} more failed runs")
+        targets[target] = delta
+    return {"targets": targets, "regressions": regressions}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="benchmark the corpus")
+    run_parser.add_argument("--corpus", required=True)
+    run_parser.add_argument("--targets", nargs="+", choices=TARGETS, default=list(TARGETS))
+    run_parser.add_argument("--repeat", type=int, default=1)
+    run_parser.add_argument("--record", action="store_true", help="call live providers and save recordings")
+    run_parser.add_argument("--replay-latency", action="store_true", help="sleep for the recorded provider latency")
+    run_parser.add_argument("--output", help="write the report here (default: stdout)")
+
+    compare_parser = commands.add_parser("compare", help="compare two reports, exit 1 on regression")
+    compare_parser.add_argument("base")
+    compare_parser.add_argument("new")
+    compare_parser.add_argument("--max-slowdown", type=float, default=0.10, help="allowed relative wall time increase")
+    compare_parser.add_argument("--max-wer-increase", type=float, default=0.005, help="allowed absolute WER/CER increase")
+    args = parser.parse_args()
+
+    if args.command == "run":
+        report = asyncio.run(run(args))
+        output = json.dumps(report, indent=2, ensure_ascii=False)
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as f:
+                f.write(output)
+        else:
+            print(output)
+        return
+
+    with open(args.base, encoding="utf-8") as f:
+        base = json.load(f)
+    with open(args.new, encoding="utf-8") as f:
+        new = json.load(f)
+    result = compare(base, new, args.max_slowdown, args.max_wer_increase)
+    print(json.dumps(result, indent=2))
+    if result["regressions"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,430 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the external providers, for load testing without API keys or
+network: Sarvam sync STT, the batch job API (init, start, status), translate and
+chat, ElevenLabs speech-to-text, and an Azure-blob-compatible store behind the SAS
+URLs the batch jobs hand out. Transcripts are canned; what is realistic is the
+protocol, latency, error rate and job duration, all configurable per endpoint.
+
+Latency and job duration specs: const:S | uniform:LO,HI | normal:MEAN,SD |
+lognormal:MEDIAN,SIGMA (seconds). Endpoints: stt, batch, translate, chat,
+elevenlabs, blob. GET /_stats returns request counts and peak concurrency per endpoint.
+
+Usage (from backend/):
+    python -m benchmarks.fake_providers --port 8900 \\
+        --latency stt=lognormal:1.5,0.4 --latency chat=uniform:2,8 --error-rate chat=0.05 \\
+        --job-seconds lognormal:20,0.5
+
+    # then point the app at it
+    SARVAM_BASE_URL=http://127.0.0.1:8900 ELEVENLABS_BASE_URL=http://127.0.0.1:8900/v1 \\
+    SARVAM_API_KEY=fake ELEVENLABS_API_KEY=fake SARVAM_BATCH_SETTLE_SECONDS=0 SARVAM_BATCH_POLL_SECONDS=1 \\
+        uvicorn app.main:app --port 8000
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import random
+import time
+import uuid
+import xml.etree.ElementTree as ET
+from email.utils import formatdate
+from typing import Dict, List, Optional
+from xml.sax.saxutils import escape
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, Response
+
+ENDPOINTS = ("stt", "batch", "translate", "chat", "elevenlabs", "blob")
+BLOB_CONTAINER = "sarvam-jobs"
+DEFAULT_TRANSCRIPT = "வணக்கம் எல்லாருக்கும் இன்னைக்கு meeting ரொம்ப நல்லா போச்சு next week மறுபடியும் பேசலாம்"
+SECONDS_PER_WORD = 0.4
+
+
+class Distribution:
+    """A latency or duration distribution parsed from "kind:args", sampled in seconds (never negative)"""
+
+    KINDS = {"const": 1, "uniform": 2, "normal": 2, "lognormal": 2}
+
+    def __init__(self, spec: str):
+        kind, _, args = spec.partition(":")
+        try:
+            params = [float(value) for value in args.split(",")] if args else []
+        except ValueError:
+            raise ValueError(f"Invalid distribution {spec!r}")
+        if kind not in self.KINDS or len(params) != self.KINDS[kind]:
+            raise ValueError(f"Invalid distribution {spec!r}, expected one of const:S, uniform:LO,HI, "
+                             f"normal:MEAN,SD, lognormal:MEDIAN,SIGMA")
+        self.spec = spec
+        self.kind = kind
+        self.params = params
+
+    def sample(self, rng: random.Random) -> float:
+        if self.kind == "const":
+            value = self.params[0]
+        elif self.kind == "uniform":
+            value = rng.uniform(*self.params)
+        elif self.kind == "normal":
+            value = rng.gauss(*self.params)
+        else:
+            median, sigma = self.params
+            value = median * rng.lognormvariate(0.0, sigma) if median > 0 else 0.0
+        return max(0.0, value)
+
+
+class FakeConfig:
+    """Per-endpoint latency and error injection plus batch job behaviour"""
+
+    def __init__(self, latency: Optional[Dict[str, Distribution]] = None,
+                 error_rate: Optional[Dict[str, float]] = None, error_status: int = 503,
+                 job_seconds: Optional[Distribution] = None, job_failure_rate: float = 0.0,
+                 transcript: str = DEFAULT_TRANSCRIPT, seed: Optional[int] = None):
+        self.latency = latency or {}
+        self.error_rate = error_rate or {}
+        self.error_status = error_status
+        self.job_seconds = job_seconds or Distribution("const:5")
+        self.job_failure_rate = job_failure_rate
+        self.transcript = transcript
+        self.rng = random.Random(seed)
+
+    def delay(self, endpoint: str) -> float:
+        distribution = self.latency.get(endpoint, self.latency.get("default"))
+        return distribution.sample(self.rng) if distribution else 0.0
+
+    def should_fail(self, endpoint: str) -> bool:
+        rate = self.error_rate.get(endpoint, self.error_rate.get("default", 0.0))
+        return rate > 0 and self.rng.random() < rate
+
+
+class EndpointStats:
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    def as_dict(self) -> Dict[str, int]:
+        return {"requests": self.requests, "injected_errors": self.errors,
+                "in_flight": self.in_flight, "peak_in_flight": self.peak_in_flight}
+
+
+class BlobStore:
+    """In-memory block blobs: whole-blob puts, staged blocks and block lists"""
+
+    def __init__(self):
+        self.blobs: Dict[str, Dict] = {}
+        self._blocks: Dict[str, Dict[str, bytes]] = {}
+
+    def put(self, name: str, data: bytes, content_type: str = "application/octet-stream") -> Dict:
+        blob = {
+            "data": data,
+            "content_type": content_type,
+            "etag": f'"0x{hashlib.md5(data).hexdigest()[:16].upper()}"',
+            "last_modified": formatdate(usegmt=True),
+        }
+        self.blobs[name] = blob
+        self._blocks.pop(name, None)
+        return blob
+
+    def stage_block(self, name: str, block_id: str, data: bytes) -> None:
+        self._blocks.setdefault(name, {})[block_id] = data
+
+    def commit_blocks(self, name: str, block_ids: List[str], content_type: str) -> Dict:
+        staged = self._blocks.get(name, {})
+        missing = [block_id for block_id in block_ids if block_id not in staged]
+        if missing:
+            raise KeyError(missing[0])
+        return self.put(name, b"".join(staged[block_id] for block_id in block_ids), content_type)
+
+    def list(self, prefix: str) -> List[str]:
+        return sorted(name for name in self.blobs if name.startswith(prefix))
+
+
+def _first_json_list(text: str) -> Optional[list]:
+    # Merge prompts embed the provider segments as JSON: echoing them back keeps replies parseable
+    decoder = json.JSONDecoder()
+    start = text.find("[")
+    while start != -1:
+        try:
+            value, _ = decoder.raw_decode(text, start)
+            if isinstance(value, list) and value and all(isinstance(item, dict) for item in value):
+                return value
+        except ValueError:
+            pass
+        start = text.find("[", start + 1)
+    return None
+
+
+def _endpoint(path: str) -> Optional[str]:
+    if path.startswith("/speech-to-text/job"):
+        return "batch"
+    if path == "/speech-to-text":
+        return "stt"
+    if path == "/translate":
+        return "translate"
+    if path == "/v1/chat/completions":
+        return "chat"
+    if path == "/v1/speech-to-text":
+        return "elevenlabs"
+    if path.startswith(f"/{BLOB_CONTAINER}"):
+        return "blob"
+    return None
+
+
+def create_app(config: FakeConfig) -> FastAPI:
+    app = FastAPI(title="Fake providers")
+    stats = {endpoint: EndpointStats() for endpoint in ENDPOINTS}
+    store = BlobStore()
+    jobs: Dict[str, Dict] = {}
+    words = config.transcript.split()
+
+    def diarized_entries() -> List[Dict]:
+        # Alternate two speakers every sentence-sized run of words
+        entries = []
+        for index, start in enumerate(range(0, len(words), 8)):
+            chunk = words[start:start + 8]
+            entries.append({
+                "transcript": " ".join(chunk),
+                "speaker_id": f"SPEAKER_0{index % 2}",
+                "start_time_seconds": round(start * SECONDS_PER_WORD, 2),
+                "end_time_seconds": round((start + len(chunk)) * SECONDS_PER_WORD, 2),
+            })
+        return entries
+
+    @app.middleware("http")
+    async def inject_latency_and_errors(request: Request, call_next):
+        endpoint = _endpoint(request.url.path)
+        if endpoint is None:
+            return await call_next(request)
+        endpoint_stats = stats[endpoint]
+        endpoint_stats.requests += 1
+        endpoint_stats.in_flight += 1
+        endpoint_stats.peak_in_flight = max(endpoint_stats.peak_in_flight, endpoint_stats.in_flight)
+        try:
+            await asyncio.sleep(config.delay(endpoint))
+            if config.should_fail(endpoint):
+                endpoint_stats.errors += 1
+                return JSONResponse({"error": {"message": "injected failure", "code": "fake_error"}},
+                                    status_code=config.error_status, headers={"Retry-After": "1"})
+            return await call_next(request)
+        finally:
+            endpoint_stats.in_flight -= 1
+
+    @app.get("/_stats")
+    async def get_stats():
+        return {
+            "endpoints": {name: endpoint_stats.as_dict() for name, endpoint_stats in stats.items()},
+            "jobs": {state: sum(1 for job in jobs.values() if job["state"] == state)
+                     for state in ("Accepted", "Running", "Completed", "Failed")},
+            "blobs": len(store.blobs),
+        }
+
+    # Sarvam sync STT, translate and chat
+
+    @app.post("/speech-to-text")
+    async def sarvam_stt(request: Request):
+        form = await request.form()
+        body = {"request_id": uuid.uuid4().hex, "transcript": config.transcript,
+                "language_code": form.get("language_code", "ta-IN")}
+        if form.get("with_diarization") == "true":
+            body["diarized_transcript"] = {"entries": diarized_entries()}
+        return body
+
+    @app.post("/translate")
+    async def sarvam_translate(request: Request):
+        payload = await request.json()
+        return {"request_id": uuid.uuid4().hex, "translated_text": f"[en] {payload.get('input', '')}",
+                "source_language_code": payload.get("source_language_code")}
+
+    @app.post("/v1/chat/completions")
+    async def sarvam_chat(request: Request):
+        payload = await request.json()
+        user_messages = [m.get("content", "") for m in payload.get("messages", []) if m.get("role") == "user"]
+        prompt = user_messages[-1] if user_messages else ""
+        segments = _first_json_list(prompt)
+        content = json.dumps(segments, ensure_ascii=False) if segments is not None else prompt
+        return {
+            "id": f"chatcmpl-{uuid.uuid4().hex}",
+            "object": "chat.completion",
+            "model": payload.get("model"),
+            "choices": [{"index": 0, "finish_reason": "stop",
+                         "message": {"role": "assistant", "content": content}}],
+        }
+
+    # Sarvam batch jobs: init hands out SAS directories on this server
+
+    @app.post("/speech-to-text/job/init", status_code=202)
+    async def init_job(request: Request):
+        job_id = uuid.uuid4().hex
+        base = str(request.base_url).rstrip("/")
+        sas = "sv=2023-01-03&sr=d&sp=racwl&sig=fake"
+        jobs[job_id] = {"state": "Accepted", "ready_at": None, "failed": False}
+        return {
+            "job_id": job_id,
+            "input_storage_path": f"{base}/{BLOB_CONTAINER}/{job_id}/input?{sas}",
+            "output_storage_path": f"{base}/{BLOB_CONTAINER}/{job_id}/output?{sas}",
+        }
+
+    @app.post("/speech-to-text/job")
+    async def start_job(request: Request):
+        payload = await request.json()
+        job = jobs.get(payload.get("job_id"))
+        if job is None:
+            return JSONResponse({"error": {"message": "job not found"}}, status_code=404)
+        job["state"] = "Running"
+        job["parameters"] = payload.get("job_parameters") or {}
+        job["ready_at"] = time.monotonic() + config.job_seconds.sample(config.rng)
+        job["failed"] = config.rng.random() < config.job_failure_rate
+        return {"job_id": payload["job_id"], "job_state": "Running"}
+
+    @app.get("/speech-to-text/job/{job_id}/status")
+    async def job_status(job_id: str):
+        job = jobs.get(job_id)
+        if job is None:
+            return JSONResponse({"error": {"message": "job not found"}}, status_code=404)
+        if job["state"] == "Running" and time.monotonic() >= job["ready_at"]:
+            inputs = store.list(f"{job_id}/input/")
+            if job["failed"] or not inputs:
+                job["state"] = "Failed"
+            else:
+                result = {"transcript": config.transcript,
+                          "language_code": job["parameters"].get("language_code", "ta-IN")}
+                if job["parameters"].get("with_diarization") == "true":
+                    result["diarized_transcript"] = {"entries": diarized_entries()}
+                for name in inputs:
+                    output = f"{job_id}/output/{name.rsplit('/', 1)[-1]}.json"
+                    store.put(output, json.dumps(result, ensure_ascii=False).encode("utf-8"), "application/json")
+                job["state"] = "Completed"
+        return {"job_id": job_id, "job_state": job["state"]}
+
+    # ElevenLabs
+
+    @app.post("/v1/speech-to-text")
+    async def elevenlabs_stt(request: Request):
+        form = await request.form()
+        if "file" not in form:
+            return JSONResponse({"detail": "file is required"}, status_code=422)
+        return {
+            "language_code": form.get("language_code", "ta"),
+            "text": config.transcript,
+            "words": [
+                {"text": word, "type": "word", "speaker_id": f"speaker_{(index // 8) % 2}",
+                 "start": round(index * SECONDS_PER_WORD, 2), "end": round((index + 1) * SECONDS_PER_WORD, 2)}
+                for index, word in enumerate(words)
+            ],
+        }
+
+    # Azure blob storage (the subset the azure-storage-blob client uses for put/list/get)
+
+    def blob_headers(blob: Dict) -> Dict[str, str]:
+        return {"ETag": blob["etag"], "Last-Modified": blob["last_modified"], "x-ms-version": "2023-01-03",
+                "x-ms-request-id": uuid.uuid4().hex, "x-ms-request-server-encrypted": "true"}
+
+    @app.get(f"/{BLOB_CONTAINER}")
+    async def list_blobs(prefix: str = ""):
+        items = "".join(
+            f"<Blob><Name>{escape(name)}</Name><Properties>"
+            f"<Last-Modified>{store.blobs[name]['last_modified']}</Last-Modified>"
+            f"<Etag>{store.blobs[name]['etag']}</Etag>"
+            f"<Content-Length>{len(store.blobs[name]['data'])}</Content-Length>"
+            f"<Content-Type>{escape(store.blobs[name]['content_type'])}</Content-Type>"
+            f"<BlobType>BlockBlob</BlobType></Properties></Blob>"
+            for name in store.list(prefix)
+        )
+        body = (f'<?xml version="1.0" encoding="utf-8"?><EnumerationResults ContainerName="{BLOB_CONTAINER}">'
+                f"<Prefix>{escape(prefix)}</Prefix><Blobs>{items}</Blobs><NextMarker /></EnumerationResults>")
+        return Response(body, media_type="application/xml", headers={"x-ms-version": "2023-01-03"})
+
+    @app.put(f"/{BLOB_CONTAINER}/{{name:path}}")
+    async def put_blob(name: str, request: Request, comp: str = "", blockid: str = ""):
+        data = await request.body()
+        content_type = request.headers.get("x-ms-blob-content-type", "application/octet-stream")
+        if comp == "block":
+            store.stage_block(name, blockid, data)
+            return Response(status_code=201, headers={"x-ms-request-server-encrypted": "true"})
+        if comp == "blocklist":
+            block_ids = [element.text for element in ET.fromstring(data) if element.text]
+            try:
+                blob = store.commit_blocks(name, block_ids, content_type)
+            except KeyError as e:
+                return Response(f"InvalidBlockList: {e}", status_code=400)
+            return Response(status_code=201, headers=blob_headers(blob))
+        return Response(status_code=201, headers=blob_headers(store.put(name, data, content_type)))
+
+    @app.get(f"/{BLOB_CONTAINER}/{{name:path}}")
+    async def get_blob(name: str, request: Request):
+        blob = store.blobs.get(name)
+        if blob is None:
+            return Response("BlobNotFound", status_code=404, headers={"x-ms-error-code": "BlobNotFound"})
+        data = blob["data"]
+        headers = {**blob_headers(blob), "x-ms-blob-type": "BlockBlob", "Content-Type": blob["content_type"],
+                   "Accept-Ranges": "bytes"}
+        byte_range = request.headers.get("x-ms-range") or request.headers.get("range")
+        if not byte_range or not data:
+            return Response(data, headers=headers)
+        start, _, end = byte_range.removeprefix("bytes=").partition("-")
+        start = int(start)
+        end = min(int(end) if end else len(data) - 1, len(data) - 1)
+        if start >= len(data):
+            return Response(status_code=416, headers={"Content-Range": f"bytes */{len(data)}"})
+        headers["Content-Range"] = f"bytes {start}-{end}/{len(data)}"
+        return Response(data[start:end + 1], status_code=206, headers=headers)
+
+    return app
+
+
+def _per_endpoint(values: List[str], parse) -> Dict:
+    """Parse repeated "endpoint=value" options; a bare value sets the default for every endpoint"""
+    parsed = {}
+    for value in values:
+        name, sep, spec = value.partition("=")
+        if not sep:
+            name, spec = "default", value
+        if name not in ENDPOINTS and name != "default":
+            raise SystemExit(f"Unknown endpoint {name!r}, expected one of {', '.join(ENDPOINTS)}")
+        parsed[name] = parse(spec)
+    return parsed
+
+
+def main():
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8900)
+    parser.add_argument("--latency", action="append", default=[], help="[endpoint=]distribution, repeatable")
+    parser.add_argument("--error-rate", action="append", default=[], help="[endpoint=]probability, repeatable")
+    parser.add_argument("--error-status", type=int, default=503, help="HTTP status of injected errors")
+    parser.add_argument("--job-seconds", default="const:5", help="batch job duration distribution")
+    parser.add_argument("--job-failure-rate", type=float, default=0.0)
+    parser.add_argument("--transcript", help="text file with the canned transcript")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    try:
+        latency = _per_endpoint(args.latency, Distribution)
+        job_seconds = Distribution(args.job_seconds)
+    except ValueError as e:
+        raise SystemExit(str(e))
+    transcript = DEFAULT_TRANSCRIPT
+    if args.transcript:
+        with open(args.transcript, encoding="utf-8") as f:
+            transcript = " ".join(f.read().split())
+
+    config = FakeConfig(
+        latency=latency,
+        error_rate=_per_endpoint(args.error_rate, float),
+        error_status=args.error_status,
+        job_seconds=job_seconds,
+        job_failure_rate=args.job_failure_rate,
+        transcript=transcript,
+        seed=args.seed,
+    )
+    print(f"🚀 Fake providers on http://{args.host}:{args.port} "
+          f"(latency: {', '.join(f'{k}={v.spec}' for k, v in latency.items()) or 'none'})")
+    uvicorn.run(create_app(config), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
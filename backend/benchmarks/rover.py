@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Benchmark the ROVER merge used by the dual pipeline on synthetic transcripts.
+
+Builds a reference of N words, derives noisy hypotheses from it (substitutions,
+deletions and insertions), then times the banded alignment + vote and compares
+the merged WER against each hypothesis and the old same-index vote.
+
+Usage (from backend/):
+    python -m benchmarks.rover --words 10000 --hypotheses 3 --error-rate 0.1
+"""
+
+import argparse
+import json
+import random
+import time
+
+from rapidfuzz.distance import Levenshtein
+
+from app.utils.rover import DEFAULT_BAND, rover_merge
+
+
+def make_hypothesis(reference, vocab, error_rate, rng):
+    words = []
+    for word in reference:
+        r = rng.random()
+        if r < error_rate / 3:
+            continue
+        if r < 2 * error_rate / 3:
+            words.append(rng.choice(vocab))
+            continue
+        words.append(word)
+        if r < error_rate:
+            words.append(rng.choice(vocab))
+    return words
+
+
+def index_vote(hypotheses):
+    """The previous dual-pipeline merge: compare words at the same index"""
+    words1, words2, whisper_words = hypotheses
+    merged = []
+    for i in range(max(len(h) for h in hypotheses)):
+        w1 = words1[i] if i < len(words1) else ''
+        w2 = words2[i] if i < len(words2) else ''
+        w_whisper = whisper_words[i] if i < len(whisper_words) else ''
+        merged.append(w2 if w1 != w_whisper and w2 == w_whisper else w1)
+    return [w for w in merged if w]
+
+
+def wer(hypothesis, reference):
+    return round(Levenshtein.distance(hypothesis, reference) / len(reference), 4)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--words", type=int, default=10000)
+    parser.add_argument("--hypotheses", type=int, default=3)
+    parser.add_argument("--error-rate", type=float, default=0.1)
+    parser.add_argument("--band", type=int, default=DEFAULT_BAND)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    vocab = [f"w{i}" for i in range(5000)]
+    reference = [rng.choice(vocab) for _ in range(args.words)]
+    hypotheses = [make_hypothesis(reference, vocab, args.error_rate, rng) for _ in range(args.hypotheses)]
+
+    timings = []
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        merged = rover_merge(hypotheses, band=args.band)
+        timings.append(time.perf_counter() - start)
+
+    report = {
+        "words": args.words,
+        "hypotheses": args.hypotheses,
+        "band": args.band,
+        "merge_ms_min": round(min(timings) * 1000, 1),
+        "merge_ms_median": round(sorted(timings)[len(timings) // 2] * 1000, 1),
+        "hypothesis_wer": [wer(h, reference) for h in hypotheses],
+        "rover_wer": wer(merged["words"], reference),
+        "majority_ratio": round(merged["majority_ratio"], 4),
+    }
+    if args.hypotheses == 3:
+        report["index_vote_wer"] = wer(index_vote(hypotheses), reference)
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark the Tamil/Thanglish heuristics: the per-character Python loops
+they used to run vs app.utils.script_analysis (one regex pass, memoized).
+
+Each segment is checked --repeats times, as the merge pipeline re-checks the
+same segments; "uncached" bypasses the memo, "cached" reuses it.
+
+Usage (from backend/):
+    python -m benchmarks.script_analysis --segments 1000 --repeats 5
+"""
+
+import argparse
+import json
+import random
+import time
+
+from app.utils import script_analysis
+
+TAMIL_WORDS = ["வணக்கம்", "நீங்கள்", "எப்படி", "இருக்கிறீர்கள்", "நன்றி", "அம்மா", "சென்னை", "தமிழ்"]
+LATIN_WORDS = ["hello", "meeting", "office", "phone", "ok", "sure", "vanakkam", "epdi", "irukeenga"]
+
+
+def legacy_profile(text):
+    # The checks the heuristics ran before, each a separate pass over the text
+    has_tamil = any('\u0B80' <= char <= '\u0BFF' for char in text)
+    words = text.split()
+    tamil_words = sum(1 for word in words if any(ord(char) in range(0x0B80, 0x0BFF) for char in word))
+    tamil_count = sum('\u0B80' <= c <= '\u0BFF' for c in text)
+    latin_count = sum('a' <= c.lower() <= 'z' for c in text)
+    total_alpha = sum(c.isalpha() for c in text)
+    thanglish = bool(total_alpha) and latin_count / total_alpha > 0.6 and tamil_count / total_alpha < 0.4
+    return has_tamil, tamil_words, thanglish
+
+
+def new_profile(text, analyze=script_analysis.analyze):
+    profile = analyze(text)
+    return profile.has_tamil, profile.tamil_words, profile.is_thanglish
+
+
+def uncached_profile(text):
+    return new_profile(text, script_analysis.analyze.__wrapped__)
+
+
+def make_segments(count, rng):
+    segments = []
+    for _ in range(count):
+        tamil_share = rng.random()
+        words = [rng.choice(TAMIL_WORDS) if rng.random() < tamil_share else rng.choice(LATIN_WORDS)
+                 for _ in range(rng.randint(5, 25))]
+        segments.append(" ".join(words) + rng.choice([".", "?", ""]))
+    return segments
+
+
+def timed(fn, segments, repeats):
+    start = time.perf_counter()
+    results = [fn(text) for _ in range(repeats) for text in segments]
+    return results, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--segments", type=int, default=1000)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    segments = make_segments(args.segments, random.Random(args.seed))
+    legacy, legacy_s = timed(legacy_profile, segments, args.repeats)
+    uncached, uncached_s = timed(uncached_profile, segments, args.repeats)
+    script_analysis.analyze.cache_clear()
+    cached, cached_s = timed(new_profile, segments, args.repeats)
+
+    print(json.dumps({
+        "segments": args.segments,
+        "repeats": args.repeats,
+        "legacy_ms": round(legacy_s * 1000, 2),
+        "single_pass_ms": round(uncached_s * 1000, 2),
+        "single_pass_cached_ms": round(cached_s * 1000, 2),
+        "speedup_uncached": round(legacy_s / uncached_s, 1) if uncached_s else None,
+        "speedup_cached": round(legacy_s / cached_s, 1) if cached_s else None,
+        "same_results": legacy == uncached == cached,
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Benchmark time-overlap lookup of Sarvam segments for each ElevenLabs segment,
+linear scan vs IntervalIndex, on synthetic diarized transcripts.
+
+Usage (from backend/):
+    python -m benchmarks.segment_overlap --segments 3000
+"""
+
+import argparse
+import json
+import random
+import time
+
+from app.utils.interval_index import IntervalIndex, segment_end, segment_start
+
+TOLERANCE = 1.5
+
+
+def make_segments(count, rng, jitter=0.0):
+    segments, t = [], 0.0
+    for _ in range(count):
+        length = rng.uniform(1.0, 4.0)
+        start = max(0.0, t + rng.uniform(-jitter, jitter))
+        segments.append({'start': round(start, 2), 'end': round(start + length, 2), 'text': ''})
+        t += length
+    return segments
+
+
+def linear_scan(queries, segments):
+    """The original _find_overlap_tokens candidate loop"""
+    result = []
+    for seg in queries:
+        seg_start, seg_end = segment_start(seg), segment_end(seg)
+        result.append([
+            i for i, s in enumerate(segments)
+            if abs(seg_start - segment_start(s)) < TOLERANCE or abs(seg_end - segment_end(s)) < TOLERANCE
+        ])
+    return result
+
+
+def indexed(queries, segments):
+    index = IntervalIndex(segments)
+    return [index.near(segment_start(seg), segment_end(seg), TOLERANCE) for seg in queries]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--segments", type=int, nargs="+", default=[300, 1000, 3000])
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    reports = []
+    for count in args.segments:
+        rng = random.Random(args.seed)
+        sarvam = make_segments(count, rng)
+        elevenlabs = make_segments(count, rng, jitter=0.5)
+
+        start = time.perf_counter()
+        expected = linear_scan(elevenlabs, sarvam)
+        linear_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        actual = indexed(elevenlabs, sarvam)
+        indexed_s = time.perf_counter() - start
+
+        reports.append({
+            "segments": count,
+            "linear_ms": round(linear_s * 1000, 2),
+            "indexed_ms": round(indexed_s * 1000, 2),
+            "speedup": round(linear_s / indexed_s, 1) if indexed_s else None,
+            "same_candidates": expected == actual,
+        })
+    print(json.dumps(reports, indent=2))
+
+
+if __name__ == "__main__":
+    main()
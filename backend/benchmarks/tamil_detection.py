@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Benchmark dynamic Tamil detection matching: windowed monotonic matcher vs the
+global SequenceMatcher search, on synthetic time-ordered transcripts.
+
+Sarvam lines are Tamil sentences; ElevenLabs segments are the same sentences
+with light word noise. Global mode is skipped above --global-max segments
+(it is quadratic).
+
+Usage (from backend/):
+    python -m benchmarks.tamil_detection --segments 100 1000 10000
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import random
+import time
+
+from dynamic_tamil_detection import merge_transcripts_with_dynamic_tamil_detection
+
+TAMIL_WORDS = ["வணக்கம்", "நீங்கள்", "எப்படி", "இருக்கிறீர்கள்", "நன்றி", "அம்மா", "அப்பா",
+               "சென்னை", "தமிழ்", "பள்ளி", "வீடு", "நண்பர்", "இன்று", "நாளை", "வேலை"]
+LATIN_WORDS = ["hello", "today", "meeting", "office", "phone", "ok", "sure", "time", "call", "project"]
+
+
+def make_transcripts(count, rng):
+    sarvam_lines, elevenlabs = [], []
+    for i in range(count):
+        words = [rng.choice(TAMIL_WORDS + LATIN_WORDS) for _ in range(rng.randint(4, 12))]
+        sarvam_lines.append(" ".join(words))
+        noisy = [w if rng.random() > 0.15 else rng.choice(LATIN_WORDS) for w in words]
+        elevenlabs.append({"speaker": f"speaker_{i % 2}", "start_time": i * 3.0, "end_time": i * 3.0 + 2.5,
+                           "text": " ".join(noisy), "confidence": 0.9})
+    return elevenlabs, "\n".join(sarvam_lines)
+
+
+def run(elevenlabs, sarvam_text, mode):
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        merged = merge_transcripts_with_dynamic_tamil_detection(elevenlabs, sarvam_text, mode)
+    return merged, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--segments", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--global-max", type=int, default=300)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    reports = []
+    for count in args.segments:
+        elevenlabs, sarvam_text = make_transcripts(count, random.Random(args.seed))
+        windowed, windowed_s = run(elevenlabs, sarvam_text, "windowed")
+        report = {
+            "segments": count,
+            "windowed_ms": round(windowed_s * 1000, 1),
+            "windowed_replaced": sum(1 for seg in windowed if seg["similarity_score"] > 0),
+        }
+        if count <= args.global_max:
+            exhaustive, global_s = run(elevenlabs, sarvam_text, "global")
+            report["global_ms"] = round(global_s * 1000, 1)
+            report["global_replaced"] = sum(1 for seg in exhaustive if seg["similarity_score"] > 0)
+            report["speedup"] = round(global_s / windowed_s, 1) if windowed_s else None
+            report["same_text"] = sum(a["text"] == b["text"] for a, b in zip(windowed, exhaustive)) / count
+        reports.append(report)
+    print(json.dumps(reports, indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
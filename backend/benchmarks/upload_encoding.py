@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Benchmark upload encodings against the 16 kHz PCM WAV we used to upload.
+
+Reports bytes and estimated transfer time saved per format, and optionally
+checks that provider transcripts are unaffected.
+
+Usage (from backend/):
+    python -m benchmarks.upload_encoding audio1.mp3 audio2.wav --uplink-mbps 10
+    python -m benchmarks.upload_encoding audio.mp3 --check-transcripts --provider sarvam
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import tempfile
+import time
+
+from rapidfuzz import fuzz
+
+from app.core.config import settings
+from app.utils.upload_encoding import (
+    PROVIDER_UPLOAD_FORMATS,
+    encode_audio,
+)
+
+
+def prepare_wav(input_path: str) -> str:
+    """Same conversion as EnhancedTranscriptionService._prepare_audio"""
+    base_name = os.path.splitext(os.path.basename(input_path))[0]
+    wav_path = os.path.join(tempfile.gettempdir(), f"bench_{base_name}.wav")
+    subprocess.run(
+        ["ffmpeg", "-i", input_path, "-ar", "16000", "-ac", "1", "-f", "wav", "-y", wav_path],
+        capture_output=True, check=True
+    )
+    return wav_path
+
+
+def transfer_seconds(num_bytes: int, uplink_mbps: float) -> float:
+    return num_bytes * 8 / (uplink_mbps * 1_000_000)
+
+
+async def transcribe_text(provider: str, wav_path: str, fmt: str) -> str:
+    """Transcribe through the real service with the upload format forced to fmt"""
+    if provider == "elevenlabs":
+        from app.services.elevenlabs_service import elevenlabs_service
+        settings.ELEVENLABS_UPLOAD_FORMAT = fmt
+        segments = await elevenlabs_service.transcribe_with_speaker_diarization(wav_path)
+        return " ".join(seg.get("text", "") for seg in segments)
+    from app.services.sarvam_service import sarvam_service
+    settings.SARVAM_UPLOAD_FORMAT = fmt
+    result = await sarvam_service.transcribe_audio(wav_path)
+    return result.transcription
+
+
+def benchmark_file(path: str, formats, bitrate: str, uplink_mbps: float,
+                   check_transcripts: bool, provider: str) -> dict:
+    wav_path = prepare_wav(path)
+    wav_bytes = os.path.getsize(wav_path)
+    wav_transfer = transfer_seconds(wav_bytes, uplink_mbps)
+    report = {
+        "file": path,
+        "wav_bytes": wav_bytes,
+        "wav_transfer_s": round(wav_transfer, 3),
+        "formats": {}
+    }
+
+    baseline_text = None
+    if check_transcripts:
+        baseline_text = asyncio.run(transcribe_text(provider, wav_path, "wav"))
+
+    for fmt in formats:
+        start = time.perf_counter()
+        encoded_path = encode_audio(wav_path, fmt, bitrate)
+        encode_s = time.perf_counter() - start
+        encoded_bytes = os.path.getsize(encoded_path)
+        encoded_transfer = transfer_seconds(encoded_bytes, uplink_mbps)
+        entry = {
+            "bytes": encoded_bytes,
+            "ratio": round(encoded_bytes / wav_bytes, 3) if wav_bytes else None,
+            "bytes_saved": wav_bytes - encoded_bytes,
+            "encode_s": round(encode_s, 3),
+            "transfer_s": round(encoded_transfer, 3),
+            # Net saving per upload; the encode is paid once and shared by every provider/retry
+            "net_saved_s": round(wav_transfer - encoded_transfer - encode_s, 3),
+        }
+        if check_transcripts:
+            if fmt not in PROVIDER_UPLOAD_FORMATS[provider]:
+                entry["transcript_check"] = f"skipped ({provider} does not accept {fmt})"
+            else:
+                text = asyncio.run(transcribe_text(provider, wav_path, fmt))
+                similarity = fuzz.ratio(baseline_text.split(), text.split()) / 100.0
+                entry["transcript_word_similarity"] = round(similarity, 4)
+                entry["transcript_identical"] = text.strip() == baseline_text.strip()
+        report["formats"][fmt] = entry
+        os.remove(encoded_path)
+
+    os.remove(wav_path)
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("files", nargs="+", help="Audio/video files to benchmark")
+    parser.add_argument("--formats", default="flac,opus,mp3", help="Comma separated upload formats")
+    parser.add_argument("--bitrate", default=settings.UPLOAD_AUDIO_BITRATE, help="Bitrate for lossy formats")
+    parser.add_argument("--uplink-mbps", type=float, default=10.0, help="Uplink bandwidth used for transfer estimates")
+    parser.add_argument("--check-transcripts", action="store_true",
+                        help="Transcribe WAV and each format with a live provider and compare")
+    parser.add_argument("--provider", choices=["sarvam", "elevenlabs"], default="sarvam")
+    args = parser.parse_args()
+
+    formats = [f.strip() for f in args.formats.split(",") if f.strip()]
+    reports = [
+        benchmark_file(path, formats, args.bitrate, args.uplink_mbps, args.check_transcripts, args.provider)
+        for path in args.files
+    ]
+
+    for report in reports:
+        print(f"\n📁 {report['file']}: wav {report['wav_bytes']} bytes, {report['wav_transfer_s']}s @ {args.uplink_mbps} Mbps")
+        for fmt, entry in report["formats"].items():
+            line = (f"   {fmt:>5}: {entry['bytes']:>10} bytes ({entry['ratio']:.0%}), "
+                    f"encode {entry['encode_s']}s, transfer {entry['transfer_s']}s, net saved {entry['net_saved_s']}s")
+            if "transcript_word_similarity" in entry:
+                line += f", transcript similarity {entry['transcript_word_similarity']}"
+            print(line)
+
+    print(json.dumps(reports, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,30 @@
 import json
 import re
 from difflib import SequenceMatcher
-from typing import List, Dict, Tuple
+from typing import List, Dict, Optional, Sequence, Tuple, Union
+
+from rapidfuzz import fuzz, process
+
+from app.utils.interval_index import IntervalIndex, segment_start, segment_end
+from app.utils import script_analysis
+from app.core.logging import Truncated, configure_logging, get_logger
+
+logger = get_logger(__name__)
+
+# Seconds of slack around an ElevenLabs segment when looking up timed Sarvam segments
+MATCH_TIME_TOLERANCE = 1.5
+
+# Minimum similarity (0-1) for a Sarvam line to replace an ElevenLabs segment
+MATCH_THRESHOLD = 0.6
+
+# Sarvam lines searched around the last match in windowed mode
+WINDOW_BEHIND = 2
+WINDOW_AHEAD = 8
 
 
 def contains_tamil(text: str) -> bool:
     """Check if text contains Tamil characters using Unicode range"""
-    # Unicode range for Tamil: U+0B80 to U+0BFF
-    return any('\u0B80' <= char <= '\u0BFF' for char in text)
+    return script_analysis.contains_tamil(text)
 
 
 def clean_text(text: str) -> str:
@@ -29,42 +46,126 @@ def best_sarvam_match(eleven_line: str, sarvam_lines: List[str]) -> Tuple[str, f
     return best_line, best_score
 
 
+class MonotonicMatcher:
+    """
+    Match ElevenLabs segments to Sarvam lines assuming both are in time order.
+
+    Sarvam lines are cleaned once up front; each lookup only scores a window of
+    lines around the previous match, with rapidfuzz's ratio (0-1 scale, like
+    SequenceMatcher.ratio). A match moves the window forward.
+    """
+
+    def __init__(self, sarvam_lines: List[str], behind: int = WINDOW_BEHIND, ahead: int = WINDOW_AHEAD,
+                 threshold: float = MATCH_THRESHOLD):
+        self.lines = sarvam_lines
+        self.cleaned = [clean_text(line) for line in sarvam_lines]
+        self.behind = behind
+        self.ahead = ahead
+        self.threshold = threshold
+        self.cursor = 0
+
+    def _window(self, center: int) -> range:
+        return range(max(0, center - self.behind), min(len(self.lines), center + self.ahead + 1))
+
+    def _best(self, query: str, candidates: Sequence[int]) -> Optional[int]:
+        if not candidates:
+            return None
+        result = process.extractOne(
+            query,
+            [self.cleaned[i] for i in candidates],
+            scorer=fuzz.ratio,
+            processor=None,
+            score_cutoff=self.threshold * 100
+        )
+        if result is None:
+            return None
+        _, score, position = result
+        self.cursor = candidates[position]
+        return score
+
+    def match(self, eleven_line: str, candidates: Optional[Sequence[int]] = None,
+              expected: Optional[int] = None) -> Tuple[str, float]:
+        """
+        Best Sarvam line above the threshold, searched in the window around the
+        last match (or among `candidates`, e.g. time-overlapping lines). On a miss,
+        the window around `expected` (a proportional position estimate) is tried
+        so the matcher re-syncs after a run of unmatched segments.
+        Returns ("", 0.0) when nothing qualifies.
+        """
+        query = clean_text(eleven_line)
+        if candidates is not None:
+            score = self._best(query, candidates)
+        else:
+            score = self._best(query, self._window(self.cursor))
+            if score is None and expected is not None and abs(expected - self.cursor) > self.ahead:
+                score = self._best(query, self._window(expected))
+        if score is None:
+            return "", 0.0
+        return self.lines[self.cursor], score / 100.0
+
+
 def merge_transcripts_with_dynamic_tamil_detection(
     elevenlabs_transcript: List[Dict],
-    sarvam_transcript: str
+    sarvam_transcript: Union[str, List[Dict]],
+    mode: str = "windowed"
 ) -> List[Dict]:
     """
     Merge transcripts using ElevenLabs as base and Sarvam for Tamil accuracy.
     
     Args:
         elevenlabs_transcript: List of segments from ElevenLabs with speaker diarization
-        sarvam_transcript: Raw text transcript from Sarvam API
+        sarvam_transcript: Raw text transcript from Sarvam API, or diarized Sarvam
+            segments with start/end times (only time-overlapping lines are compared)
+        mode: "windowed" (default) searches a sliding window of Sarvam lines around
+            the last match; "global" compares every line with SequenceMatcher
     
     Returns:
         List of merged transcript segments
     """
-    # Split Sarvam text into lines
-    sarvam_lines = [line.strip() for line in sarvam_transcript.split('\n') if line.strip()]
+    if mode not in ("windowed", "global"):
+        raise ValueError(f"Unknown match mode: {mode}")
+
+    sarvam_index = None
+    if isinstance(sarvam_transcript, list):
+        sarvam_segments = [seg for seg in sarvam_transcript if seg.get('text', '').strip()]
+        sarvam_lines = [seg['text'].strip() for seg in sarvam_segments]
+        sarvam_index = IntervalIndex(sarvam_segments)
+    else:
+        # Split Sarvam text into lines
+        sarvam_lines = [line.strip() for line in sarvam_transcript.split('\n') if line.strip()]
     
-    print(f"📊 ElevenLabs segments: {len(elevenlabs_transcript)}")
-    print(f"📊 Sarvam lines: {len(sarvam_lines)}")
+    logger.info("📊 ElevenLabs segments: %s", len(elevenlabs_transcript))
+    logger.info("📊 Sarvam lines: %s", len(sarvam_lines))
     
+    matcher = MonotonicMatcher(sarvam_lines) if mode == "windowed" else None
     merged_output = []
     
     # Use ElevenLabs transcript as base
-    for segment in elevenlabs_transcript:
+    line_ratio = len(sarvam_lines) / max(len(elevenlabs_transcript), 1)
+    for position, segment in enumerate(elevenlabs_transcript):
         original_text = segment.get("text", "").strip()
         
         if not original_text:
             continue
         
         # Find best Sarvam match for this ElevenLabs segment
-        best_sarvam_line, score = best_sarvam_match(original_text, sarvam_lines)
+        candidates = None
+        if sarvam_index is not None:
+            candidates = sarvam_index.overlapping(
+                segment_start(segment) - MATCH_TIME_TOLERANCE,
+                segment_end(segment) + MATCH_TIME_TOLERANCE
+            )
+        if matcher is not None:
+            best_sarvam_line, score = matcher.match(original_text, candidates, int(position * line_ratio))
+        elif candidates is not None:
+            best_sarvam_line, score = best_sarvam_match(original_text, [sarvam_lines[i] for i in candidates])
+        else:
+            best_sarvam_line, score = best_sarvam_match(original_text, sarvam_lines)
         
         # Apply dynamic Tamil phrase detection
-        if score > 0.6 and contains_tamil(best_sarvam_line):
+        if score > MATCH_THRESHOLD and contains_tamil(best_sarvam_line):
             final_text = best_sarvam_line.strip()
-            print(f"🔄 Replaced: '{original_text[:50]}...' -> '{final_text[:50]}...' (score: {score:.2f})")
+            logger.debug("🔄 Replaced: '%s' -> '%s' (score: %.2f)", Truncated(original_text, 50), Truncated(final_text, 50), score)
         else:
             final_text = original_text.strip()
         
@@ -74,20 +175,22 @@ def merge_transcripts_with_dynamic_tamil_detection(
             "end_time": segment.get("end_time", 0.0),
             "text": final_text,
             "confidence": segment.get("confidence", 0.0),
-            "similarity_score": score if score > 0.6 and contains_tamil(best_sarvam_line) else 0.0
+            "similarity_score": score if score > MATCH_THRESHOLD and contains_tamil(best_sarvam_line) else 0.0
         })
     
-    print(f"✅ Transcript merged: {len(merged_output)} segments")
+    logger.info("✅ Transcript merged: %s segments", len(merged_output))
     return merged_output
 
 
-def process_transcript_data(data_file: str, output_file: str = "optimized_transcript.json"):
+def process_transcript_data(data_file: str, output_file: str = "optimized_transcript.json",
+                            mode: str = "windowed"):
     """
     Process transcript data from JSON file and apply dynamic Tamil detection.
     
     Args:
         data_file: Path to JSON file containing transcript data
         output_file: Path to save the optimized transcript
+        mode: Sarvam line matching mode, "windowed" or "global"
     """
     try:
         # Load data
@@ -98,33 +201,33 @@ def process_transcript_data(data_file: str, output_file: str = "optimized_transc
         sarvam_transcript = data.get("sarvam_transcript", "")
         
         if not elevenlabs_transcript:
-            print("❌ No ElevenLabs transcript found in data")
+            logger.error("❌ No ElevenLabs transcript found in data")
             return
         
         if not sarvam_transcript:
-            print("❌ No Sarvam transcript found in data")
+            logger.error("❌ No Sarvam transcript found in data")
             return
         
         # Merge transcripts
         merged_output = merge_transcripts_with_dynamic_tamil_detection(
-            elevenlabs_transcript, sarvam_transcript
+            elevenlabs_transcript, sarvam_transcript, mode
         )
         
         # Save output
         with open(output_file, "w", encoding="utf-8") as f:
             json.dump(merged_output, f, indent=2, ensure_ascii=False)
         
-        print(f"✅ Optimized transcript saved to: {output_file}")
+        logger.info("✅ Optimized transcript saved to: %s", output_file)
         
         # Print statistics
         tamil_segments = sum(1 for seg in merged_output if seg.get("similarity_score", 0) > 0)
-        print(f"📊 Statistics:")
-        print(f"   - Total segments: {len(merged_output)}")
-        print(f"   - Tamil-enhanced segments: {tamil_segments}")
-        print(f"   - Enhancement rate: {(tamil_segments/len(merged_output)*100):.1f}%")
+        logger.info("📊 Statistics:")
+        logger.info("   - Total segments: %s", len(merged_output))
+        logger.info("   - Tamil-enhanced segments: %s", tamil_segments)
+        logger.info("   - Enhancement rate: %.1f%%", tamil_segments / len(merged_output) * 100)
         
     except Exception as e:
-        print(f"❌ Error processing transcript data: {e}")
+        logger.error("❌ Error processing transcript data: %s", e)
 
 
 def create_sample_data():
@@ -163,20 +266,25 @@ def create_sample_data():
     with open("sample_transcript_data.json", "w", encoding="utf-8") as f:
         json.dump(sample_data, f, indent=2, ensure_ascii=False)
     
-    print("✅ Sample data created: sample_transcript_data.json")
+    logger.info("✅ Sample data created: sample_transcript_data.json")
 
 
 if __name__ == "__main__":
     import sys
     
-    if len(sys.argv) > 1:
+    configure_logging(log_format="text")
+    # --global restores the exhaustive SequenceMatcher search
+    mode = "global" if "--global" in sys.argv else "windowed"
+    args = [arg for arg in sys.argv[1:] if arg != "--global"]
+    
+    if args:
         # Process specific file
-        data_file = sys.argv[1]
-        output_file = sys.argv[2] if len(sys.argv) > 2 else "optimized_transcript.json"
-        process_transcript_data(data_file, output_file)
+        data_file = args[0]
+        output_file = args[1] if len(args) > 1 else "optimized_transcript.json"
+        process_transcript_data(data_file, output_file, mode)
     else:
         # Create sample data and process it
-        print("🔧 Creating sample data for testing...")
+        logger.info("🔧 Creating sample data for testing...")
         create_sample_data()
-        print("🔧 Processing sample data...")
-        process_transcript_data("sample_transcript_data.json") 
\ No newline at end of file
+        logger.info("🔧 Processing sample data...")
+        process_transcript_data("sample_transcript_data.json", mode=mode) 
\ No newline at end of file
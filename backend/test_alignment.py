@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Tests for chunked transcript alignment (app/utils/alignment.py)
+"""
+
+import random
+import sys
+import os
+
+# Add the app directory to the Python path
+sys.path.append(os.path.dirname(__file__))
+
+from app.utils.alignment import align, iter_aligned_opcodes
+
+
+def _words(count, seed):
+    rng = random.Random(seed)
+    return [f"w{rng.randrange(5000)}" for _ in range(count)]
+
+
+def _totals(reference, hypothesis, chunk_size):
+    """Edits and matched tokens of the chunked alignment, checking that the opcodes tile both inputs"""
+    edits = hits = 0
+    i = j = 0
+    for tag, i1, i2, j1, j2 in iter_aligned_opcodes(reference, hypothesis, chunk_size=chunk_size):
+        assert (i1, j1) == (i, j)
+        if tag == "equal":
+            assert reference[i1:i2] == hypothesis[j1:j2]
+            hits += i2 - i1
+        else:
+            edits += max(i2 - i1, j2 - j1)
+        i, j = i2, j2
+    assert (i, j) == (len(reference), len(hypothesis))
+    return edits, hits
+
+
+def test_insertion_longer_than_window():
+    """A one-sided insertion spanning several windows is skipped and the alignment resyncs"""
+    reference = _words(8000, 1)
+    hypothesis = reference[:3000] + _words(6000, 2) + reference[3000:]
+    for chunk_size in (2000, 200, 5):
+        assert _totals(reference, hypothesis, chunk_size) == (6000, 8000)
+
+
+def test_deletion_longer_than_window():
+    """A one-sided deletion spanning several windows is skipped and the alignment resyncs"""
+    reference = _words(14000, 3)
+    hypothesis = reference[:3000] + reference[9000:]
+    for chunk_size in (2000, 200, 5):
+        assert _totals(reference, hypothesis, chunk_size) == (6000, 8000)
+
+
+def test_matches_full_alignment_on_small_edits():
+    """Scattered substitutions are aligned as well as by a single full alignment"""
+    rng = random.Random(4)
+    reference = _words(5000, 5)
+    hypothesis = [word if rng.random() > 0.05 else f"x{rng.randrange(100)}" for word in reference]
+    full = align(reference, hypothesis)
+    assert _totals(reference, hypothesis, 500) == (full.errors, full.hits)
+
+
+def test_diff_summary_matches_align():
+    """The word diff summary splits edits into S/D/I exactly like align()"""
+    from app.services.accuracy_assessment_service import accuracy_assessment_service
+
+    rng = random.Random(6)
+    for _ in range(50):
+        reference = _words(rng.randint(0, 150), rng.random())
+        hypothesis = []
+        for word in reference:
+            roll = rng.random()
+            if roll < 0.1:
+                continue
+            hypothesis.append(f"s{rng.randrange(50)}" if roll < 0.25 else word)
+            if rng.random() < 0.1:
+                hypothesis.extend(f"i{rng.randrange(50)}" for _ in range(rng.randint(1, 3)))
+        summary = list(accuracy_assessment_service.iter_word_differences(
+            " ".join(reference), " ".join(hypothesis)
+        ))[-1]
+        full = align(reference, hypothesis)
+        assert (summary["matching_words"], summary["substitutions"], summary["deletions"], summary["insertions"]) \
+            == (full.hits, full.substitutions, full.deletions, full.insertions)
+
+
+def test_diff_summary_splits_unequal_replacements():
+    """A replace opcode with unequal sides counts min() substitutions plus deletions/insertions"""
+    import app.services.accuracy_assessment_service as service_module
+
+    def opcodes(reference, hypothesis, chunk_size=2000):
+        yield "replace", 0, 3, 0, 1
+        yield "replace", 3, 4, 1, 3
+
+    original = service_module.iter_aligned_opcodes
+    service_module.iter_aligned_opcodes = opcodes
+    try:
+        summary = list(service_module.accuracy_assessment_service.iter_word_differences("a b c d", "x y z"))[-1]
+    finally:
+        service_module.iter_aligned_opcodes = original
+    assert (summary["substitutions"], summary["deletions"], summary["insertions"]) == (2, 2, 1)
+
+
+def test_empty_inputs():
+    assert _totals([], [], 200) == (0, 0)
+    assert _totals(["a", "b"], [], 200) == (2, 0)
+    assert _totals([], ["a", "b"], 200) == (2, 0)
+
+
+if __name__ == "__main__":
+    print("🚀 Starting alignment tests...")
+    
+    test_insertion_longer_than_window()
+    test_deletion_longer_than_window()
+    test_matches_full_alignment_on_small_edits()
+    test_diff_summary_matches_align()
+    test_diff_summary_splits_unequal_replacements()
+    test_empty_inputs()
+    
+    print("\n✅ All tests completed!")
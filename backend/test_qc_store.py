@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Tests for the SQLite QC case store (app/services/qc_store.py)
+"""
+
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+from collections import Counter
+from datetime import datetime, timezone
+
+# Add the app directory to the Python path
+sys.path.append(os.path.dirname(__file__))
+
+from app.services.qc_store import QCStore, decode_cursor, encode_cursor, normalize_timestamp
+
+STATUSES = ["pending", "audio_validated", "completed"]
+
+
+def _case(index, rng):
+    return {
+        "qc_case_id": f"qc_{index:05d}",
+        # Few distinct timestamps, so pages often end inside a run of equal timestamps
+        "timestamp": f"2025-01-{1 + rng.randrange(5):02d}T{rng.randrange(3):02d}:00:00",
+        "status": rng.choice(STATUSES),
+        "dual_pipeline_result": {
+            "comparison": {"similarity_score": round(rng.random(), 3), "reason": "mismatch"},
+            "pipeline1": {"transcript": "word " * 200},
+        },
+    }
+
+
+def _seeded_store(directory, count=600, seed=7):
+    rng = random.Random(seed)
+    store = QCStore(os.path.join(directory, "qc.sqlite3"))
+    cases = [_case(index, rng) for index in range(count)]
+    for case in cases:
+        store.add(case)
+    return store, {case["qc_case_id"]: case for case in cases}, rng
+
+
+def _all_pages(store, statuses, limit, **filters):
+    summaries, after = [], None
+    while True:
+        page, next_key = store.page(statuses, limit, after=after, **filters)
+        assert len(page) <= limit
+        summaries.extend(page)
+        if next_key is None:
+            return summaries
+        assert page and next_key == (page[-1]["timestamp"], page[-1]["qc_case_id"])
+        after = decode_cursor(encode_cursor(next_key))
+
+
+def _expected(cases, statuses, since=None, until=None, min_similarity=None, max_similarity=None):
+    selected = []
+    for case in cases.values():
+        similarity = case["dual_pipeline_result"]["comparison"]["similarity_score"]
+        if case["status"] not in statuses \
+                or (since is not None and case["timestamp"] < since) \
+                or (until is not None and case["timestamp"] >= until) \
+                or (min_similarity is not None and similarity < min_similarity) \
+                or (max_similarity is not None and similarity > max_similarity):
+            continue
+        selected.append((case["timestamp"], case["qc_case_id"]))
+    return sorted(selected)
+
+
+def test_pages_match_brute_force():
+    """Pages across statuses and filters concatenate to the full, ordered, duplicate-free result"""
+    with tempfile.TemporaryDirectory() as directory:
+        store, cases, rng = _seeded_store(directory)
+        for _ in range(40):
+            statuses = rng.sample(STATUSES, rng.randint(1, 3))
+            filters = {}
+            if rng.random() < 0.5:
+                filters["since"] = f"2025-01-{1 + rng.randrange(3):02d}"
+            if rng.random() < 0.5:
+                filters["until"] = f"2025-01-{3 + rng.randrange(3):02d}T01:00:00"
+            if rng.random() < 0.5:
+                filters["min_similarity"] = rng.random() / 2
+            if rng.random() < 0.5:
+                filters["max_similarity"] = 0.5 + rng.random() / 2
+            limit = rng.choice([1, 7, 50, 1000])
+            pages = _all_pages(store, statuses, limit, **filters)
+            assert [(s["timestamp"], s["qc_case_id"]) for s in pages] == _expected(cases, statuses, **filters)
+
+
+def test_summaries_leave_out_transcripts():
+    with tempfile.TemporaryDirectory() as directory:
+        store, cases, _ = _seeded_store(directory, count=5)
+        page, _ = store.page(STATUSES, 10)
+        for summary in page:
+            assert "dual_pipeline_result" not in summary
+            case = cases[summary["qc_case_id"]]
+            assert summary["similarity_score"] == case["dual_pipeline_result"]["comparison"]["similarity_score"]
+            assert store.get(summary["qc_case_id"]) == case
+
+
+def test_status_counts_follow_updates():
+    """Trigger-maintained counters equal a recount after inserts and status changes"""
+    with tempfile.TemporaryDirectory() as directory:
+        store, cases, rng = _seeded_store(directory)
+        for qc_case_id in rng.sample(sorted(cases), 200):
+            status = rng.choice(STATUSES)
+            updated = store.update(qc_case_id, {"status": status, "qc_notes": "checked"})
+            assert updated["status"] == status and updated["qc_notes"] == "checked"
+            cases[qc_case_id] = updated
+        assert store.update("qc_missing", {"status": "completed"}) is None
+        assert store.status_counts() == dict(Counter(case["status"] for case in cases.values()))
+        # The queue page reflects the updated status as well
+        pending = _all_pages(store, ["pending"], 25)
+        assert len(pending) == store.status_counts().get("pending", 0)
+
+
+def test_add_rejects_duplicate_ids():
+    with tempfile.TemporaryDirectory() as directory:
+        store, cases, _ = _seeded_store(directory, count=3)
+        try:
+            store.add(dict(cases["qc_00000"], status="completed"))
+        except sqlite3.IntegrityError:
+            pass
+        else:
+            raise AssertionError("duplicate qc_case_id was accepted")
+        assert store.get("qc_00000") == cases["qc_00000"]
+        assert sum(store.status_counts().values()) == 3
+
+
+def test_normalize_timestamp():
+    """Filter bounds are converted to the stored naive local format, including a trailing Z"""
+    utc_midnight = datetime(2024, 1, 1, tzinfo=timezone.utc).astimezone().replace(tzinfo=None).isoformat()
+    assert normalize_timestamp("2024-01-01T00:00:00Z", "since") == utc_midnight
+    assert normalize_timestamp("2024-01-01T00:00:00z", "since") == utc_midnight
+    assert normalize_timestamp("2024-01-01T05:30:00+05:30", "since") == utc_midnight
+    assert normalize_timestamp("2024-01-01", "since") == "2024-01-01T00:00:00"
+    assert normalize_timestamp(None, "since") is None
+    for value in ["garbage", "", "Z"]:
+        try:
+            normalize_timestamp(value, "until")
+        except ValueError:
+            continue
+        raise AssertionError(f"{value!r} was accepted")
+
+
+def test_malformed_cursor():
+    for cursor in ["zzz", encode_cursor(("2025-01-01", "qc_1"))[:-4], "W10="]:
+        try:
+            decode_cursor(cursor)
+        except ValueError:
+            continue
+        raise AssertionError(f"cursor {cursor!r} was accepted")
+
+
+if __name__ == "__main__":
+    print("🚀 Starting QC store tests...")
+    
+    test_pages_match_brute_force()
+    test_summaries_leave_out_transcripts()
+    test_status_counts_follow_updates()
+    test_add_rejects_duplicate_ids()
+    test_normalize_timestamp()
+    test_malformed_cursor()
+    
+    print("\n✅ All tests completed!")
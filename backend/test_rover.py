@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Tests for ROVER alignment and voting (app/utils/rover.py)
+"""
+
+import os
+import sys
+
+# Add the app directory to the Python path
+sys.path.append(os.path.dirname(__file__))
+
+from app.utils.rover import align_hypotheses, rover_merge
+
+
+def test_agreeing_insertions_share_a_slot():
+    """Words two hypotheses insert in the same backbone gap are aligned with each other"""
+    backbone = ["a", "b"]
+    pipeline2 = ["a", "x", "y", "b"]
+    whisper = ["a", "y", "b"]
+    lattice = align_hypotheses([backbone, pipeline2, whisper])
+    assert lattice == [
+        ["a", "a", "a"],
+        [None, "x", None],
+        [None, "y", "y"],
+        ["b", "b", "b"],
+    ]
+    # The agreed insertion wins its slot, the lone one is outvoted
+    assert rover_merge([backbone, pipeline2, whisper])["words"] == ["a", "y", "b"]
+
+
+def test_insertions_at_the_edges():
+    backbone = ["m"]
+    lattice = align_hypotheses([backbone, ["p", "q", "m", "z"], ["q", "m", "z"]])
+    assert lattice == [
+        [None, "p", None],
+        [None, "q", "q"],
+        ["m", "m", "m"],
+        [None, "z", "z"],
+    ]
+
+
+def test_identical_hypotheses():
+    words = "one two three four".split()
+    result = rover_merge([words, list(words), list(words)])
+    assert result["words"] == words
+    assert result["majority_ratio"] == 1.0
+
+
+if __name__ == "__main__":
+    print("🚀 Starting ROVER tests...")
+    
+    test_agreeing_insertions_share_a_slot()
+    test_insertions_at_the_edges()
+    test_identical_hypotheses()
+    
+    print("\n✅ All tests completed!")